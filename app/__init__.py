@@ -1,7 +1,76 @@
+import os
+import sqlite3
 from flask import Flask
+from app.db import ConnectionPool, DB_PATH
+from app.page_cache import PageCache
+from app.facets import FacetIndex
+from app.suggest import SuggestIndex
+from app.assets import AssetManifest
+from app.image_store import ImageStore
+from app.result_cache import ResultCache
+from app.metrics import Metrics, SlowRequestProfiler, TimedConnection
 
 # Initialise Flask app
 app = Flask(__name__)
 
-# Import app routes from routes.py
-from app import routes
\ No newline at end of file
+# Request, SQL and template timings: a Server-Timing header on every response and histograms at /metrics
+# Set METRICS=0 to turn instrumentation off, and PROFILE_SLOW_MS to write sampled stacks of slower requests
+# to PROFILE_DIR (collapsed-stack files for flamegraph.pl or speedscope)
+metrics_enabled = os.environ.get("METRICS", "1") == "1"
+profiler = None
+if metrics_enabled and os.environ.get("PROFILE_SLOW_MS"):
+    profiler = SlowRequestProfiler(
+        os.environ.get("PROFILE_DIR", os.path.join("data", "profiles")),
+        threshold_ms=float(os.environ["PROFILE_SLOW_MS"])
+    )
+metrics = Metrics(profiler=profiler)
+if metrics_enabled:
+    metrics.init_app(app)
+
+# Shared pool of read-only database connections, one per serving thread
+# build_schema.py swaps in a new file rather than writing in place, so connections can be immutable
+# Set DB_IMMUTABLE=0 if steam.sqlite is ever modified in place while the app runs
+db_pool = ConnectionPool(
+    DB_PATH,
+    immutable=os.environ.get("DB_IMMUTABLE", "1") == "1",
+    factory=TimedConnection if metrics_enabled else sqlite3.Connection
+)
+db_pool.warm()
+
+# Rendered /details pages, keyed by appid and invalidated whenever the database file is replaced
+# Set DETAIL_CACHE_DIR to also keep pre-rendered pages on disk
+detail_cache = PageCache(
+    max_entries=int(os.environ.get("DETAIL_CACHE_SIZE", "2048")),
+    disk_dir=os.environ.get("DETAIL_CACHE_DIR")
+)
+
+# Search results and facet counts, keyed by the canonical query and shared by every worker through a local SQLite file
+# Entries expire after SEARCH_CACHE_TTL seconds or as soon as the database is rebuilt
+search_cache = ResultCache(
+    os.environ.get("SEARCH_CACHE_PATH", os.path.join("data", "search_cache.sqlite")),
+    ttl=float(os.environ.get("SEARCH_CACHE_TTL", "600")),
+    max_entries=int(os.environ.get("SEARCH_CACHE_SIZE", "5000"))
+)
+
+# Precomputed facet bitsets for search-result facet counts, built by scripts/build_schema.py
+facet_index = FacetIndex()
+facet_index.refresh()
+
+# In-memory type-ahead index over game names, rebuilt when the database file is replaced
+suggest_index = SuggestIndex()
+suggest_index.refresh(db_pool)
+
+# Local copies of game header images and card thumbnails, filled by `flask ingest-images`
+image_store = ImageStore(
+    os.environ.get("IMAGE_CACHE_DIR", os.path.join("data", "image_cache")),
+    max_bytes=int(os.environ.get("IMAGE_CACHE_MAX_MB", "512")) * 1024 * 1024
+)
+
+# Hashed, minified static files built by scripts/build_assets.py
+# Templates use asset_url() in place of url_for() and asset_srcset() for responsive images
+asset_manifest = AssetManifest()
+asset_manifest.refresh()
+app.jinja_env.globals.update(asset_url=asset_manifest.url_for, asset_srcset=asset_manifest.srcset)
+
+# Import app routes from routes.py, the chart data endpoints from charts.py and the image routes from images.py
+from app import routes, charts, images
@@ -0,0 +1,76 @@
+import os
+import json
+import threading
+from flask import url_for
+
+DIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "dist")
+
+class AssetManifest:
+    """
+    Maps static file names to the hashed, minified and re-encoded copies built by scripts/build_assets.py.
+    Falls back to the plain static files when the build has not been run.
+    Reloaded automatically when a rebuild writes a new manifest.
+    """
+    def __init__(self, directory=DIST_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._manifest_mtime = None
+        self.files = {}
+        self.images = {}
+
+    def _manifest_path(self):
+        return os.path.join(self.directory, "manifest.json")
+
+    def refresh(self):
+        """
+        Load the manifest if it exists and has changed since it was last loaded.
+
+        Returns:
+        bool: True if built assets are available.
+        """
+        try:
+            mtime = os.stat(self._manifest_path()).st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+        if mtime == self._manifest_mtime:
+            return True
+
+        with self._lock:
+            if mtime != self._manifest_mtime:
+                with open(self._manifest_path()) as f:
+                    manifest = json.load(f)
+                self.files = manifest["files"]
+                self.images = manifest["images"]
+                self._manifest_mtime = mtime
+        return True
+
+    def url_for(self, endpoint, **values):
+        """
+        Drop-in for flask.url_for: url_for('static', filename=...) points at the hashed copy when one exists,
+        which is served with a long-lived immutable Cache-Control header.
+        """
+        if endpoint == "static" and self.refresh():
+            filename = values.get("filename")
+            if filename in self.files:
+                values["filename"] = self.files[filename]
+                return url_for("built_asset", **values)
+            if filename in self.images:
+                # Best-compressed fallback PNG for plain <img src>
+                variants = [v for v in self.images[filename]["variants"] if v["format"] == "png"]
+                if variants:
+                    values["filename"] = min(variants, key=lambda v: v["width"])["path"]
+                    return url_for("built_asset", **values)
+        return url_for(endpoint, **values)
+
+    def srcset(self, filename, fmt):
+        """
+        srcset attribute value listing every width of an image in one format, or '' if none was built.
+        """
+        if not self.refresh() or filename not in self.images:
+            return ""
+        return ", ".join(
+            f"{url_for('built_asset', filename=variant['path'])} {variant['width']}w"
+            for variant in self.images[filename]["variants"]
+            if variant["format"] == fmt
+        )
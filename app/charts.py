@@ -0,0 +1,55 @@
+from app import app, db_pool
+from flask import request, jsonify
+
+# Chart data endpoints. Each one reads a small summary table precomputed by scripts/build_schema.py
+# (see scripts/aggregates.py), so a request is one primary-key range lookup, never an aggregation
+
+# Filter value for the whole-catalog series
+ALL_LABEL = "All"
+
+def chart_rows(sql, params=()):
+    conn = db_pool.get_connection()
+    return [dict(row) for row in conn.execute(sql, params)]
+
+def chart_response(rows, label, value):
+    # An empty series for a specific genre/tag means the value does not exist
+    if not rows and value != ALL_LABEL:
+        return jsonify(error=f"Unknown {label}: {value}"), 404
+    return jsonify({label: value, "data": rows})
+
+@app.route("/api/charts/releases-by-year")
+def chart_releases_by_year():
+    genre = request.args.get("genre", ALL_LABEL)
+    rows = chart_rows(
+        "SELECT release_year, game_count FROM agg_releases_by_year_genre WHERE genre_name = ? ORDER BY release_year",
+        (genre,)
+    )
+    return chart_response(rows, "genre", genre)
+
+@app.route("/api/charts/rating-distribution")
+def chart_rating_distribution():
+    genre = request.args.get("genre", ALL_LABEL)
+    rows = chart_rows(
+        """
+        SELECT bucket_low, bucket_high, game_count FROM agg_rating_distribution
+        WHERE genre_name = ? ORDER BY bucket
+        """,
+        (genre,)
+    )
+    return chart_response(rows, "genre", genre)
+
+@app.route("/api/charts/price-vs-playtime")
+def chart_price_vs_playtime():
+    rows = chart_rows(
+        "SELECT price_band, game_count, mean_playtime, median_playtime FROM agg_price_playtime ORDER BY band_order"
+    )
+    return jsonify(data=rows)
+
+@app.route("/api/charts/owners-by-tag")
+def chart_owners_by_tag():
+    tag = request.args.get("tag", ALL_LABEL)
+    rows = chart_rows(
+        "SELECT owners, game_count FROM agg_owners_by_tag WHERE tag_name = ? ORDER BY owners_low",
+        (tag,)
+    )
+    return chart_response(rows, "tag", tag)
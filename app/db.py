@@ -0,0 +1,130 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from urllib.request import pathname2url
+
+DB_PATH = os.path.join("data", "steam.sqlite")
+
+class ConnectionPool:
+    """
+    Hands out one read-only SQLite connection per thread, reused across requests.
+    Connections are reopened automatically when the database file is replaced.
+    """
+    def __init__(self, db_path, immutable=False, mmap_size=256 * 1024 * 1024, cache_size_kib=64 * 1024,
+                 factory=sqlite3.Connection):
+        """
+        Parameters:
+        db_path (str): Path to the SQLite database file.
+        immutable (bool): Open with immutable=1 - only safe if the file is never modified in place.
+        mmap_size (int): Bytes of the database to memory-map.
+        cache_size_kib (int): Page cache size per connection in KiB.
+        factory (type): sqlite3.Connection subclass to open, e.g. app.metrics.TimedConnection.
+        """
+        self.db_path = db_path
+        self.immutable = immutable
+        self.mmap_size = mmap_size
+        self.cache_size_kib = cache_size_kib
+        self.factory = factory
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.open_connections = 0
+
+    def _uri(self):
+        uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+        if self.immutable:
+            uri += "&immutable=1"
+        return uri
+
+    def _file_signature(self):
+        # Inode, size and mtime change whenever the file is rebuilt or swapped in
+        stat = os.stat(self.db_path)
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _open(self):
+        conn = sqlite3.connect(self._uri(), uri=True, factory=self.factory)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size = {-int(self.cache_size_kib)}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def get_connection(self):
+        """
+        Return this thread's connection, opening (or reopening) it if needed.
+
+        Returns:
+        sqlite3.Connection: A read-only connection with sqlite3.Row rows.
+        """
+        signature = self._file_signature()
+        conn = getattr(self._local, "conn", None)
+
+        if conn is not None and self._local.signature == signature:
+            with self._lock:
+                self.hits += 1
+            return conn
+
+        # First use on this thread, or the database file was replaced since we opened it
+        if conn is not None:
+            conn.close()
+            with self._lock:
+                self.open_connections -= 1
+
+        conn = self._open()
+        self._local.conn = conn
+        self._local.signature = signature
+
+        with self._lock:
+            self.misses += 1
+            self.open_connections += 1
+
+        return conn
+
+    def close(self):
+        """
+        Close the calling thread's connection, if it has one.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            with self._lock:
+                self.open_connections -= 1
+
+    def warm(self):
+        """
+        Open the calling thread's connection up front, if the database exists yet.
+        """
+        if os.path.exists(self.db_path):
+            self.get_connection()
+
+    def build_version(self):
+        """
+        Returns:
+        str: Identifier of the database file on disk - changes whenever it is rebuilt or replaced.
+        """
+        inode, size, mtime_ns = self._file_signature()
+        return f"{inode:x}-{size:x}-{mtime_ns:x}"
+
+    def last_modified(self):
+        """
+        Returns:
+        datetime: When the database file on disk was last written (UTC).
+        """
+        return datetime.fromtimestamp(os.stat(self.db_path).st_mtime, tz=timezone.utc)
+
+    def stats(self):
+        """
+        Returns:
+        dict: Pool hit/miss counters and the number of open connections.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "open_connections": self.open_connections,
+            }
@@ -0,0 +1,114 @@
+import os
+import json
+import threading
+import numpy as np
+
+FACETS_DIR = os.path.join("data", "facets")
+
+# Number of set bits in every possible byte, for counting bits in packed bitsets
+POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint16)
+
+class FacetIndex:
+    """
+    Facet counts and filters from the packed per-value bitsets written by scripts/facet_index.py.
+    Loaded once and memory-mapped; reloaded automatically when a rebuild writes a new manifest.
+    """
+    def __init__(self, directory=FACETS_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._manifest_mtime = None
+        self.appids = None
+        self.values = {}
+        self.bits = {}
+
+    def _manifest_path(self):
+        return os.path.join(self.directory, "manifest.json")
+
+    def refresh(self):
+        """
+        Load the index if it exists and has changed since it was last loaded.
+
+        Returns:
+        bool: True if an index is available.
+        """
+        try:
+            mtime = os.stat(self._manifest_path()).st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+        if mtime == self._manifest_mtime:
+            return True
+
+        with self._lock:
+            if mtime != self._manifest_mtime:
+                with open(self._manifest_path()) as f:
+                    manifest = json.load(f)
+                self.appids = np.load(os.path.join(self.directory, "appids.npy"), mmap_mode="r")
+                self.bits = {
+                    facet: np.load(os.path.join(self.directory, f"{facet}_bits.npy"), mmap_mode="r")
+                    for facet in manifest["facets"]
+                }
+                self.values = {
+                    facet: {value: row for row, value in enumerate(values)}
+                    for facet, values in manifest["facets"].items()
+                }
+                self._manifest_mtime = mtime
+        return True
+
+    def bitset_for_appids(self, appids):
+        """
+        Packed bitset with a bit set for every known appid in the given iterable.
+        """
+        appids = np.fromiter(appids, dtype=np.int64)
+        positions = np.searchsorted(self.appids, appids)
+
+        # searchsorted gives insertion points; keep only exact matches
+        valid = positions < len(self.appids)
+        valid[valid] = self.appids[positions[valid]] == appids[valid]
+
+        mask = np.zeros(len(self.appids), dtype=bool)
+        mask[positions[valid]] = True
+        return np.packbits(mask)
+
+    def all_games(self):
+        """
+        Packed bitset with every game set.
+        """
+        return np.packbits(np.ones(len(self.appids), dtype=bool))
+
+    def apply_filters(self, bitset, filters):
+        """
+        Narrow a bitset to games that have every selected facet value.
+
+        Parameters:
+        bitset (np.ndarray): Packed bitset of candidate games.
+        filters (dict): Facet name to a list of required values.
+        """
+        for facet, selected in filters.items():
+            for value in selected:
+                row = self.values.get(facet, {}).get(value)
+                if row is None:
+                    return np.zeros_like(bitset)
+                bitset = bitset & self.bits[facet][row]
+        return bitset
+
+    def counts(self, bitset, facet, top=None):
+        """
+        Count the games in a bitset for each value of one facet.
+
+        Parameters:
+        bitset (np.ndarray): Packed bitset of result games.
+        facet (str): Facet name, e.g. 'genre'.
+        top (int): Only return the most frequent values.
+
+        Returns:
+        list: (value, count) pairs with a non-zero count, most frequent first.
+        """
+        counts = POPCOUNT[self.bits[facet] & bitset].sum(axis=1)
+        names = list(self.values[facet])
+        order = np.argsort(-counts, kind="stable")
+        pairs = [(names[row], int(counts[row])) for row in order if counts[row] > 0]
+        return pairs[:top] if top else pairs
+
+    def total(self, bitset):
+        return int(POPCOUNT[bitset].sum())
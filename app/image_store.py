@@ -0,0 +1,256 @@
+import io
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+
+# Thumbnails made at ingest time: variant name -> width in px (the search result cards are about 300 CSS px wide)
+THUMBNAIL_WIDTHS = {"card": 300}
+
+# last_access is only rewritten when older than this, so serving an image rarely needs a write
+TOUCH_INTERVAL = 60
+
+INDEX_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS blobs (
+        sha256 TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        content_type TEXT NOT NULL,
+        last_access REAL NOT NULL
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS images (
+        appid INTEGER NOT NULL,
+        variant TEXT NOT NULL,
+        sha256 TEXT NOT NULL,
+        PRIMARY KEY (appid, variant)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_images_sha256 ON images (sha256)",
+    "CREATE INDEX IF NOT EXISTS idx_blobs_last_access ON blobs (last_access)",
+]
+
+# Magic bytes of the formats we accept
+CONTENT_TYPES = [
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF8", "image/gif"),
+]
+
+def sniff_content_type(data):
+    for magic, content_type in CONTENT_TYPES:
+        if data.startswith(magic):
+            return content_type
+    # WebP is a RIFF container like WAV and AVI; the form type at bytes 8-12 tells them apart
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+class ImageStore:
+    """
+    On-disk, content-addressed cache of game header images and their thumbnails.
+
+    Each distinct image is stored once as objects/<first 2 hex>/<sha256>, whatever games or variants use it.
+    A small SQLite index (index.sqlite) maps (appid, variant) to blobs and tracks when each blob was last served;
+    once the store grows past max_bytes the least recently used blobs are evicted.
+    The index is safe to share between worker processes.
+    """
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024):
+        """
+        Parameters:
+        directory (str): Folder holding the blobs and the index.
+        max_bytes (int): Total size of stored blobs to keep, evicting the least recently used beyond it.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        # Reopened in a forked worker - SQLite connections must not cross a fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            os.makedirs(self.directory, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(self.directory, "index.sqlite"), timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            for statement in INDEX_SCHEMA:
+                conn.execute(statement)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _write_transaction(self):
+        """
+        Run a block in a BEGIN IMMEDIATE transaction, rolled back if the block raises, so the connection
+        never keeps the index's write lock (shared by every worker) after a failure.
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        """
+        Close the calling thread's index connection, if it has one.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def blob_path(self, sha256):
+        return os.path.join(self.directory, "objects", sha256[:2], sha256)
+
+    def get(self, appid, variant="full"):
+        """
+        Look up a stored image.
+
+        Returns:
+        tuple or None: (path, sha256, content_type), or None if the image is not stored.
+        """
+        conn = self._connection()
+        row = conn.execute("""
+            SELECT b.sha256, b.content_type, b.last_access
+            FROM images i JOIN blobs b ON b.sha256 = i.sha256
+            WHERE i.appid = ? AND i.variant = ?
+        """, (appid, variant)).fetchone()
+
+        if row is None or not os.path.exists(self.blob_path(row[0])):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        sha256, content_type, last_access = row
+        now = time.time()
+        if now - last_access > TOUCH_INTERVAL:
+            conn.execute("UPDATE blobs SET last_access = ? WHERE sha256 = ?", (now, sha256))
+
+        with self._lock:
+            self.hits += 1
+        return self.blob_path(sha256), sha256, content_type
+
+    def put(self, appid, variant, data, content_type):
+        """
+        Store one image variant, reusing the blob if identical bytes are already stored.
+
+        Returns:
+        str: The blob's sha256.
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(sha256)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary name first so other workers never serve a partial file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        with self._write_transaction() as conn:
+            conn.execute("""
+                INSERT INTO blobs (sha256, size, content_type, last_access) VALUES (?, ?, ?, ?)
+                ON CONFLICT (sha256) DO UPDATE SET last_access = excluded.last_access
+            """, (sha256, len(data), content_type, time.time()))
+            conn.execute("INSERT OR REPLACE INTO images (appid, variant, sha256) VALUES (?, ?, ?)", (appid, variant, sha256))
+        return sha256
+
+    def ingest(self, appid, data):
+        """
+        Store a game's header image and its thumbnails (WebP, if Pillow is installed).
+
+        Returns:
+        list: Names of the variants stored.
+
+        Raises:
+        ValueError: If data is not a supported image.
+        """
+        content_type = sniff_content_type(data)
+        if content_type is None:
+            raise ValueError(f"Unsupported image format for appid {appid}")
+
+        self.put(appid, "full", data, content_type)
+        stored = ["full"]
+
+        try:
+            from PIL import Image
+        except ImportError:
+            return stored
+
+        with Image.open(io.BytesIO(data)) as image:
+            image.load()
+            for variant, width in THUMBNAIL_WIDTHS.items():
+                if image.width > width:
+                    resized = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+                else:
+                    resized = image
+                if resized.mode not in ("RGB", "RGBA"):
+                    resized = resized.convert("RGBA")
+                buffer = io.BytesIO()
+                resized.save(buffer, "WEBP", quality=80, method=6)
+                self.put(appid, variant, buffer.getvalue(), "image/webp")
+                stored.append(variant)
+
+        return stored
+
+    def evict(self):
+        """
+        Delete least recently used blobs (and the variants pointing at them) until the store fits in max_bytes.
+
+        Returns:
+        int: Number of blobs evicted.
+        """
+        conn = self._connection()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        evicted = []
+        for sha256, size in conn.execute("SELECT sha256, size FROM blobs ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            evicted.append(sha256)
+            total -= size
+
+        with self._write_transaction() as conn:
+            conn.executemany("DELETE FROM images WHERE sha256 = ?", [(sha256,) for sha256 in evicted])
+            conn.executemany("DELETE FROM blobs WHERE sha256 = ?", [(sha256,) for sha256 in evicted])
+
+        for sha256 in evicted:
+            try:
+                os.remove(self.blob_path(sha256))
+            except FileNotFoundError:
+                pass
+
+        with self._lock:
+            self.evictions += len(evicted)
+        return len(evicted)
+
+    def stats(self):
+        """
+        Returns:
+        dict: Hit/miss/eviction counters plus the number and total size of stored blobs.
+        """
+        blobs, total = self._connection().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "blobs": blobs,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+            }
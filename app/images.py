@@ -0,0 +1,108 @@
+import os
+import re
+import click
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from app import app, db_pool, image_store
+from app.image_store import THUMBNAIL_WIDTHS
+from flask import request, redirect, send_file, abort
+
+# Game header images served from the local image store (see app/image_store.py)
+# Fill the store offline with `flask ingest-images DIR`; `flask prefetch-images DIR` downloads into DIR first
+
+# Image URLs are per appid rather than content-hashed, so browsers revalidate them daily
+IMAGE_MAX_AGE = 24 * 60 * 60
+
+# Images not yet in the store are redirected to the original CDN URL, briefly cached
+FALLBACK_MAX_AGE = 5 * 60
+
+# Files in an ingest directory are named after the game: 10.jpg, 20.png, ...
+IMAGE_FILE_PATTERN = re.compile(r"^(\d+)\.(jpe?g|png|gif|webp)$", re.IGNORECASE)
+
+@app.route("/img/<int:appid>")
+def game_image(appid):
+    """
+    A game's header image, or its card-sized thumbnail with ?size=card.
+    """
+    variant = request.args.get("size", "full")
+    if variant != "full" and variant not in THUMBNAIL_WIDTHS:
+        abort(404)
+
+    stored = image_store.get(appid, variant)
+
+    if stored is not None:
+        path, sha256, content_type = stored
+        response = send_file(path, mimetype=content_type, etag=sha256, max_age=IMAGE_MAX_AGE, conditional=True)
+        response.cache_control.public = True
+        return response
+
+    # Not ingested yet - let the browser fetch the original rather than fetching it ourselves
+    row = db_pool.get_connection().execute("SELECT header_image FROM game_media WHERE appid = ?", (appid,)).fetchone()
+    if row is None or not row["header_image"]:
+        abort(404)
+    response = redirect(row["header_image"])
+    response.cache_control.public = True
+    response.cache_control.max_age = FALLBACK_MAX_AGE
+    return response
+
+@app.cli.command("ingest-images")
+@click.argument("directory")
+def ingest_images(directory):
+    """
+    Add every <appid>.<ext> image in DIRECTORY to the image store, with thumbnails, then evict down to size.
+    """
+    ingested = 0
+    skipped = 0
+    for file_name in sorted(os.listdir(directory)):
+        match = IMAGE_FILE_PATTERN.match(file_name)
+        if match is None:
+            continue
+        with open(os.path.join(directory, file_name), "rb") as f:
+            data = f.read()
+        try:
+            image_store.ingest(int(match.group(1)), data)
+            ingested += 1
+        except (ValueError, OSError) as e:
+            # Unreadable or unsupported images are skipped, not fatal
+            print(f"Skipped {file_name}: {e}")
+            skipped += 1
+
+    evicted = image_store.evict()
+    print(f"Ingested {ingested} images ({skipped} skipped, {evicted} evicted).")
+
+@app.cli.command("prefetch-images")
+@click.argument("directory")
+@click.option("--limit", type=int, default=None, help="Only download this many images.")
+@click.option("--workers", type=int, default=8, help="Parallel downloads.")
+def prefetch_images(directory, limit, workers):
+    """
+    Download header images from game_media into DIRECTORY as <appid>.jpg, skipping files already there.
+    """
+    os.makedirs(directory, exist_ok=True)
+    rows = db_pool.get_connection().execute(
+        "SELECT appid, header_image FROM game_media WHERE header_image IS NOT NULL ORDER BY appid"
+    ).fetchall()
+    pending = [
+        (row["appid"], row["header_image"]) for row in rows
+        if not os.path.exists(os.path.join(directory, f"{row['appid']}.jpg"))
+    ][:limit]
+
+    def download(item):
+        appid, url = item
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                data = response.read()
+        except OSError as e:
+            return f"Failed {appid}: {e}"
+        path = os.path.join(directory, f"{appid}.jpg")
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+        return None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        failures = [message for message in executor.map(download, pending) if message]
+
+    for message in failures:
+        print(message)
+    print(f"Downloaded {len(pending) - len(failures)} of {len(pending)} images into {directory}.")
@@ -0,0 +1,323 @@
+import os
+import re
+import sys
+import time
+import bisect
+import sqlite3
+import threading
+from collections import Counter
+from functools import lru_cache
+from flask import g, request, has_app_context, current_app, before_render_template, template_rendered
+
+# Upper bounds in seconds of the latency histogram buckets (Prometheus' defaults, plus 1 ms and 2.5 ms)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Distinct normalized queries tracked per process; any further ones share the "other" series
+MAX_QUERY_SERIES = 200
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql):
+    """
+    Reduce a query to its shape: literals become ?, IN lists of any length become "?, ..." and whitespace collapses.
+    """
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r"\b\d+(?:\.\d+)?\b", "?", sql)
+    sql = re.sub(r"\?(?:\s*,\s*\?)+", "?, ...", sql)
+    return " ".join(sql.split())
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Histogram:
+    """
+    Thread-safe latency histogram with one series per combination of label values, in Prometheus' format.
+    """
+    def __init__(self, name, help_text, label_names, buckets=BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        # Label values -> per-bucket counts (last one is +Inf) followed by the sum of observed values
+        self.series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, seconds):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += seconds
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labels, list(values)) for labels, values in self.series.items())
+
+        for labels, values in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), values):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_labels = _format_labels(self.label_names, labels, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {values[-1]}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+def stats_lines(prefix, stats, counters=("hits", "disk_hits", "misses", "evictions", "invalidations")):
+    """
+    Render a component's stats() dict in Prometheus' format: counters as <prefix>_<key>_total, the rest as gauges.
+    """
+    lines = []
+    for key, value in stats.items():
+        if not isinstance(value, (int, float)):
+            continue
+        name = f"{prefix}_{key}_total" if key in counters else f"{prefix}_{key}"
+        lines.append(f"# TYPE {name} {'counter' if key in counters else 'gauge'}")
+        lines.append(f"{name} {value}")
+    return lines
+
+def _record_query(sql, phase, seconds):
+    # Outside a Flask app (scripts, CLI before the app context is pushed) there is nothing to record into
+    if has_app_context():
+        metrics = current_app.extensions.get("metrics")
+        if metrics is not None:
+            metrics.observe_query(sql, phase, seconds)
+
+class TimedCursor(sqlite3.Cursor):
+    """
+    Cursor that reports how long execute() and the fetch methods take, labelled with the normalized SQL.
+    Iterating over the cursor directly (as the streaming /api/games response does) is not timed.
+    """
+    _sql = ""
+
+    def execute(self, sql, parameters=()):
+        self._sql = sql
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            _record_query(sql, "execute", time.perf_counter() - start)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._sql = sql
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            _record_query(sql, "execute", time.perf_counter() - start)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        try:
+            return super().fetchone()
+        finally:
+            _record_query(self._sql, "fetch", time.perf_counter() - start)
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        try:
+            return super().fetchmany(self.arraysize if size is None else size)
+        finally:
+            _record_query(self._sql, "fetch", time.perf_counter() - start)
+
+    def fetchall(self):
+        start = time.perf_counter()
+        try:
+            return super().fetchall()
+        finally:
+            _record_query(self._sql, "fetch", time.perf_counter() - start)
+
+class TimedConnection(sqlite3.Connection):
+    """
+    Connection whose cursors, including the ones behind conn.execute(), are TimedCursors.
+    """
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    # sqlite3's own Connection.execute() does not go through cursor(), so route the shortcuts explicitly
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+class SlowRequestProfiler:
+    """
+    Samples the stacks of threads that are serving requests. Requests slower than threshold_ms have their
+    samples written to directory in collapsed-stack format - one "outer;...;inner count" line per distinct stack -
+    ready for flamegraph.pl or speedscope.
+    """
+    def __init__(self, directory, threshold_ms, interval_ms=5):
+        """
+        Parameters:
+        directory (str): Folder for the .folded files.
+        threshold_ms (float): Only requests taking at least this long are written out.
+        interval_ms (float): Time between samples.
+        """
+        self.directory = directory
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+
+        self._active = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _ensure_sampler(self):
+        # Started on first use rather than at import, so each gunicorn worker gets its own after the fork
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._sample_forever, name="slow-request-profiler", daemon=True)
+                self._thread.start()
+
+    def _sample_forever(self):
+        me = threading.get_ident()
+        while True:
+            time.sleep(self.interval)
+            frames = sys._current_frames()
+            with self._lock:
+                for ident, samples in self._active.items():
+                    frame = frames.get(ident)
+                    if frame is None or ident == me:
+                        continue
+                    stack = []
+                    while frame is not None:
+                        stack.append(_frame_name(frame))
+                        frame = frame.f_back
+                    samples[";".join(reversed(stack))] += 1
+
+    def start_request(self):
+        self._ensure_sampler()
+        with self._lock:
+            self._active[threading.get_ident()] = Counter()
+
+    def finish_request(self, name, seconds):
+        """
+        Stop sampling the calling thread and write its samples out if the request was slow.
+
+        Returns:
+        str or None: Path of the file written.
+        """
+        with self._lock:
+            samples = self._active.pop(threading.get_ident(), None)
+
+        if not samples or seconds < self.threshold:
+            return None
+
+        os.makedirs(self.directory, exist_ok=True)
+        safe_name = re.sub(r"[^\w.-]", "_", name)
+        path = os.path.join(
+            self.directory, f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{safe_name}-{seconds * 1000:.0f}ms.folded"
+        )
+        with open(path, "w") as f:
+            for stack, count in samples.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+class Metrics:
+    """
+    Per-process request instrumentation: latency histograms per route, per normalized SQL query and per template,
+    a Server-Timing header on every response and, optionally, sampled stacks of slow requests.
+    """
+    def __init__(self, profiler=None):
+        """
+        Parameters:
+        profiler (SlowRequestProfiler): Profiler for slow requests. Disabled if None.
+        """
+        self.requests = Histogram(
+            "steam_http_request_duration_seconds", "Time to build each response, by route.",
+            ("route", "method", "status")
+        )
+        self.queries = Histogram(
+            "steam_sql_query_duration_seconds", "Time in sqlite3 execute() and fetch calls, by normalized query.",
+            ("query", "phase")
+        )
+        self.renders = Histogram(
+            "steam_template_render_duration_seconds", "Time in render_template(), by template.",
+            ("template",)
+        )
+        self.profiler = profiler
+
+    def init_app(self, app):
+        app.extensions["metrics"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        if self.profiler is not None:
+            # Teardown runs even when the view raised, so a failed request never stays registered for sampling
+            app.teardown_request(self._teardown_request)
+        before_render_template.connect(self._before_render, app)
+        template_rendered.connect(self._after_render, app)
+
+    def observe_query(self, sql, phase, seconds):
+        query = normalize_sql(sql)
+        if (query, phase) not in self.queries.series and len(self.queries.series) >= MAX_QUERY_SERIES:
+            query = "other"
+        self.queries.observe((query, phase), seconds)
+
+        timings = g.get("request_timings")
+        if timings is not None:
+            timings["sql"] += seconds
+            if phase == "execute":
+                timings["queries"] += 1
+
+    def _before_request(self):
+        g.request_timings = {"start": time.perf_counter(), "sql": 0.0, "queries": 0, "render": 0.0}
+        if self.profiler is not None:
+            self.profiler.start_request()
+
+    def _before_render(self, sender, template, context, **extra):
+        g.render_started = time.perf_counter()
+
+    def _after_render(self, sender, template, context, **extra):
+        started = g.pop("render_started", None)
+        if started is None:
+            return
+        seconds = time.perf_counter() - started
+        self.renders.observe((template.name,), seconds)
+        timings = g.get("request_timings")
+        if timings is not None:
+            timings["render"] += seconds
+
+    def _after_request(self, response):
+        timings = g.get("request_timings")
+        if timings is None:
+            return response
+
+        # Streamed responses are timed up to the point the body starts streaming
+        total = time.perf_counter() - timings["start"]
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        self.requests.observe((route, request.method, str(response.status_code)), total)
+
+        queries = timings["queries"]
+        response.headers["Server-Timing"] = (
+            f'sql;dur={timings["sql"] * 1000:.2f};desc="{queries} {"query" if queries == 1 else "queries"}", '
+            f'render;dur={timings["render"] * 1000:.2f}, '
+            f'total;dur={total * 1000:.2f}'
+        )
+        return response
+
+    def _teardown_request(self, exception):
+        timings = g.get("request_timings")
+        if timings is not None:
+            self.profiler.finish_request(request.endpoint or "unmatched", time.perf_counter() - timings["start"])
+
+    def render(self, extra_lines=()):
+        """
+        Returns:
+        str: Every histogram, followed by extra_lines, in Prometheus' text exposition format.
+        """
+        lines = self.requests.render() + self.queries.render() + self.renders.render() + list(extra_lines)
+        return "\n".join(lines) + "\n"
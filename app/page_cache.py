@@ -0,0 +1,117 @@
+import os
+import shutil
+import threading
+from collections import OrderedDict
+
+class PageCache:
+    """
+    Bounded LRU cache of rendered pages, scoped to one database build version.
+    Entries from an older build are dropped as soon as a newer version is seen.
+    Optionally writes pages through to disk so they survive restarts and are shared between workers.
+    """
+    def __init__(self, max_entries=2048, disk_dir=None):
+        """
+        Parameters:
+        max_entries (int): Maximum number of pages held in memory.
+        disk_dir (str): Folder for pre-rendered pages on disk. Disabled if None.
+        """
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_version(self, version):
+        # Caller holds the lock. A new database build invalidates everything cached so far.
+        if version == self._version:
+            return
+        if self._version is not None:
+            self._entries.clear()
+            self.invalidations += 1
+            self._remove_stale_disk_versions(version)
+        self._version = version
+
+    def _disk_path(self, version, key):
+        return os.path.join(self.disk_dir, version, f"{key}.html")
+
+    def _remove_stale_disk_versions(self, version):
+        if not self.disk_dir or not os.path.isdir(self.disk_dir):
+            return
+        for name in os.listdir(self.disk_dir):
+            if name != version:
+                shutil.rmtree(os.path.join(self.disk_dir, name), ignore_errors=True)
+
+    def get(self, version, key):
+        """
+        Return the cached page for key under the given build version, or None.
+        """
+        with self._lock:
+            self._check_version(version)
+            page = self._entries.get(key)
+            if page is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return page
+
+        if self.disk_dir:
+            path = self._disk_path(version, key)
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    page = f.read()
+                with self._lock:
+                    self.disk_hits += 1
+                self._store(version, key, page)
+                return page
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, version, key, page):
+        """
+        Cache a rendered page in memory and, if enabled, on disk.
+        """
+        self._store(version, key, page)
+
+        if self.disk_dir:
+            path = self._disk_path(version, key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary name first so other workers never read a partial page
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(page)
+            os.replace(tmp_path, path)
+
+    def _store(self, version, key, page):
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = page
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        """
+        Returns:
+        dict: Hit/miss/eviction counters, hit ratio and current size.
+        """
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
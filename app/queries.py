@@ -0,0 +1,206 @@
+import base64
+import json
+import re
+import sqlite3
+
+# Column weights for bm25 ranking: name, developer, publisher, short_description
+FTS_WEIGHTS = (10.0, 2.0, 2.0, 1.0)
+
+# Game fields that can be selected, mapped to their SQL expressions
+GAME_FIELDS = {
+    "appid": "g.appid",
+    "name": "g.name",
+    "release_date": "g.release_date",
+    "release_year": "g.release_year",
+    "release_month_label": "g.release_month_label",
+    "release_date_label": "g.release_date_label",
+    "developer": "g.developer",
+    "publisher": "g.publisher",
+    "short_description": "g.short_description",
+    "price": "g.price",
+    "english": "g.english",
+    "header_image": "gm.header_image",
+}
+
+DEFAULT_FIELDS = ["appid", "name", "release_date", "header_image"]
+
+# Filterable facets: (junction table, junction ID column, dimension table, dimension ID column, dimension name column)
+FILTERS = {
+    "genre": ("game_genres", "genre_id", "genres", "genre_id", "genre_name"),
+    "platform": ("game_platforms", "platform_id", "platforms", "platform_id", "platform_name"),
+    "category": ("game_categories", "category_id", "categories", "category_id", "category_name"),
+    "tag": ("game_steamspy_tags", "steamspy_tag_id", "steamspy_tags", "tag_id", "tag_name"),
+}
+
+
+class InvalidQuery(ValueError):
+    """
+    Raised for search parameters that cannot be turned into a query (bad cursor, unknown field or filter).
+    """
+
+
+def build_fts_query(search_term):
+    """
+    Turn a free-text search term into an FTS5 MATCH expression with prefix matching on every word.
+    Returns None if the term contains no searchable words.
+    """
+    words = re.findall(r"\w+", search_term)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def encode_cursor(rank, appid):
+    """
+    Encode the (rank, appid) position of the last returned row as an opaque URL-safe token.
+    """
+    return base64.urlsafe_b64encode(json.dumps([rank, appid]).encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """
+    Decode a cursor token back into (rank, appid).
+
+    Raises:
+    InvalidQuery: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        rank, appid = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(rank), int(appid)
+    except (ValueError, TypeError):
+        raise InvalidQuery("Invalid cursor")
+
+
+def _filter_clauses(filters):
+    clauses = []
+    params = []
+    for facet, values in (filters or {}).items():
+        if facet not in FILTERS:
+            raise InvalidQuery(f"Unknown filter: {facet}")
+        junction, junction_id, dimension, dimension_id, dimension_name = FILTERS[facet]
+        # Each value narrows the results further (AND across values and facets)
+        for value in values:
+            clauses.append(f"""g.appid IN (
+                SELECT j.appid FROM {junction} j
+                JOIN {dimension} d ON d.{dimension_id} = j.{junction_id}
+                WHERE d.{dimension_name} = ?
+            )""")
+            params.append(value)
+    return clauses, params
+
+
+def _year_clauses(years):
+    clauses = []
+    params = []
+    year_from, year_to = years or (None, None)
+    # Range conditions on the indexed release_year column
+    if year_from is not None:
+        clauses.append("g.release_year >= ?")
+        params.append(year_from)
+    if year_to is not None:
+        clauses.append("g.release_year <= ?")
+        params.append(year_to)
+    return clauses, params
+
+
+def _execute_search(conn, search_term, fts_query, filters, years, fields, limit, after):
+    select_columns = ", ".join(f"{GAME_FIELDS[field]} AS {field}" for field in fields)
+    filter_clauses, filter_params = _filter_clauses(filters)
+    year_clauses, year_params = _year_clauses(years)
+    filter_clauses += year_clauses
+    filter_params += year_params
+
+    if fts_query is not None:
+        # Ranked by bm25; rank is computed per match, so seek on it in an outer query
+        where = ["games_fts MATCH ?"] + filter_clauses
+        sql = f"""
+            SELECT * FROM (
+                SELECT {select_columns}, g.appid AS _appid, bm25(games_fts, ?, ?, ?, ?) AS _rank
+                FROM games_fts
+                JOIN games g ON g.appid = games_fts.rowid
+                LEFT JOIN game_media gm ON g.appid = gm.appid
+                WHERE {" AND ".join(where)}
+            )
+        """
+        params = [*FTS_WEIGHTS, fts_query, *filter_params]
+        if after is not None:
+            sql += " WHERE (_rank, _appid) > (?, ?)"
+            params += list(after)
+        sql += " ORDER BY _rank, _appid LIMIT ?"
+    else:
+        # Unranked: every row has rank 0, so seek directly on the appid primary key
+        where = list(filter_clauses)
+        params = list(filter_params)
+        if search_term:
+            where.insert(0, "g.name LIKE ?")
+            params.insert(0, f"%{search_term}%")
+        if after is not None:
+            where.append("g.appid > ?")
+            params.append(after[1])
+        sql = f"""
+            SELECT {select_columns}, g.appid AS _appid, 0.0 AS _rank
+            FROM games g
+            LEFT JOIN game_media gm ON g.appid = gm.appid
+            {"WHERE " + " AND ".join(where) if where else ""}
+            ORDER BY g.appid
+            LIMIT ?
+        """
+
+    params.append(limit)
+    return conn.execute(sql, params)
+
+
+def search_games(conn, search_term="", filters=None, years=None, fields=None, limit=20, after=None):
+    """
+    Search games by free text and facet filters, one keyset page at a time.
+    Uses the FTS5 index when available and falls back to a LIKE scan on the name otherwise.
+
+    Parameters:
+    conn (sqlite3.Connection): Connection with sqlite3.Row rows.
+    search_term (str): Free-text search. Empty matches every game.
+    filters (dict): Facet name ('genre', 'platform', 'category', 'tag') to a list of required values.
+    years (tuple): Inclusive (from, to) release-year range; either end may be None.
+    fields (list): Game fields to select. Defaults to DEFAULT_FIELDS.
+    limit (int): Maximum number of rows.
+    after (tuple): (rank, appid) of the last row of the previous page, or None for the first page.
+
+    Returns:
+    sqlite3.Cursor: Rows with the requested fields plus '_rank' and '_appid' for building the next cursor.
+    """
+    fields = fields or DEFAULT_FIELDS
+    unknown = [field for field in fields if field not in GAME_FIELDS]
+    if unknown:
+        raise InvalidQuery(f"Unknown field: {', '.join(unknown)}")
+
+    fts_query = build_fts_query(search_term)
+
+    if fts_query is not None:
+        try:
+            return _execute_search(conn, search_term, fts_query, filters, years, fields, limit, after)
+        except sqlite3.OperationalError:
+            # FTS5 missing from this sqlite3 build or the index was never built
+            pass
+
+    return _execute_search(conn, search_term, None, filters, years, fields, limit, after)
+
+
+def matching_appids(conn, search_term=""):
+    """
+    All appids matching a free-text search, without ranking or paging.
+
+    Returns:
+    list or None: Matching appids, or None when the term is empty and every game matches.
+    """
+    if not search_term:
+        return None
+
+    fts_query = build_fts_query(search_term)
+    if fts_query is not None:
+        try:
+            return [row[0] for row in conn.execute("SELECT rowid FROM games_fts WHERE games_fts MATCH ?", (fts_query,))]
+        except sqlite3.OperationalError:
+            # FTS5 missing from this sqlite3 build or the index was never built
+            pass
+
+    return [row[0] for row in conn.execute("SELECT appid FROM games WHERE name LIKE ?", (f"%{search_term}%",))]
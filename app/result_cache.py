@@ -0,0 +1,142 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+# last_access is only rewritten when older than this, so a cache hit rarely needs a write
+TOUCH_INTERVAL = 30
+
+# Expired, outdated and least recently used entries are pruned after every this many writes
+PRUNE_EVERY = 100
+
+CACHE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS results (
+        key TEXT PRIMARY KEY,
+        version TEXT NOT NULL,
+        value TEXT NOT NULL,
+        expires REAL NOT NULL,
+        last_access REAL NOT NULL
+    ) WITHOUT ROWID
+"""
+
+class ResultCache:
+    """
+    TTL + LRU cache of JSON-serialisable query results in a local SQLite file, shared by every worker process.
+    Entries belong to a database build version and are never returned for another one.
+    """
+    def __init__(self, path, ttl=600, max_entries=5000):
+        """
+        Parameters:
+        path (str): SQLite file holding the cache.
+        ttl (float): Seconds an entry stays valid.
+        max_entries (int): Entries kept, dropping the least recently used beyond it.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local = threading.local()
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        # Reopened in a forked worker - SQLite connections must not cross a fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(CACHE_SCHEMA)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, version, key):
+        """
+        Return the cached value for key under the given build version, or None if missing or expired.
+        """
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, last_access FROM results WHERE key = ? AND version = ? AND expires > ?",
+            (key, version, now)
+        ).fetchone()
+
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        value, last_access = row
+        if now - last_access > TOUCH_INTERVAL:
+            conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (now, key))
+
+        with self._lock:
+            self.hits += 1
+        return json.loads(value)
+
+    def put(self, version, key, value):
+        """
+        Cache a value for key under the given build version.
+        """
+        now = time.time()
+        self._connection().execute(
+            "INSERT OR REPLACE INTO results (key, version, value, expires, last_access) VALUES (?, ?, ?, ?, ?)",
+            (key, version, json.dumps(value), now + self.ttl, now)
+        )
+
+        with self._lock:
+            self.writes += 1
+            prune = self.writes % PRUNE_EVERY == 0
+        if prune:
+            self.prune(version)
+
+    def prune(self, version):
+        """
+        Delete entries that have expired or belong to another build, then the least recently used beyond max_entries.
+
+        Returns:
+        int: Number of entries deleted.
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            deleted = conn.execute(
+                "DELETE FROM results WHERE version != ? OR expires <= ?", (version, time.time())
+            ).rowcount
+            deleted += conn.execute("""
+                DELETE FROM results WHERE key IN (
+                    SELECT key FROM results ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,)).rowcount
+            conn.execute("COMMIT")
+        except BaseException:
+            # Never leave the shared connection holding the write lock every worker waits on
+            conn.execute("ROLLBACK")
+            raise
+
+        with self._lock:
+            self.evictions += deleted
+        return deleted
+
+    def stats(self):
+        """
+        Returns:
+        dict: This process's hit/miss/eviction counters plus the number of entries shared by all processes.
+        """
+        entries = self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": entries,
+                "max_entries": self.max_entries,
+            }
@@ -1,80 +1,327 @@
-from app import app
-from flask import render_template, request
-import sqlite3
+from app import app, db_pool, detail_cache, search_cache, facet_index, suggest_index, image_store, metrics, metrics_enabled
+from app.assets import DIST_DIR
+from app.metrics import stats_lines
+from app.queries import search_games, matching_appids, encode_cursor, decode_cursor, InvalidQuery, FILTERS
+from flask import (
+    render_template, request, make_response, jsonify, Response, stream_with_context, send_from_directory, abort,
+    redirect, url_for
+)
+from werkzeug.utils import safe_join
+from werkzeug.http import is_resource_modified
+import hashlib
+import json
+import mimetypes
 import os
 from datetime import datetime
+from urllib.parse import urlencode
 
-DB_PATH = os.path.join("data", "steam.sqlite")
+def hash_templates(template_dir):
+    """
+    Hash the contents of every template so cached pages and ETags change when templates change.
+    """
+    digest = hashlib.sha256()
+    for root, _, files in sorted(os.walk(template_dir)):
+        for file_name in sorted(files):
+            with open(os.path.join(root, file_name), "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:12]
 
-def query_games(search_term=""):
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+TEMPLATE_VERSION = hash_templates(os.path.join(app.root_path, app.template_folder))
 
-    cursor.execute("""
-        SELECT g.appid, g.name, g.release_date, gm.header_image
-        FROM games g
-        LEFT JOIN game_media gm ON g.appid = gm.appid
-        WHERE g.name LIKE ?
-        LIMIT 20                   
-    """, (f"%{search_term}%",))
+# Fields shown on the search result cards
+HOME_FIELDS = ["appid", "name", "release_month_label"]
 
-    results = cursor.fetchall()
-    conn.close()
-    return results
+def query_games(search_term="", filters=None):
+    conn = db_pool.get_connection()
+    return search_games(conn, search_term, filters=filters, fields=HOME_FIELDS, limit=20).fetchall()
 
-    
+# Facets shown next to search results, with how many values to list for each (None = all)
+FACET_LABELS = {"genre": "Genres", "platform": "Platforms", "category": "Categories", "tag": "Top tags"}
+FACET_TOP = {"tag": 15}
+
+def facet_counts(search_term, filters):
+    """
+    Count the games matching a search per facet value, using the precomputed facet bitsets.
+    Returns an empty dict if the facet index has not been built.
+    """
+    if not facet_index.refresh():
+        return {}
+
+    appids = matching_appids(db_pool.get_connection(), search_term)
+    bitset = facet_index.all_games() if appids is None else facet_index.bitset_for_appids(appids)
+    bitset = facet_index.apply_filters(bitset, filters)
+
+    return {facet: facet_index.counts(bitset, facet, top=FACET_TOP.get(facet)) for facet in FACET_LABELS}
+
+# Browsers, proxies and CDNs may reuse a search results page for this long before revalidating it
+SEARCH_MAX_AGE = 5 * 60
+
+def canonical_search(search_term, filters):
+    """
+    Canonical form of a search, so equivalent searches share one cache entry.
+    The term is case-folded with whitespace collapsed; filter values are sorted and de-duplicated,
+    since every value must match anyway.
+
+    Returns:
+    tuple: (term, filters, key) - key is the canonical query string, e.g. 'q=half+life&genre=Action'.
+    """
+    term = " ".join(search_term.casefold().split())
+    filters = {facet: sorted(set(values)) for facet, values in sorted(filters.items()) if values}
+    key = urlencode([("q", term)] + [(facet, value) for facet, values in filters.items() for value in values])
+    return term, filters, key
 
 @app.route("/", methods = ["GET", "POST"])
 def home():
-    method = request.method
-    game_list = []
-    transparent_navbar = True
-
     if request.method == "POST":
+        # Searches used to be form posts - send them on to the cacheable GET URL
+        filters = {facet: request.form.getlist(facet) for facet in FILTERS}
+        _, _, key = canonical_search(request.form.get("search", ""), filters)
+        return redirect(f"{url_for('home')}?{key}", code=303)
 
-        query = request.form.get("search", "")
-        raw_results = query_games(query)
+    query = request.args.get("q")
+    selected_filters = {facet: request.args.getlist(facet) for facet in FILTERS if request.args.getlist(facet)}
+    current_year = datetime.now().year
 
-        # Format the release date from DB
-        formatted_results = []
-        for game in raw_results:
-            date_obj = datetime.strptime(game["release_date"], "%Y-%m-%d")
-            formatted_date = date_obj.strftime("%B %Y")
+    if query is None and not selected_filters:
+        return render_template("index.html", results=[], searched=False, tr_navbar=True, current_year=current_year)
 
-            game_dict = dict(game)
-            game_dict["release_date"] = formatted_date
-            formatted_results.append(game_dict)
-        
-        game_list = formatted_results
-        transparent_navbar = False
+    term, filters, key = canonical_search(query or "", selected_filters)
+    version = db_pool.build_version()
+    last_modified = db_pool.last_modified()
 
-    return render_template("index.html", results=game_list, req_method=method, tr_navbar=transparent_navbar, current_year=datetime.now().year)
+    # Results only change with the database build; the page also depends on the templates and the footer year
+    etag = hashlib.sha256(f"{version}-{TEMPLATE_VERSION}-{current_year}-{key}".encode()).hexdigest()[:32]
 
-@app.route("/details/<int:appid>")
-def game_details(appid):
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = make_response("", 304)
+    else:
+        cached = search_cache.get(version, key)
+        if cached is None:
+            # Release dates come pre-formatted from the database
+            cached = {
+                "results": [dict(row) for row in query_games(term, filters)],
+                "facets": facet_counts(term, filters),
+            }
+            search_cache.put(version, key, cached)
 
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+        response = make_response(render_template(
+            "index.html", results=cached["results"], searched=True, tr_navbar=False, current_year=current_year,
+            query=query or "", facets=cached["facets"], facet_labels=FACET_LABELS, selected_filters=selected_filters
+        ))
+
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = SEARCH_MAX_AGE
+    return response
+
+def render_game_details(appid, current_year):
+    """
+    Render the details page for one game.
+    Returns None if the game does not exist.
+    """
+    conn = db_pool.get_connection()
     cursor = conn.cursor()
 
     cursor.execute("""
-        SELECT g.appid, g.name, g.release_date, g.developer, g.publisher,
-               g.short_description, g.price, g.english, gm.header_image
+        SELECT g.appid, g.name, g.release_date_label, g.developer, g.publisher,
+               g.short_description, g.price, g.english
         FROM games g
-        LEFT JOIN game_media gm ON g.appid = gm.appid
         WHERE g.appid = ?
     """, (appid,))
 
     game = cursor.fetchone()
-    conn.close()
 
     if game is None:
-        return render_template("404.html"), 404
+        return None
     
-    date_obj = datetime.strptime(game["release_date"], "%Y-%m-%d")
     formatted_game = dict(game)
-    formatted_game["release_date"] = date_obj.strftime("%d %B, %Y")
     formatted_game["english"] = "Yes" if game["english"] else "No"
 
-    return render_template("details.html", game=formatted_game, current_year = datetime.now().year)
+    # Precomputed nearest neighbours by tag votes - a primary-key range lookup on similar_games
+    cursor.execute("""
+        SELECT g.appid, g.name
+        FROM similar_games s
+        JOIN games g ON g.appid = s.neighbour_appid
+        WHERE s.appid = ?
+        ORDER BY s.rank
+    """, (appid,))
+
+    similar_games = cursor.fetchall()
+
+    return render_template("details.html", game=formatted_game, similar_games=similar_games, current_year = current_year)
+
+@app.route("/details/<int:appid>")
+def game_details(appid):
+    version = db_pool.build_version()
+    last_modified = db_pool.last_modified()
+    current_year = datetime.now().year
+
+    # The page only changes with the database build, the templates or the footer year
+    etag = f"{version}-{TEMPLATE_VERSION}-{current_year}-{appid}"
+
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = make_response("", 304)
+    else:
+        cache_key = f"{TEMPLATE_VERSION}-{current_year}-{appid}"
+        page = detail_cache.get(version, cache_key)
+
+        if page is None:
+            page = render_game_details(appid, current_year)
+            if page is None:
+                abort(404)
+            detail_cache.put(version, cache_key, page)
+
+        response = make_response(page)
+
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    # Let browsers and proxies store the page but revalidate it on every use
+    response.cache_control.public = True
+    response.cache_control.no_cache = True
+    return response
+
+# Page size bounds for the JSON search API
+API_DEFAULT_LIMIT = 20
+API_MAX_LIMIT = 100
+
+@app.route("/api/games")
+def api_games():
+    """
+    JSON search with keyset pagination.
+
+    Query parameters:
+    q: free-text search; genre / platform / category / tag: facet filters (repeatable);
+    year_from / year_to: inclusive release-year range;
+    fields: comma-separated fields to return; limit: page size; cursor: next_cursor from the previous page.
+    """
+    # Parsed one by one so the error names the parameter that is not an integer
+    try:
+        limit = min(max(int(request.args.get("limit", API_DEFAULT_LIMIT)), 1), API_MAX_LIMIT)
+    except ValueError:
+        return jsonify(error="limit must be an integer"), 400
+
+    years = []
+    for name in ("year_from", "year_to"):
+        value = request.args.get(name)
+        try:
+            years.append(int(value) if value else None)
+        except ValueError:
+            return jsonify(error=f"{name} must be an integer"), 400
+
+    fields = [field for field in request.args.get("fields", "").split(",") if field] or None
+    filters = {facet: request.args.getlist(facet) for facet in FILTERS if request.args.getlist(facet)}
+
+    try:
+        after = decode_cursor(request.args["cursor"]) if request.args.get("cursor") else None
+        # Fetch one extra row to know whether there is a next page
+        rows = search_games(
+            db_pool.get_connection(), request.args.get("q", ""),
+            filters=filters, years=tuple(years), fields=fields, limit=limit + 1, after=after
+        )
+    except InvalidQuery as e:
+        return jsonify(error=str(e)), 400
+
+    def generate():
+        # Stream rows out as they are read instead of building the whole page in memory
+        yield '{"results": ['
+        last = None
+        more = False
+        for count, row in enumerate(rows):
+            if count == limit:
+                more = True
+                break
+            if last is not None:
+                yield ", "
+            yield json.dumps({key: row[key] for key in row.keys() if not key.startswith("_")})
+            last = row
+        next_cursor = encode_cursor(last["_rank"], last["_appid"]) if more else None
+        yield f'], "next_cursor": {json.dumps(next_cursor)}}}'
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+# Number of type-ahead suggestions
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 20
+
+@app.route("/api/suggest")
+def api_suggest():
+    """
+    Type-ahead game name suggestions for q, best-rated prefix matches first, then fuzzy matches.
+    """
+    try:
+        limit = min(max(int(request.args.get("limit", SUGGEST_DEFAULT_LIMIT)), 1), SUGGEST_MAX_LIMIT)
+    except ValueError:
+        return jsonify(error="limit must be an integer"), 400
+
+    if not suggest_index.refresh(db_pool):
+        return jsonify(suggestions=[])
+
+    suggestions = suggest_index.suggest(request.args.get("q", ""), limit)
+    return jsonify(suggestions=[{"appid": appid, "name": name} for appid, name in suggestions])
+
+# Built assets have a content hash in their names, so browsers can keep them forever
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+# Precompressed siblings written by scripts/build_assets.py, in order of preference
+PRECOMPRESSED = [("br", ".br"), ("gzip", ".gz")]
+
+@app.route("/assets/<path:filename>")
+def built_asset(filename):
+    """
+    Serve a file from app/static/dist, using its precompressed .br/.gz copy when the client accepts it.
+    """
+    for encoding, suffix in PRECOMPRESSED:
+        compressed = safe_join(DIST_DIR, filename + suffix)
+        if request.accept_encodings[encoding] and compressed and os.path.isfile(compressed):
+            response = send_from_directory(
+                DIST_DIR, filename + suffix, mimetype=mimetypes.guess_type(filename)[0], max_age=ASSET_MAX_AGE
+            )
+            response.content_encoding = encoding
+            break
+    else:
+        response = send_from_directory(DIST_DIR, filename, max_age=ASSET_MAX_AGE)
+
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+@app.route("/stats")
+def stats():
+    return jsonify(
+        db_pool=db_pool.stats(),
+        detail_cache=detail_cache.stats(),
+        search_cache=search_cache.stats(),
+        suggest_index_bytes=suggest_index.nbytes(),
+        image_store=image_store.stats()
+    )
+
+@app.route("/metrics")
+def prometheus_metrics():
+    """
+    Latency histograms and cache counters in Prometheus' text format.
+    Every process keeps its own, so under gunicorn each scrape sees the worker that answered it.
+    """
+    if not metrics_enabled:
+        abort(404)
+
+    extra = stats_lines("steam_db_pool", db_pool.stats()) + stats_lines("steam_detail_cache", detail_cache.stats())
+    extra += stats_lines("steam_search_cache", search_cache.stats())
+    return Response(metrics.render(extra), mimetype="text/plain; version=0.0.4")
+
+@app.cli.command("prerender-details")
+def prerender_details():
+    """
+    Render every game's details page into the detail cache (and DETAIL_CACHE_DIR, if set).
+    """
+    version = db_pool.build_version()
+    current_year = datetime.now().year
+    appids = [row["appid"] for row in db_pool.get_connection().execute("SELECT appid FROM games")]
+
+    with app.test_request_context():
+        for appid in appids:
+            page = render_game_details(appid, current_year)
+            detail_cache.put(version, f"{TEMPLATE_VERSION}-{current_year}-{appid}", page)
+
+    print(f"Pre-rendered {len(appids)} details pages.")
@@ -0,0 +1,214 @@
+import os
+import re
+import bisect
+import threading
+import unicodedata
+import numpy as np
+
+# Fuzzy matches must contain at least this share of the query's trigrams...
+MIN_TRIGRAM_SHARE = 0.5
+# ...or, for short queries, all but this many of them: one typo can break up to three trigrams,
+# and swapping two letters up to four, which in a five-letter word leaves only one in common
+TRIGRAMS_PER_TYPO = 4
+
+# Queries shorter than this (after normalising) only get prefix matches
+MIN_FUZZY_LENGTH = 3
+
+# Prefix ranges longer than this are deduplicated with a per-game mask instead of a sort
+MASK_THRESHOLD = 512
+
+def normalize(text):
+    """
+    Lowercase, strip accents and reduce to single-space-separated words, for matching names.
+    """
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.findall(r"\w+", text.lower()))
+
+def trigrams(encoded):
+    """
+    Distinct byte trigrams of a normalised, UTF-8 encoded name, space-padded so word starts and ends count,
+    each packed into one uint32.
+    """
+    padded = np.frombuffer(b" " + encoded + b" ", dtype=np.uint8).astype(np.uint32)
+    if len(padded) < 3:
+        return np.empty(0, dtype=np.uint32)
+    return np.unique((padded[:-2] << 16) | (padded[1:-1] << 8) | padded[2:])
+
+class SuggestIndex:
+    """
+    Type-ahead suggestions over game names, built in memory from the database and rebuilt when it is replaced.
+
+    Games are numbered by descending positive_ratings, so a lower game number is a better suggestion.
+    Everything is stored in a few flat NumPy arrays and byte strings rather than per-name Python objects:
+
+    names: normalised names joined with NUL bytes, and name_offsets into it
+    prefix_positions / prefix_games: the start of every word in names, sorted by the text from there,
+                                     for binary searching word prefixes
+    trigram_keys / trigram_indptr / trigram_games: game numbers for each trigram, CSR style
+    trigram_counts: number of distinct trigrams in each name
+    display_names / display_offsets: original names for output
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._index = None
+
+    def refresh(self, pool):
+        """
+        Build the index if the database exists and has been rebuilt since the index was last built.
+
+        Parameters:
+        pool (ConnectionPool): Pool for the database to index.
+
+        Returns:
+        bool: True if an index is available.
+        """
+        if not os.path.exists(pool.db_path):
+            return False
+
+        version = pool.build_version()
+        if version == self._version:
+            return True
+
+        with self._lock:
+            if version != self._version:
+                # Swap in the new arrays with a single assignment so concurrent lookups never mix two builds
+                self._index = self._build(pool.get_connection())
+                self._version = version
+        return True
+
+    def _build(self, conn):
+        rows = conn.execute("""
+            SELECT g.appid, g.name
+            FROM games g
+            LEFT JOIN ratings r ON r.appid = g.appid
+            WHERE g.name IS NOT NULL AND g.name != ''
+            ORDER BY COALESCE(r.positive_ratings, 0) DESC, g.appid
+        """).fetchall()
+
+        appids = np.array([row[0] for row in rows], dtype=np.int64)
+        encoded_names = [normalize(row[1]).encode() for row in rows]
+        encoded_display = [row[1].encode() for row in rows]
+
+        names = b"\x00".join(encoded_names)
+        name_offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(name) + 1 for name in encoded_names], out=name_offsets[1:])
+
+        # Every word start, sorted by the rest of its name
+        positions, games = [], []
+        for game, name in enumerate(encoded_names):
+            start = name_offsets[game]
+            for match in re.finditer(rb"\S+", name):
+                positions.append(start + match.start())
+                games.append(game)
+        ends = name_offsets[np.array(games, dtype=np.int64) + 1] - 1 if games else []
+        order = sorted(range(len(positions)), key=lambda i: names[positions[i]:ends[i]])
+
+        # (trigram, game) pairs grouped by trigram
+        name_trigrams = [trigrams(name) for name in encoded_names]
+        pair_keys = np.concatenate(name_trigrams) if name_trigrams else np.empty(0, dtype=np.uint32)
+        pair_games = np.repeat(np.arange(len(rows), dtype=np.int32), [len(t) for t in name_trigrams])
+        pair_order = np.lexsort((pair_games, pair_keys))
+        trigram_keys, trigram_starts = np.unique(pair_keys[pair_order], return_index=True)
+
+        display_offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(name) for name in encoded_display], out=display_offsets[1:])
+
+        return {
+            "appids": appids,
+            "names": names,
+            "name_offsets": name_offsets,
+            "prefix_positions": np.array(positions, dtype=np.int64)[order] if positions else np.empty(0, dtype=np.int64),
+            "prefix_games": np.array(games, dtype=np.int32)[order] if games else np.empty(0, dtype=np.int32),
+            "trigram_keys": trigram_keys.astype(np.uint32),
+            "trigram_indptr": np.append(trigram_starts, len(pair_keys)).astype(np.int64),
+            "trigram_games": pair_games[pair_order],
+            "trigram_counts": np.array([len(t) for t in name_trigrams], dtype=np.int32),
+            "display_names": b"".join(encoded_display),
+            "display_offsets": display_offsets,
+        }
+
+    def _prefix_matches(self, index, query, limit):
+        names = index["names"]
+        length = len(query)
+        key = lambda position: names[position:position + length]
+
+        positions = index["prefix_positions"]
+        low = bisect.bisect_left(positions, query, key=key)
+        high = bisect.bisect_right(positions, query, lo=low, key=key)
+        games = index["prefix_games"][low:high]
+
+        # A game can match at several words; keep each once, best-rated (lowest number) first
+        if len(games) > MASK_THRESHOLD:
+            mask = np.zeros(len(index["appids"]), dtype=bool)
+            mask[games] = True
+            return np.flatnonzero(mask)[:limit]
+        return np.unique(games)[:limit]
+
+    def _fuzzy_matches(self, index, query, limit, exclude):
+        query_trigrams = trigrams(query)
+        keys = index["trigram_keys"]
+        slots = np.searchsorted(keys, query_trigrams)
+
+        # searchsorted gives insertion points; keep only trigrams that exist
+        found = slots < len(keys)
+        found[found] = keys[slots[found]] == query_trigrams[found]
+        slots = slots[found]
+        if not len(slots):
+            return np.empty(0, dtype=np.int64)
+
+        indptr = index["trigram_indptr"]
+        postings = np.concatenate([index["trigram_games"][indptr[slot]:indptr[slot + 1]] for slot in slots])
+
+        # Number of the query's trigrams found in each name
+        shared = np.bincount(postings, minlength=len(index["appids"]))
+        shared[exclude] = 0
+        min_shared = max(1, min(np.ceil(MIN_TRIGRAM_SHARE * len(query_trigrams)), len(query_trigrams) - TRIGRAMS_PER_TYPO))
+        candidates = np.flatnonzero(shared >= min_shared)
+
+        # Jaccard similarity of the trigram sets, so names with fewer unmatched trigrams - closer in length
+        # to the query - rank higher. Closest names first, ties going to the better-rated game
+        common = shared[candidates]
+        similarity = common / (len(query_trigrams) + index["trigram_counts"][candidates] - common)
+        order = np.lexsort((candidates, -similarity))[:limit]
+        return candidates[order]
+
+    def suggest(self, text, limit=10):
+        """
+        Suggest game names for a partly typed search.
+        Word-prefix matches come first, best-rated first; any remaining slots are filled with
+        fuzzy trigram matches so misspellings still find something.
+
+        Parameters:
+        text (str): What the user has typed so far.
+        limit (int): Maximum number of suggestions.
+
+        Returns:
+        list: (appid, name) pairs.
+        """
+        index = self._index
+        query = normalize(text).encode()
+        if index is None or not query:
+            return []
+
+        games = self._prefix_matches(index, query, limit)
+        if len(games) < limit and len(query) >= MIN_FUZZY_LENGTH:
+            games = np.concatenate([games, self._fuzzy_matches(index, query, limit - len(games), games)])
+
+        offsets = index["display_offsets"]
+        display_names = index["display_names"]
+        return [
+            (int(index["appids"][game]), display_names[offsets[game]:offsets[game + 1]].decode())
+            for game in games
+        ]
+
+    def nbytes(self):
+        """
+        Returns:
+        int: Memory held by the index arrays and name strings, in bytes.
+        """
+        index = self._index
+        if index is None:
+            return 0
+        return sum(value.nbytes if isinstance(value, np.ndarray) else len(value) for value in index.values())
@@ -0,0 +1,113 @@
+import os
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import threading
+import http.client
+from urllib.parse import urlsplit, quote
+
+# Simple HTTP load generator for comparing servers: many client threads, each on one keep-alive connection,
+# requesting a fixed mix of pages for a set duration
+
+REPO_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DB_PATH = os.path.join(REPO_DIR, "data", "steam.sqlite")
+
+def sample_paths(count=200, seed=0):
+    """
+    A reproducible mix of detail pages, JSON searches, suggestions and chart data drawn from the database.
+    """
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute("SELECT appid, name FROM games WHERE name IS NOT NULL ORDER BY appid").fetchall()
+    conn.close()
+
+    rng = random.Random(seed)
+    paths = []
+    for appid, name in rng.sample(rows, min(count, len(rows))):
+        word = name.split()[0] if name.split() else name
+        paths.append(f"/details/{appid}")
+        paths.append(f"/api/games?q={quote(word)}&limit=20")
+        paths.append(f"/api/suggest?q={quote(word[:3])}")
+    paths.append("/api/charts/releases-by-year")
+    paths.append("/api/charts/price-vs-playtime")
+    rng.shuffle(paths)
+    return paths
+
+def client(base_url, paths, deadline, latencies, errors, lock):
+    parts = urlsplit(base_url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+    own_latencies = []
+    own_errors = 0
+    index = random.randrange(len(paths))
+
+    while time.perf_counter() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        start = time.perf_counter()
+        # Like browsers, retry once on a fresh connection if the server closed an idle keep-alive connection
+        # (which gunicorn does to workers' connections during a graceful reload)
+        for attempt in range(2):
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 500:
+                    own_errors += 1
+                own_latencies.append(time.perf_counter() - start)
+                break
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+                if attempt == 1:
+                    own_errors += 1
+
+    conn.close()
+    with lock:
+        latencies.extend(own_latencies)
+        errors.append(own_errors)
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(fraction * len(sorted_values)), len(sorted_values) - 1)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test a running instance of the app.")
+    parser.add_argument("url", nargs="?", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20)
+    args = parser.parse_args()
+
+    paths = sample_paths()
+    latencies, errors, lock = [], [], threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    threads = [
+        threading.Thread(target=client, args=(args.url, paths, deadline, latencies, errors, lock))
+        for _ in range(args.concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    result = {
+        "url": args.url,
+        "concurrency": args.concurrency,
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+    }
+    json.dump(result, sys.stdout)
+    print()
+
+if __name__ == "__main__":
+    main()
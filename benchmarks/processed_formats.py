@@ -0,0 +1,93 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import resource
+import subprocess
+
+# Make the pipeline modules in scripts/ importable
+REPO_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(REPO_DIR, "scripts"))
+
+from processed_io import PROCESSED_DIR, FORMAT_EXTENSIONS, find_processed, read_processed, write_processed
+
+DATASETS = [
+    "steam_data_cleaned",
+    "steam_description_data_cleaned",
+    "steamspy_tag_data_cleaned",
+    "steam_media_cleaned",
+]
+
+def peak_rss_kib():
+    """
+    Peak resident set size of this process in KiB (VmHWM on Linux, ru_maxrss elsewhere).
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def reset_peak_rss():
+    """
+    Reset the peak RSS watermark where the OS allows it (Linux), and return the current peak in KiB.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+    return peak_rss_kib()
+
+def load_all(directory, fmt):
+    """
+    Read every dataset in one format and report load time and this process's peak RSS.
+    Run in a fresh subprocess per format so peak RSS is not shared between formats.
+    """
+    # Import the Arrow readers up front so their import cost is not counted against one format
+    import pyarrow.parquet, pyarrow.feather
+    baseline_rss = reset_peak_rss()
+
+    start = time.perf_counter()
+    for dataset in DATASETS:
+        read_processed(os.path.join(directory, dataset + FORMAT_EXTENSIONS[fmt]))
+    elapsed = time.perf_counter() - start
+
+    # Report the growth over the post-import baseline
+    peak_rss_mib = (peak_rss_kib() - baseline_rss) / 1024
+    print(json.dumps({"format": fmt, "load_seconds": round(elapsed, 3), "peak_rss_mib": round(peak_rss_mib, 1)}))
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        # Convert the current processed layer into every format
+        for dataset in DATASETS:
+            df = read_processed(find_processed(dataset, PROCESSED_DIR))
+            for fmt in FORMAT_EXTENSIONS:
+                write_processed(df, dataset, fmt, directory)
+
+        results = []
+        for fmt in FORMAT_EXTENSIONS:
+            size_mib = sum(
+                os.path.getsize(os.path.join(directory, dataset + FORMAT_EXTENSIONS[fmt])) for dataset in DATASETS
+            ) / (1024 * 1024)
+            output = subprocess.run(
+                [sys.executable, __file__, "--load", directory, fmt],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output)
+            result["size_mib"] = round(size_mib, 1)
+            results.append(result)
+
+    print(f"{'format':<10}{'load (s)':>10}{'peak RSS growth (MiB)':>23}{'size (MiB)':>12}")
+    for result in results:
+        print(f"{result['format']:<10}{result['load_seconds']:>10}{result['peak_rss_mib']:>23}{result['size_mib']:>12}")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--load":
+        load_all(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,288 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime, timezone
+from urllib.parse import quote_plus
+
+# Benchmark suite: generates a synthetic raw catalog, then times every SteamDataCleaner step, every build_schema.py
+# stage and the main routes, recording wall time and peak RSS growth per stage to a JSON file that can be
+# compared against a saved baseline:
+#   python benchmarks/run_benchmarks.py --scale 1 --output benchmarks/baselines/scale-1.json
+#   python benchmarks/run_benchmarks.py --scale 1 --compare benchmarks/baselines/scale-1.json
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.normpath(os.path.join(BENCHMARKS_DIR, ".."))
+sys.path.insert(0, os.path.join(REPO_DIR, "scripts"))
+
+import pandas as pd
+from processed_formats import peak_rss_kib, reset_peak_rss
+from synthetic_catalog import generate_catalog
+
+# The cleaning steps scripts/process_raw_data.py runs on each raw file, as (method, args) pairs
+# A callable argument is called with the DataFrame being cleaned
+NUMERIC_COLUMNS = [
+    "english", "required_age", "achievements", "positive_ratings", "negative_ratings",
+    "average_playtime", "median_playtime", "price",
+]
+CLEANING_PIPELINES = {
+    "steam_description_data": [
+        ("standardise_columns", ()),
+        ("drop_duplicates", ()),
+        ("remove_html_from_column", ("short_description",)),
+        ("clean_text_column", ("short_description",)),
+        ("fill_missing", ("short_description", "No available description")),
+    ],
+    "steam": [
+        ("standardise_columns", ()),
+        ("drop_duplicates", ()),
+        ("fill_missing", (lambda df: list(df.columns),)),
+        ("clean_text_column", (["name", "developer", "publisher", "platforms", "categories", "genres", "steamspy_tags"],)),
+        ("convert_to_numeric", (NUMERIC_COLUMNS,)),
+        ("convert_to_datetime", ("release_date",)),
+        ("optimize_dtypes", ()),
+    ],
+    "steam_media_data": [
+        ("standardise_columns", ()),
+        ("drop_duplicates", ()),
+    ],
+    "steamspy_tag_data": [
+        ("fill_missing", (lambda df: list(df.columns)[1:],)),
+        ("convert_to_numeric", (lambda df: list(df.columns)[1:],)),
+        ("optimize_dtypes", ()),
+    ],
+}
+
+# Processed dataset written from each cleaned raw file, and the raw columns it leaves out
+PROCESSED_OUTPUTS = {
+    "steam_description_data": ("steam_description_data_cleaned", ["detailed_description", "about_the_game"]),
+    "steam": ("steam_data_cleaned", []),
+    "steam_media_data": ("steam_media_cleaned", ["screenshots", "background", "movies"]),
+    "steamspy_tag_data": ("steamspy_tag_data_cleaned", []),
+}
+
+# Requests per route benchmark
+ROUTE_SAMPLES = 200
+
+
+def measure(results, name, func, *args, **kwargs):
+    """
+    Run func, recording its wall time and the growth of this process's peak RSS under results[name].
+    """
+    baseline_rss = reset_peak_rss()
+    start = time.perf_counter()
+    value = func(*args, **kwargs)
+    seconds = time.perf_counter() - start
+    results[name] = {
+        "seconds": round(seconds, 4),
+        "peak_rss_mib": round((peak_rss_kib() - baseline_rss) / 1024, 1),
+    }
+    print(f"{name:<58}{seconds:>10.3f} s{results[name]['peak_rss_mib']:>10.1f} MiB", flush=True)
+    return value
+
+
+def benchmark_cleaning(results, raw_paths, processed_dir):
+    from cleaning_utils import SteamDataCleaner
+    from processed_io import write_processed
+
+    os.makedirs(processed_dir, exist_ok=True)
+    for dataset, steps in CLEANING_PIPELINES.items():
+        df = measure(results, f"clean/{dataset}/read_csv", pd.read_csv, raw_paths[dataset])
+        cleaner = SteamDataCleaner(df, copy=False)
+
+        for method, args in steps:
+            args = tuple(arg(cleaner.df) if callable(arg) else arg for arg in args)
+            measure(results, f"clean/{dataset}/{method}", getattr(cleaner, method), *args)
+
+        output_name, dropped_columns = PROCESSED_OUTPUTS[dataset]
+        cleaned = cleaner.get_df().drop(columns=dropped_columns)
+        measure(results, f"clean/{dataset}/write_processed", write_processed, cleaned, output_name, "parquet", processed_dir)
+
+
+def benchmark_build(results, data_dir):
+    import build_schema
+    from bulk_writer import BulkWriter
+    from processed_io import find_processed, read_processed
+
+    # Point the build at the benchmark's data folder instead of the repository's
+    build_schema.DATA_DIR = os.path.join(data_dir, "processed")
+    build_schema.DB_PATH = os.path.join(data_dir, "steam.sqlite")
+    build_schema.BUILD_PATH = build_schema.DB_PATH + ".building"
+    build_schema.FACETS_DIR = os.path.join(data_dir, "facets")
+    build_schema.TAG_VOTES_DIR = os.path.join(data_dir, "tag_votes")
+
+    # Each stage on its own, into a scratch database
+    stages_path = os.path.join(data_dir, "stages.sqlite")
+    writer = BulkWriter(stages_path)
+    frames = {
+        name: measure(results, f"build/read/{name}", read_processed, find_processed(dataset, build_schema.DATA_DIR))
+        for name, dataset in build_schema.INPUT_DATASETS.items()
+    }
+
+    for group, builder in build_schema.GROUP_BUILDERS.items():
+        tables = measure(results, f"build/compute/{group}", builder, frames)
+        for table_name, df in tables.items():
+            measure(results, f"build/load/{table_name}", writer.load_table, table_name, df)
+
+    measure(results, "build/fts_index", build_schema.build_fts_index, writer.conn)
+    measure(results, "build/facet_index", build_schema.build_facet_index, writer.conn, build_schema.FACETS_DIR)
+    measure(results, "build/analyze", writer.conn.execute, "ANALYZE")
+    measure(results, "build/vacuum", writer.conn.execute, "VACUUM")
+    writer.conn.close()
+    os.remove(stages_path)
+    del frames
+
+    # Whole builds, as run from the command line
+    measure(results, "build/full", build_schema.build, False)
+    measure(results, "build/incremental_no_changes", build_schema.build, True)
+
+
+def time_requests(results, name, requests):
+    """
+    Time a list of zero-argument request functions, recording latency percentiles alongside the totals.
+    """
+    latencies = []
+
+    def run():
+        for request in requests:
+            start = time.perf_counter()
+            request()
+            latencies.append(time.perf_counter() - start)
+
+    measure(results, name, run)
+    latencies.sort()
+    results[name].update({
+        "requests": len(latencies),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 3),
+    })
+
+
+def benchmark_routes(results):
+    """
+    Time the search and detail routes through the Flask test client.
+    Runs in a subprocess started in the benchmark's root folder, since the app opens data/ relative to it.
+    """
+    sys.path.insert(0, REPO_DIR)
+    app_module = measure(results, "routes/import_app", __import__, "app")
+    from app import app
+    from app.routes import query_games
+
+    client = app.test_client()
+    conn = app_module.db_pool.get_connection()
+    rng = random.Random(0)
+    games = conn.execute("SELECT appid, name FROM games ORDER BY appid").fetchall()
+    sample = rng.sample(games, min(ROUTE_SAMPLES, len(games)))
+    words = [row["name"].split()[0] for row in sample if row["name"]]
+    # Distinct searches, so the first pass over them never hits the search cache
+    searches = list(dict.fromkeys(quote_plus(" ".join(row["name"].split()[:2])) for row in sample if row["name"]))
+
+    def get(url):
+        return lambda: client.get(url).close()
+
+    time_requests(results, "routes/search", [get(f"/?q={search}") for search in searches])
+    time_requests(results, "routes/search_cached", [get(f"/?q={search}") for search in searches])
+    time_requests(results, "routes/query_games", [lambda word=word: query_games(word) for word in words])
+    time_requests(results, "routes/details_uncached", [get(f"/details/{row['appid']}") for row in sample])
+    time_requests(results, "routes/details_cached", [get(f"/details/{row['appid']}") for row in sample])
+    time_requests(results, "routes/api_games", [get(f"/api/games?q={word}") for word in words])
+    time_requests(results, "routes/api_suggest", [get(f"/api/suggest?q={word[:3]}") for word in words])
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline_path):
+    """
+    Print each stage's time next to the baseline's, with the relative change.
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    print(f"\nCompared with {baseline_path} (commit {baseline['meta'].get('commit')}, scale {baseline['meta']['scale']}x)")
+    if baseline["meta"]["scale"] != current["meta"]["scale"]:
+        print(f"Warning: the baseline was run at scale {baseline['meta']['scale']}x, not {current['meta']['scale']}x")
+    print(f"{'stage':<48}{'baseline (s)':>14}{'current (s)':>13}{'change':>9}{'RSS (MiB)':>20}")
+    for name, result in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"{name:<48}{'-':>14}{result['seconds']:>13.3f}{'new':>9}")
+            continue
+        change = (result["seconds"] - old["seconds"]) / old["seconds"] * 100 if old["seconds"] else 0.0
+        rss = f"{old['peak_rss_mib']:.1f} -> {result['peak_rss_mib']:.1f}"
+        print(f"{name:<48}{old['seconds']:>14.3f}{result['seconds']:>13.3f}{change:>+8.0f}%{rss:>20}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the cleaning, build and route benchmarks on a synthetic catalog.")
+    parser.add_argument("--scale", type=float, default=1, help="catalog size as a multiple of the real one (1, 10, 100)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare the results against")
+    parser.add_argument("--work-dir", help="folder for the generated data (default: a temporary folder, removed afterwards)")
+    args = parser.parse_args()
+
+    root = args.work_dir or tempfile.mkdtemp(prefix="steam-benchmark-")
+    data_dir = os.path.join(root, "data")
+    results = {}
+
+    try:
+        raw_paths = measure(results, "generate_catalog", generate_catalog, os.path.join(data_dir, "raw"), args.scale)
+        benchmark_cleaning(results, raw_paths, os.path.join(data_dir, "processed"))
+        benchmark_build(results, data_dir)
+
+        # Fresh process for the app, so its memory is measured on its own
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--routes"],
+            cwd=root, check=True, capture_output=True, text=True,
+            env={**os.environ, "IMAGE_CACHE_DIR": os.path.join(data_dir, "image_cache")},
+        ).stdout
+        route_results = json.loads(output.splitlines()[-1])
+        for name, result in route_results.items():
+            print(f"{name:<58}{result['seconds']:>10.3f} s{result['peak_rss_mib']:>10.1f} MiB")
+        results.update(route_results)
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "scale": args.scale,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2 and sys.argv[1] == "--routes":
+        route_results = {}
+        benchmark_routes(route_results)
+        print(json.dumps(route_results))
+    else:
+        main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# Make the pipeline modules in scripts/ importable
+REPO_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(REPO_DIR, "scripts"))
+
+from similar_games import TOP_K, top_k_neighbours
+from tag_vote_matrix import TAG_VOTES_DIR, load_tag_vote_matrix
+from processed_formats import peak_rss_kib, reset_peak_rss
+
+# Size of the full Steam catalog in the source dataset
+FULL_CATALOG_GAMES = 27075
+FULL_CATALOG_TAGS = 371
+
+def synthetic_vote_matrix(n_games, n_tags, tags_per_game=20, seed=0):
+    """
+    Random CSR tag-vote arrays shaped like SteamSpy data: up to tags_per_game tags per game,
+    with tag popularity skewed so a few tags (think 'Indie', 'Action') appear on most games.
+    """
+    rng = np.random.default_rng(seed)
+    popularity = 1 / np.arange(1, n_tags + 1)
+    popularity /= popularity.sum()
+
+    counts = rng.integers(1, tags_per_game + 1, size=n_games)
+    indptr = np.zeros(n_games + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+
+    indices = np.empty(indptr[-1], dtype=np.int32)
+    for row in range(n_games):
+        indices[indptr[row]:indptr[row + 1]] = np.sort(rng.choice(n_tags, size=counts[row], replace=False, p=popularity))
+
+    return {
+        "appids": np.arange(10, 10 * (n_games + 1), 10, dtype=np.int64),
+        "tag_ids": np.arange(1, n_tags + 1, dtype=np.int64),
+        "indptr": indptr,
+        "indices": indices,
+        "data": rng.integers(1, 2000, size=len(indices), dtype=np.int32),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the similar-games index build and measure its peak memory.")
+    parser.add_argument("--games", type=int, default=FULL_CATALOG_GAMES)
+    parser.add_argument("--tags", type=int, default=FULL_CATALOG_TAGS)
+    parser.add_argument("--block-size", type=int, default=None,
+                        help="rows per matrix product (default: sized to similar_games.BLOCK_BYTES)")
+    parser.add_argument("--k", type=int, default=TOP_K)
+    parser.add_argument("--from-data", action="store_true",
+                        help=f"use the tag-vote matrix saved in {TAG_VOTES_DIR} instead of a synthetic one")
+    args = parser.parse_args()
+
+    if args.from_data:
+        matrix = {name: np.asarray(array) for name, array in load_tag_vote_matrix().items()}
+    else:
+        matrix = synthetic_vote_matrix(args.games, args.tags)
+
+    # Import SciPy up front so its import cost is not counted against the build
+    import scipy.sparse
+    baseline_rss = reset_peak_rss()
+
+    start = time.perf_counter()
+    neighbours = top_k_neighbours(matrix, k=args.k, block_size=args.block_size)
+    elapsed = time.perf_counter() - start
+
+    peak_rss_mib = (peak_rss_kib() - baseline_rss) / 1024
+    n_games = len(matrix["appids"])
+
+    print(f"games: {n_games}, tags: {len(matrix['tag_ids'])}, votes: {len(matrix['data'])}, "
+          f"k: {args.k}, block size: {args.block_size or 'auto'}")
+    print(f"build time: {elapsed:.2f} s ({n_games / elapsed:,.0f} games/s)")
+    print(f"peak RSS growth: {peak_rss_mib:.1f} MiB")
+    print(f"neighbour rows: {len(neighbours)}")
+
+if __name__ == "__main__":
+    main()
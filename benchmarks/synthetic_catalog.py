@@ -0,0 +1,197 @@
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+# Synthetic Steam catalog: writes the four raw CSVs that scripts/process_raw_data.py reads, at any multiple of
+# the real catalog's size, so the pipeline and the app can be benchmarked without the Kaggle download
+
+# Games in the real dataset (scale 1)
+BASE_GAMES = 27075
+
+# Rows generated and written per pass, so 100x catalogs never have to fit in memory at once
+CHUNK_ROWS = 50_000
+
+RAW_FILES = {
+    "steam": "steam.csv",
+    "steam_description_data": "steam_description_data.csv",
+    "steam_media_data": "steam_media_data.csv",
+    "steamspy_tag_data": "steamspy_tag_data.csv",
+}
+
+NAME_WORDS = np.array([
+    "Half", "Life", "Counter", "Strike", "Portal", "Dark", "Souls", "Space", "Quest", "Legend", "Hero", "Racing",
+    "Farm", "Simulator", "Zombie", "Tactics", "Dungeon", "Empire", "Star", "Knight", "Shadow", "City", "Tower",
+    "Defense", "Galaxy", "Ocean", "Pixel", "Dragon", "Island", "Escape", "Puzzle", "Survival", "Kingdom", "Rogue",
+])
+STUDIO_WORDS = np.array(["Valve", "Red", "Blue", "Studio", "Games", "Interactive", "Software", "Digital", "Labs", "Works"])
+PLATFORMS = np.array(["windows", "windows;mac", "windows;mac;linux", "windows;linux"])
+CATEGORIES = np.array([
+    "Single-player", "Multi-player", "Online Multi-Player", "Steam Achievements", "Steam Cloud",
+    "Full controller support", "Steam Trading Cards", "Co-op", "Partial Controller Support", "Steam Leaderboards",
+])
+GENRES = np.array(["Action", "Adventure", "Indie", "RPG", "Strategy", "Simulation", "Casual", "Racing", "Sports"])
+OWNERS = np.array([
+    "0-20000", "20000-50000", "50000-100000", "100000-200000", "200000-500000",
+    "500000-1000000", "1000000-2000000", "2000000-5000000",
+])
+OWNERS_WEIGHTS = np.array([0.55, 0.15, 0.1, 0.07, 0.06, 0.03, 0.02, 0.02])
+
+# 371 SteamSpy tags, as in the real tag-vote file: a few real names, then numbered ones
+TAG_NAMES = [
+    "Action", "Indie", "Adventure", "Casual", "Strategy", "Simulation", "RPG", "Singleplayer", "Early Access",
+    "Free to Play", "Multiplayer", "Puzzle", "2D", "Great Soundtrack", "Atmospheric", "Story Rich", "Open World",
+    "Sci-fi", "Pixel Graphics", "Horror", "Co-op", "First-Person", "Fantasy", "Sandbox", "Survival",
+] + [f"Tag {number}" for number in range(26, 372)]
+TAG_COLUMNS = [name.lower().replace(" ", "_").replace("-", "_") for name in TAG_NAMES]
+
+HTML_PARAGRAPH = (
+    "<p>Explore a <strong>hand-crafted</strong> world full of secrets &amp; surprises.</p>"
+    "<ul><li>Dozens of levels</li><li>Online co-op</li><li>Original soundtrack</li></ul>"
+    "<img src=\"https://steamcdn-a.akamaihd.net/steam/apps/0/extras/banner.png\">"
+)
+
+# Markup wrapped around some short descriptions that a naive tag pattern gets wrong, as (before, after) pairs:
+# a bare "<" and ">" in the text, a script body, and a quoted ">" inside an attribute
+AWKWARD_HTML = [
+    ("", " Rated 9 < 10 by critics > most players."),
+    ("<script>var promo = '<b>sale</b>';</script>", ""),
+    ("<img alt='box > art' src=\"header.jpg\"> ", ""),
+]
+
+
+def _join_choices(rng, values, rows, max_items, separator=";"):
+    """
+    Join 1..max_items distinct random values per row into one delimited string per row.
+    """
+    counts = rng.integers(1, max_items + 1, size=rows)
+    picks = rng.random((rows, len(values))).argsort(axis=1)[:, :max_items]
+    return [separator.join(values[picks[row, :counts[row]]]) for row in range(rows)]
+
+
+def generate_chunk(rng, start, rows):
+    """
+    Generate one chunk of games as the four raw DataFrames.
+    """
+    appids = (np.arange(start, start + rows, dtype=np.int64) + 1) * 10
+
+    # Names of 1-3 words; some repeated so search has realistic collisions
+    words = NAME_WORDS[rng.integers(0, len(NAME_WORDS), size=(rows, 3))]
+    word_counts = rng.integers(1, 4, size=rows)
+    names = [" ".join(words[row, :word_counts[row]]) for row in range(rows)]
+
+    dates = pd.Timestamp("1997-01-01") + pd.to_timedelta(rng.integers(0, 8000, size=rows), unit="D")
+    release_dates = pd.Series(dates.strftime("%Y-%m-%d"))
+    # A few malformed dates, as in the real file
+    release_dates[rng.random(rows) < 0.002] = "Coming soon"
+
+    developers = pd.Series(STUDIO_WORDS[rng.integers(0, len(STUDIO_WORDS), rows)]) + " " + pd.Series(
+        STUDIO_WORDS[rng.integers(0, len(STUDIO_WORDS), rows)])
+
+    # Tag votes: a Zipf-like popularity so a handful of tags are on most games, up to 20 tags per game
+    popularity = 1 / np.arange(1, len(TAG_COLUMNS) + 1)
+    popularity /= popularity.sum()
+    # Weighted sampling without replacement for every row at once: the k largest u ** (1 / weight) keys
+    keys = np.log(rng.random((rows, len(TAG_COLUMNS)))) / popularity
+    tags = np.argpartition(-keys, 20, axis=1)[:, :20]
+    keep = np.arange(20) < rng.integers(1, 21, size=rows)[:, None]
+    votes = np.zeros((rows, len(TAG_COLUMNS)), dtype=np.int32)
+    votes[np.nonzero(keep)[0], tags[keep]] = rng.integers(1, 3000, size=int(keep.sum()))
+    top_tags = np.argsort(-votes, axis=1)[:, :3]
+    steamspy_tags = [
+        ";".join(TAG_NAMES[tag] for tag in top_tags[row] if votes[row, tag] > 0) for row in range(rows)
+    ]
+
+    positive = rng.pareto(1.2, size=rows).astype(np.int64) * 20
+    steam = pd.DataFrame({
+        "appid": appids,
+        "name": names,
+        "release_date": release_dates,
+        "english": (rng.random(rows) < 0.98).astype(int),
+        "developer": developers,
+        "publisher": developers.where(rng.random(rows) < 0.6, "Big Publisher"),
+        "platforms": PLATFORMS[rng.integers(0, len(PLATFORMS), rows)],
+        "required_age": rng.choice([0, 0, 0, 0, 12, 16, 18], size=rows),
+        "categories": _join_choices(rng, CATEGORIES, rows, 4),
+        "genres": _join_choices(rng, GENRES, rows, 3),
+        "steamspy_tags": steamspy_tags,
+        "achievements": rng.integers(0, 60, size=rows) * (rng.random(rows) < 0.6),
+        "positive_ratings": positive,
+        "negative_ratings": (positive * rng.random(rows) * 0.5).astype(np.int64),
+        "average_playtime": rng.integers(0, 3000, size=rows) * (rng.random(rows) < 0.3),
+        "median_playtime": rng.integers(0, 2000, size=rows) * (rng.random(rows) < 0.3),
+        "owners": OWNERS[rng.choice(len(OWNERS), size=rows, p=OWNERS_WEIGHTS)],
+        "price": np.round(rng.choice([0, 0.79, 3.99, 7.19, 9.99, 14.99, 24.99, 49.99], size=rows), 2),
+    })
+
+    short_descriptions = pd.Series(names) + " is a game about " + pd.Series(
+        NAME_WORDS[rng.integers(0, len(NAME_WORDS), rows)]).str.lower() + " &amp; more."
+    # Some short descriptions carry markup that the cleaner strips
+    has_html = rng.random(rows) < 0.1
+    short_descriptions[has_html] = "<b>" + short_descriptions[has_html] + "</b>"
+    awkward = rng.random(rows) < 0.02
+    pairs = rng.integers(0, len(AWKWARD_HTML), size=awkward.sum())
+    short_descriptions[awkward] = (
+        pd.Series([AWKWARD_HTML[pair][0] for pair in pairs], index=short_descriptions.index[awkward])
+        + short_descriptions[awkward]
+        + pd.Series([AWKWARD_HTML[pair][1] for pair in pairs], index=short_descriptions.index[awkward])
+    )
+    # ...and some are missing, for the cleaner to fill in
+    short_descriptions[rng.random(rows) < 0.01] = None
+    long_html = HTML_PARAGRAPH * 3
+    descriptions = pd.DataFrame({
+        "steam_appid": appids,
+        "detailed_description": long_html,
+        "about_the_game": long_html,
+        "short_description": short_descriptions,
+    })
+
+    urls = pd.Series(appids.astype(str))
+    media = pd.DataFrame({
+        "steam_appid": appids,
+        "header_image": "https://steamcdn-a.akamaihd.net/steam/apps/" + urls + "/header.jpg?t=1528733245",
+        "screenshots": "[{'id': 0, 'path_thumbnail': 'https://steamcdn-a.akamaihd.net/steam/apps/" + urls + "/0.jpg'}]",
+        "background": "https://steamcdn-a.akamaihd.net/steam/apps/" + urls + "/page_bg_generated_v6b.jpg",
+        "movies": None,
+    })
+
+    tag_votes = pd.DataFrame(votes, columns=TAG_COLUMNS)
+    tag_votes.insert(0, "appid", appids)
+
+    return {
+        "steam": steam,
+        "steam_description_data": descriptions,
+        "steam_media_data": media,
+        "steamspy_tag_data": tag_votes,
+    }
+
+
+def generate_catalog(directory, scale=1, seed=0):
+    """
+    Write a synthetic raw catalog of BASE_GAMES * scale games into directory.
+
+    Returns:
+    dict: Raw dataset name to the CSV path written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    total = int(BASE_GAMES * scale)
+    paths = {name: os.path.join(directory, file_name) for name, file_name in RAW_FILES.items()}
+
+    for start in range(0, total, CHUNK_ROWS):
+        chunk = generate_chunk(rng, start, min(CHUNK_ROWS, total - start))
+        for name, df in chunk.items():
+            df.to_csv(paths[name], mode="w" if start == 0 else "a", header=start == 0, index=False)
+
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic raw Steam catalog.")
+    parser.add_argument("directory", help="output folder for the raw CSVs")
+    parser.add_argument("--scale", type=float, default=1, help="multiple of the real catalog size (1, 10, 100...)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for name, path in generate_catalog(args.directory, args.scale, args.seed).items():
+        print(f"Wrote {path} ({os.path.getsize(path) / (1024 * 1024):.1f} MiB)")
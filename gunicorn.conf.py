@@ -0,0 +1,66 @@
+import os
+import time
+import signal
+import threading
+import multiprocessing
+
+# Production server settings: gunicorn -c gunicorn.conf.py wsgi:app
+# Settings below can be overridden with the environment variables they read
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+
+# Worker processes, each serving requests on a pool of threads
+# The app is read-only and SQLite releases the GIL during queries, so threads help alongside processes
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+
+# Import the app once in the master and fork workers from it, so the in-memory indexes
+# (suggestions, facet bitsets) are built once and shared copy-on-write
+preload_app = True
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG")
+errorlog = "-"
+
+# Seconds between checks for a rebuilt steam.sqlite (0 disables the watcher)
+db_watch_interval = float(os.environ.get("DB_WATCH_INTERVAL", "5"))
+
+
+def when_ready(server):
+    from app import db_pool
+
+    # SQLite connections must not be carried across fork - workers open their own
+    db_pool.close()
+
+    if db_watch_interval > 0:
+        threading.Thread(target=watch_database, args=(server,), daemon=True, name="db-watcher").start()
+
+
+def watch_database(server):
+    """
+    Runs in the master. When build_schema.py swaps in a new database, rebuild the shared indexes here
+    and then gracefully reload the workers (SIGHUP), so the new workers fork with fresh indexes
+    while the old ones finish their in-flight requests.
+    """
+    from app import db_pool, facet_index, suggest_index
+
+    version = db_pool.build_version() if os.path.exists(db_pool.db_path) else None
+
+    while True:
+        time.sleep(db_watch_interval)
+        if not os.path.exists(db_pool.db_path):
+            continue
+        current = db_pool.build_version()
+        if current == version:
+            continue
+
+        server.log.info("Database rebuilt (%s) - refreshing indexes and reloading workers", current)
+        facet_index.refresh()
+        suggest_index.refresh(db_pool)
+        db_pool.close()
+        version = current
+        os.kill(server.pid, signal.SIGHUP)
@@ -1,5 +1,8 @@
+import os
+
 # Import the Flask app
 from app import app
 
 if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+    # Development server only - see wsgi.py for production. Set FLASK_DEBUG=0 to turn debug mode off
+    app.run(debug=os.environ.get("FLASK_DEBUG", "1") == "1")
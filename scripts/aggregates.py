@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+# Materialized summary tables behind the web app's chart endpoints, computed with vectorized group-bys
+
+# Label used for the whole-catalog rows alongside per-genre / per-tag rows
+ALL_LABEL = "All"
+
+# Price bands (upper bound exclusive) for the price vs. playtime chart
+PRICE_BINS = [-np.inf, 0.005, 5, 10, 20, 40, np.inf]
+PRICE_LABELS = ["Free", "Under 5", "5-10", "10-20", "20-40", "40+"]
+
+# Positive-rating share buckets: 0 = 0-10%, ..., 9 = 90-100%
+RATING_BUCKETS = 10
+
+
+def _labelled_games(games, pairs, label_column):
+    """
+    One row per (game, label): each game once per genre/tag it has, plus once under ALL_LABEL
+    so every chart also has a whole-catalog series.
+    """
+    per_label = pairs.rename(columns={"value": label_column}).merge(games, on="appid")
+    labelled = pd.concat([per_label, games.assign(**{label_column: ALL_LABEL})], ignore_index=True)
+    return labelled.drop_duplicates(subset=["appid", label_column])
+
+
+def releases_by_year_genre(metadata_df, genre_pairs):
+    """
+    Number of games released per year, per genre and overall.
+    """
+    years = pd.to_datetime(metadata_df["release_date"], errors="coerce").dt.year
+    games = pd.DataFrame({"appid": metadata_df["appid"], "release_year": years}).dropna()
+
+    counts = (
+        _labelled_games(games, genre_pairs, "genre_name")
+        .groupby(["genre_name", "release_year"], sort=True)
+        .size()
+        .rename("game_count")
+        .reset_index()
+    )
+    counts["release_year"] = counts["release_year"].astype("int64")
+    return counts
+
+
+def rating_distribution(metadata_df, genre_pairs):
+    """
+    Histogram of the positive-rating share (in 10% buckets), per genre and overall.
+    Games without any ratings are left out.
+    """
+    total = metadata_df["positive_ratings"] + metadata_df["negative_ratings"]
+    rated = metadata_df[total > 0]
+    share = rated["positive_ratings"] / total[total > 0]
+    buckets = np.minimum((share * RATING_BUCKETS).astype("int64"), RATING_BUCKETS - 1)
+    games = pd.DataFrame({"appid": rated["appid"], "bucket": buckets})
+
+    counts = (
+        _labelled_games(games, genre_pairs, "genre_name")
+        .groupby(["genre_name", "bucket"], sort=True)
+        .size()
+        .rename("game_count")
+        .reset_index()
+    )
+    counts["bucket_low"] = counts["bucket"] / RATING_BUCKETS
+    counts["bucket_high"] = (counts["bucket"] + 1) / RATING_BUCKETS
+    return counts[["genre_name", "bucket", "bucket_low", "bucket_high", "game_count"]]
+
+
+def price_vs_playtime(metadata_df):
+    """
+    Game count and average/median playtime for each price band.
+    """
+    bands = pd.cut(metadata_df["price"], bins=PRICE_BINS, labels=PRICE_LABELS, right=False)
+    grouped = metadata_df.groupby(bands, observed=False)["average_playtime"]
+
+    summary = pd.DataFrame({
+        "game_count": grouped.size(),
+        "mean_playtime": grouped.mean().fillna(0).round(1),
+        "median_playtime": grouped.median().fillna(0),
+    })
+    summary.index = summary.index.astype(str)
+    summary = summary.rename_axis("price_band").reset_index()
+    summary.insert(1, "band_order", range(len(summary)))
+    return summary
+
+
+def owners_by_tag(metadata_df, tag_pairs):
+    """
+    Number of games in each owners range, per tag and overall.
+    """
+    owners = metadata_df[["appid", "owners"]].dropna()
+    # Ranges look like '20000-50000'; keep the lower bound for ordering
+    owners_low = pd.to_numeric(owners["owners"].astype(str).str.split("-").str[0].str.replace(",", ""), errors="coerce")
+    owners = owners.assign(owners=owners["owners"].astype(str), owners_low=owners_low).dropna()
+
+    counts = (
+        _labelled_games(owners, tag_pairs, "tag_name")
+        .groupby(["tag_name", "owners", "owners_low"], sort=True)
+        .size()
+        .rename("game_count")
+        .reset_index()
+    )
+    counts["owners_low"] = counts["owners_low"].astype("int64")
+    return counts[["tag_name", "owners", "owners_low", "game_count"]]
@@ -0,0 +1,158 @@
+import os
+import re
+import io
+import gzip
+import json
+import hashlib
+import argparse
+
+# Build step for the web app's static files: minified, content-hashed CSS, resized WebP/AVIF image variants
+# and precompressed .gz/.br copies, listed in a manifest that app/assets.py reads to emit hashed URLs
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "app", "static"))
+DIST_DIR = os.path.join(STATIC_DIR, "dist")
+
+# Stylesheets to minify, relative to STATIC_DIR
+STYLESHEETS = ["style.css"]
+
+# Images to re-encode, with the display widths (CSS px) they are used at - each also gets a 2x variant
+IMAGES = {
+    "images/controller_cropped.png": [400],
+    "images/controller.png": [400],
+}
+
+# Encoder settings per output format: (Pillow format name, save options)
+IMAGE_FORMATS = {
+    "avif": ("AVIF", {"quality": 60}),
+    "webp": ("WEBP", {"quality": 80, "method": 6}),
+    "png": ("PNG", {"optimize": True}),
+}
+
+# Text files worth precompressing; images are already compressed
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".svg", ".json"}
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def hashed_name(logical_name, data, suffix=""):
+    """
+    'images/controller.png' -> 'images/controller<suffix>.<hash>.png'
+    """
+    stem, extension = os.path.splitext(logical_name)
+    return f"{stem}{suffix}.{content_hash(data)}{extension}"
+
+
+def minify_css(css):
+    """
+    Strip comments and insignificant whitespace from a stylesheet.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    # Spaces around punctuation that never needs them (':' only after, so selectors like 'a :hover' keep theirs)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def write_output(relative_path, data, directory=DIST_DIR):
+    """
+    Write one built file plus precompressed .gz and .br siblings for text assets.
+    Returns the list of files written, relative to directory.
+    """
+    path = os.path.join(directory, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    written = [relative_path]
+
+    if os.path.splitext(relative_path)[1] not in COMPRESSIBLE_EXTENSIONS:
+        return written
+
+    # mtime=0 keeps the .gz output byte-for-byte reproducible
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=9, mtime=0) as f:
+        f.write(data)
+    with open(path + ".gz", "wb") as f:
+        f.write(buffer.getvalue())
+    written.append(relative_path + ".gz")
+
+    try:
+        import brotli
+    except ImportError:
+        print("Skipped .br files: the brotli package is not installed")
+        return written
+
+    with open(path + ".br", "wb") as f:
+        f.write(brotli.compress(data, quality=11))
+    written.append(relative_path + ".br")
+    return written
+
+
+def build_stylesheets(manifest, directory=DIST_DIR):
+    for logical_name in STYLESHEETS:
+        with open(os.path.join(STATIC_DIR, logical_name), encoding="utf-8") as f:
+            data = minify_css(f.read()).encode()
+        relative_path = hashed_name(logical_name, data)
+        write_output(relative_path, data, directory)
+        manifest["files"][logical_name] = relative_path
+        print(f"Built '{relative_path}': {len(data)} bytes")
+
+
+def build_images(manifest, directory=DIST_DIR):
+    try:
+        from PIL import Image, features
+    except ImportError:
+        print("Skipped images: Pillow is not installed")
+        return
+
+    for logical_name, widths in IMAGES.items():
+        with Image.open(os.path.join(STATIC_DIR, logical_name)) as source:
+            source.load()
+
+            variants = []
+            for width in sorted({w * scale for w in widths for scale in (1, 2)}):
+                if width > source.width:
+                    continue
+                height = round(source.height * width / source.width)
+                resized = source.resize((width, height), Image.LANCZOS)
+
+                for fmt, (pil_format, options) in IMAGE_FORMATS.items():
+                    if fmt in ("avif", "webp") and not features.check(fmt):
+                        continue
+                    buffer = io.BytesIO()
+                    resized.save(buffer, pil_format, **options)
+                    data = buffer.getvalue()
+
+                    stem, _ = os.path.splitext(logical_name)
+                    relative_path = hashed_name(f"{stem}.{fmt}", data, suffix=f".{width}w")
+                    write_output(relative_path, data, directory)
+                    variants.append({"path": relative_path, "format": fmt, "width": width, "height": height})
+                    print(f"Built '{relative_path}': {len(data)} bytes")
+
+        manifest["images"][logical_name] = {"width": source.width, "height": source.height, "variants": variants}
+
+
+def build_assets(directory=DIST_DIR):
+    """
+    Build every asset into directory and write manifest.json last, so the app never sees a half-built set.
+    """
+    manifest = {"files": {}, "images": {}}
+    build_stylesheets(manifest, directory)
+    build_images(manifest, directory)
+
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, "manifest.json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(directory, "manifest.json"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build hashed, minified and precompressed static assets.")
+    parser.add_argument("--output", default=DIST_DIR, help="output directory (default: app/static/dist)")
+    args = parser.parse_args()
+
+    build_assets(args.output)
@@ -1,248 +1,407 @@
 import pandas as pd
 import sqlite3
 import os
+import argparse
+import hashlib
+import shutil
+from datetime import datetime, timezone
+from schema_ddl import TABLE_SCHEMAS, TABLE_KEYS, MANIFEST_SCHEMA
+from bulk_writer import BulkWriter, bulk_insert
+from processed_io import FORMAT_EXTENSIONS, PROCESSED_FORMAT, find_processed, read_processed
+from facet_index import FACETS_DIR, build_facet_index
+from tag_vote_matrix import TAG_VOTES_DIR, votes_to_csr, csr_to_long, save_tag_vote_matrix
+from similar_games import top_k_neighbours
+from aggregates import releases_by_year_genre, rating_distribution, price_vs_playtime, owners_by_tag
 
 # Set dynamic paths to processed data and output database
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "data", "processed"))
 DB_PATH = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "data", "steam.sqlite"))
 
-# Specify input files for cleaned metadata and game descriptions
-metadata_file = os.path.normpath(os.path.join(DATA_DIR, "steam_data_cleaned.csv"))
-descr_file = os.path.normpath(os.path.join(DATA_DIR, "steam_description_data_cleaned.csv"))
-votes_file = os.path.normpath(os.path.join(DATA_DIR, "steamspy_tag_data_cleaned.csv"))
-media_file = os.path.join(DATA_DIR, "steam_media_cleaned.csv")
-
-# Load CSVs into DataFrames
-metadata_df = pd.read_csv(metadata_file)
-descr_df = pd.read_csv(descr_file)
-votes_df = pd.read_csv(votes_file)
-media_df = pd.read_csv(media_file)
-
-# Create a function to split semicolon-delimited strings
-def split_string(str_to_split):
-    if pd.isna(str_to_split):
-        return []
-    return str_to_split.split(";")
-
-# Parse columns with semicolon-separated strings into lists
-metadata_df["categories_list"] = metadata_df["categories"].apply(split_string)
-
-metadata_df["genres_list"] = metadata_df["genres"].apply(split_string)
-
-metadata_df["platforms_list"] = metadata_df["platforms"].apply(split_string)
-
-metadata_df["steamspy_tags_list"] = metadata_df["steamspy_tags"].apply(split_string)
-
-# Collect all unique values across games
-all_categories = set()
-
-for categories in metadata_df["categories_list"]:
-    for cat in categories:
-        cat = cat.strip()
-        if cat:
-            all_categories.add(cat)
-
-
-all_genres = set()
-
-for genres in metadata_df["genres_list"]:
-    for genre in genres:
-        genre = genre.strip()
-        if genre:
-            all_genres.add(genre)
-
-
-all_platforms = set()
-
-for plats in metadata_df["platforms_list"]:
-    for p in plats:
-        p = p.strip()
-        if p:
-            all_platforms.add(p)
-## Tags from semicolon-separated steamspy_tags column
-metadata_tags = set()
-for tags in metadata_df["steamspy_tags_list"]:
-    for tag in tags:
-        tag = tag.strip()
-        if tag:
-            metadata_tags.add(tag)
-
-## Tags from votes CSV (column names, excluding 'appid')
-csv_tags = set(votes_df.columns) - {"appid"}
-
-## Combine tags from both sources
-all_tags = metadata_tags.union(csv_tags)
-
-# Create a lookup dictionary: value name to numeric ID
-category_to_id = {name: idx + 1 for idx, name in enumerate(sorted(all_categories))}
-
-genre_to_id = {name: idx + 1 for idx, name in enumerate(sorted(all_genres))}
-
-platform_to_id = {name: idx + 1 for idx, name in enumerate(sorted(all_platforms))}
-
-tag_to_id = {name: idx + 1 for idx, name in enumerate(sorted(all_tags))}
-
-# Convert the lookup dictionaries into a DataFrames for export
-categories_df = pd.DataFrame([
-    {"category_id": cid, "category_name": name}
-    for name, cid in category_to_id.items()
-])
-
-genres_df = pd.DataFrame([
-    {"genre_id": gid, "genre_name": name}
-    for name, gid in genre_to_id.items()
-])
-
-platforms_df = pd.DataFrame([
-    {"platform_id": pid, "platform_name": name}
-    for name, pid in platform_to_id.items()
-])
-
-tags_df = pd.DataFrame([
-    {"tag_id": tid, "tag_name": name}
-    for name, tid in tag_to_id.items()
-])
-
-# Construct the many-to-many junction tables linking each game to its category, genre, platform and tag IDs
-game_categories_records = []
-
-for _, row in metadata_df.iterrows():
-    appid = row["appid"]
-    for cat in row["categories_list"]:
-        cat = cat.strip()
-        if cat:
-            category_id = category_to_id[cat]
-            game_categories_records.append((appid, category_id))
-
-game_categories_df = pd.DataFrame(
-    game_categories_records,
-    columns=["appid", "category_id"]
-)
-
-
-game_genres_records = []
-
-for _, row in metadata_df.iterrows():
-    appid = row["appid"]
-    for genre in row["genres_list"]:
-        genre = genre.strip()
-        if genre:
-            genre_id = genre_to_id[genre]
-            game_genres_records.append((appid, genre_id))
-
-game_genres_df = pd.DataFrame(
-    game_genres_records,
-    columns=["appid", "genre_id"]
-)
-
-
-game_platforms_records = []
-
-for _, row in metadata_df.iterrows():
-    appid = row["appid"]
-    for platform in row["platforms_list"]:
-        platform = platform.strip()
-        if platform:
-            pid = platform_to_id[platform]
-            game_platforms_records.append((appid, pid))
-
-game_platforms_df = pd.DataFrame(
-    game_platforms_records,
-    columns=["appid", "platform_id"]
-)
-
-
-game_tags_records = []
-
-for _, row in metadata_df.iterrows():
-    appid = row["appid"]
-    for tag in row["steamspy_tags_list"]:
-        tag = tag.strip()
-        if tag:
-            t_id = tag_to_id[tag]
-            game_tags_records.append((appid, t_id))
-
-game_steamspy_tags_df = pd.DataFrame(
-    game_tags_records,
-    columns=["appid", "steamspy_tag_id"]
-)
-
-# Merge description into metadata using matching game IDs
-games_df = metadata_df.merge(descr_df, left_on="appid", right_on="steam_appid", how="left")
-
-# Remove duplicate key column after merge
-games_df.drop(columns=["steam_appid"], inplace=True)
-
-# Select final subset of columns for export to SQLite
-games_df = games_df[[
-    "appid",
-    "name",
-    "release_date",
-    "developer",
-    "publisher",
-    "english",
-    "short_description",
-    "price"
-]]
-
-ratings_df = metadata_df[[
-    "appid",
-    "positive_ratings",
-    "negative_ratings",
-    "average_playtime",
-    "median_playtime",
-    "owners",
-    "achievements",
-    "required_age"
-]]
-
-# Melt the wide votes_df into a long table df
-votes_long_df = votes_df.melt(
-    id_vars="appid",
-    var_name="tag_name",
-    value_name="vote_count"
-)
-# Drop entries where a game has 0 votes for a tag
-votes_nonzero_df = votes_long_df[votes_long_df["vote_count"] > 0]
-
-# Merge tags_df with votes_nonzero_df on "tag_name" column
-votes_with_id_df = votes_nonzero_df.merge(
-    tags_df,
-    on="tag_name",
-    how="left"
-)
-
-# Select final subset of columns for steamspy votes to export to SQLite
-steamspy_votes_df = votes_with_id_df[[
-    "appid", 
-    "tag_id", 
-    "vote_count"
-]]
-# Rename "steam_appid" column in media_df to "appid"
-media_df.rename(columns={"steam_appid": "appid"}, inplace=True)
-
-# Connect to database and export DataFrame as table
-conn = sqlite3.connect(DB_PATH)
-
-games_df.to_sql("games", conn, index=False, if_exists="replace")
-
-ratings_df.to_sql("ratings", conn, index=False, if_exists="replace")
-
-categories_df.to_sql("categories", conn, index=False, if_exists="replace")
-game_categories_df.to_sql("game_categories", conn, index=False, if_exists="replace")
-
-genres_df.to_sql("genres", conn, index=False, if_exists="replace")
-game_genres_df.to_sql("game_genres", conn, index=False, if_exists="replace")
-
-platforms_df.to_sql("platforms", conn, index=False, if_exists="replace")
-game_platforms_df.to_sql("game_platforms", conn, index=False, if_exists="replace")
-
-tags_df.to_sql("steamspy_tags", conn, index=False, if_exists="replace")
-game_steamspy_tags_df.to_sql("game_steamspy_tags", conn, index=False, if_exists="replace")
-
-steamspy_votes_df.to_sql("steamspy_tag_votes", conn, index=False, if_exists="replace")
-
-media_df.to_sql("game_media", conn, index=False, if_exists="replace")
-
-conn.close()
\ No newline at end of file
+# The database is built next to the live file and swapped in with a single rename when complete
+BUILD_PATH = DB_PATH + ".building"
+
+# Specify processed datasets for cleaned metadata, game descriptions, tag votes and media
+# Each is read from Parquet or Feather (memory-mapped) when available, otherwise from CSV
+INPUT_DATASETS = {
+    "metadata": "steam_data_cleaned",
+    "descriptions": "steam_description_data_cleaned",
+    "votes": "steamspy_tag_data_cleaned",
+    "media": "steam_media_cleaned",
+}
+
+# Output tables grouped by the step that builds them, with the inputs each step reads
+TABLE_GROUPS = {
+    "games": {"inputs": ["metadata", "descriptions"], "tables": ["games"]},
+    "ratings": {"inputs": ["metadata"], "tables": ["ratings"]},
+    "categories": {"inputs": ["metadata"], "tables": ["categories", "game_categories"]},
+    "genres": {"inputs": ["metadata"], "tables": ["genres", "game_genres"]},
+    "platforms": {"inputs": ["metadata"], "tables": ["platforms", "game_platforms"]},
+    "tags": {"inputs": ["metadata", "votes"], "tables": ["steamspy_tags", "game_steamspy_tags", "steamspy_tag_votes", "similar_games"]},
+    "media": {"inputs": ["media"], "tables": ["game_media"]},
+    "analytics": {
+        "inputs": ["metadata"],
+        "tables": ["agg_releases_by_year_genre", "agg_rating_distribution", "agg_price_playtime", "agg_owners_by_tag"],
+    },
+}
+
+def explode_multi_valued(df, column, key="appid"):
+    """
+    Split a semicolon-delimited column into one (key, value) row per non-empty, stripped value.
+    Row order follows the source rows and the order of values within each cell.
+    """
+    exploded = df[[key]].assign(value=df[column].str.split(";")).explode("value")
+    exploded["value"] = exploded["value"].str.strip()
+    return exploded[exploded["value"].notna() & (exploded["value"] != "")]
+
+def build_dimension_and_junction(df, column, id_column, name_column, junction_id_column=None, extra_names=()):
+    """
+    Build a dimension table (sorted unique values numbered from 1) and a game-to-value junction table
+    from a semicolon-delimited column.
+
+    Parameters:
+    df (pd.DataFrame): Source rows with an 'appid' column.
+    column (str): The multi-valued column to explode.
+    id_column (str): Name of the ID column in the dimension table.
+    name_column (str): Name of the value column in the dimension table.
+    junction_id_column (str): Name of the ID column in the junction table. Defaults to id_column.
+    extra_names (iterable): Additional values to include in the dimension even if no game uses them.
+
+    Returns:
+    tuple: (dimension_df, junction_df)
+    """
+    exploded = explode_multi_valued(df, column)
+
+    # Number all distinct values in sorted order, starting from 1
+    all_names = pd.concat([exploded["value"], pd.Series(list(extra_names), dtype=exploded["value"].dtype)])
+    _, uniques = pd.factorize(all_names, sort=True)
+
+    dimension_df = pd.DataFrame({
+        id_column: range(1, len(uniques) + 1),
+        name_column: list(uniques)
+    })
+
+    junction_df = pd.DataFrame({
+        "appid": exploded["appid"].to_numpy(),
+        junction_id_column or id_column: uniques.get_indexer(exploded["value"]) + 1
+    })
+
+    return dimension_df, junction_df.drop_duplicates()
+
+def build_games(frames):
+    # Merge description into metadata using matching game IDs
+    games_df = frames["metadata"].merge(frames["descriptions"], left_on="appid", right_on="steam_appid", how="left")
+
+    # Remove duplicate key column after merge
+    games_df.drop(columns=["steam_appid"], inplace=True)
+
+    # Parse release dates once here so the web app never has to - malformed or missing dates become NULL
+    release = games_df["release_date"]
+    if not pd.api.types.is_datetime64_any_dtype(release):
+        release = pd.to_datetime(release, format="%Y-%m-%d", errors="coerce")
+
+    # Store ISO text, day number since 1970-01-01 and year for range queries, plus ready-made display strings
+    games_df["release_date"] = release.dt.strftime("%Y-%m-%d")
+    games_df["release_epoch_day"] = (release - pd.Timestamp("1970-01-01")).dt.days.astype("Int64")
+    games_df["release_year"] = release.dt.year.astype("Int64")
+    games_df["release_month_label"] = release.dt.strftime("%B %Y").fillna("Unknown")
+    games_df["release_date_label"] = release.dt.strftime("%d %B, %Y").fillna("Unknown")
+
+    # Select final subset of columns for export to SQLite, one row per game
+    games_df = games_df[[
+        "appid",
+        "name",
+        "release_date",
+        "release_epoch_day",
+        "release_year",
+        "release_month_label",
+        "release_date_label",
+        "developer",
+        "publisher",
+        "english",
+        "short_description",
+        "price"
+    ]]
+
+    return {"games": games_df.drop_duplicates(subset="appid")}
+
+def build_ratings(frames):
+    ratings_df = frames["metadata"][[
+        "appid",
+        "positive_ratings",
+        "negative_ratings",
+        "average_playtime",
+        "median_playtime",
+        "owners",
+        "achievements",
+        "required_age"
+    ]]
+
+    return {"ratings": ratings_df.drop_duplicates(subset="appid")}
+
+def build_categories(frames):
+    categories_df, game_categories_df = build_dimension_and_junction(
+        frames["metadata"], "categories", "category_id", "category_name"
+    )
+    return {"categories": categories_df, "game_categories": game_categories_df}
+
+def build_genres(frames):
+    genres_df, game_genres_df = build_dimension_and_junction(
+        frames["metadata"], "genres", "genre_id", "genre_name"
+    )
+    return {"genres": genres_df, "game_genres": game_genres_df}
+
+def build_platforms(frames):
+    platforms_df, game_platforms_df = build_dimension_and_junction(
+        frames["metadata"], "platforms", "platform_id", "platform_name"
+    )
+    return {"platforms": platforms_df, "game_platforms": game_platforms_df}
+
+def build_tags(frames):
+    votes_df = frames["votes"]
+
+    ## Tags come from the semicolon-separated steamspy_tags column plus the votes CSV column names (excluding 'appid')
+    tags_df, game_steamspy_tags_df = build_dimension_and_junction(
+        frames["metadata"], "steamspy_tags", "tag_id", "tag_name",
+        junction_id_column="steamspy_tag_id",
+        extra_names=[column for column in votes_df.columns if column != "appid"]
+    )
+
+    # Pull the non-zero votes straight out of the wide table as a sparse matrix, keyed by tag ID
+    tag_ids = tags_df.set_index("tag_name")["tag_id"]
+    vote_matrix = votes_to_csr(votes_df, tag_ids)
+
+    # Save the matrix for analytics that memory-map it directly
+    save_tag_vote_matrix(vote_matrix, staging_dir(TAG_VOTES_DIR))
+
+    # Expand to (appid, tag_id, vote_count) rows for steamspy votes to export to SQLite
+    steamspy_votes_df = csr_to_long(vote_matrix)
+
+    # Top-K nearest neighbours by TF-IDF weighted tag votes for the "similar games" panel
+    try:
+        similar_games_df = top_k_neighbours(vote_matrix)
+    except ImportError:
+        print("Skipped similar games: SciPy is not installed")
+        similar_games_df = pd.DataFrame(columns=["appid", "rank", "neighbour_appid"])
+
+    return {
+        "steamspy_tags": tags_df,
+        "game_steamspy_tags": game_steamspy_tags_df,
+        "steamspy_tag_votes": steamspy_votes_df,
+        "similar_games": similar_games_df,
+    }
+
+def build_media(frames):
+    # Rename "steam_appid" column in media_df to "appid"
+    media_df = frames["media"].rename(columns={"steam_appid": "appid"})
+    return {"game_media": media_df.drop_duplicates(subset="appid")}
+
+def build_analytics(frames):
+    # Precompute the chart data so the web app only reads small summary tables
+    metadata_df = frames["metadata"].drop_duplicates(subset="appid")
+    genre_pairs = explode_multi_valued(metadata_df, "genres")
+    tag_pairs = explode_multi_valued(metadata_df, "steamspy_tags")
+
+    return {
+        "agg_releases_by_year_genre": releases_by_year_genre(metadata_df, genre_pairs),
+        "agg_rating_distribution": rating_distribution(metadata_df, genre_pairs),
+        "agg_price_playtime": price_vs_playtime(metadata_df),
+        "agg_owners_by_tag": owners_by_tag(metadata_df, tag_pairs),
+    }
+
+GROUP_BUILDERS = {
+    "games": build_games,
+    "ratings": build_ratings,
+    "categories": build_categories,
+    "genres": build_genres,
+    "platforms": build_platforms,
+    "tags": build_tags,
+    "media": build_media,
+    "analytics": build_analytics,
+}
+
+def fingerprint(path, previous=None):
+    """
+    Return (size, mtime_ns, sha256) for an input file.
+    The hash is reused from the previous manifest entry when size and mtime are unchanged.
+    """
+    stat = os.stat(path)
+    if previous is not None and previous[0] == stat.st_size and previous[1] == stat.st_mtime_ns:
+        return previous
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return (stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+
+def read_manifest(conn):
+    conn.execute(MANIFEST_SCHEMA)
+    rows = conn.execute("SELECT input_name, size, mtime_ns, sha256 FROM build_manifest").fetchall()
+    return {name: (size, mtime_ns, sha256) for name, size, mtime_ns, sha256 in rows}
+
+def write_manifest(conn, fingerprints):
+    built_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    conn.execute(MANIFEST_SCHEMA)
+    conn.executemany(
+        "INSERT OR REPLACE INTO build_manifest (input_name, size, mtime_ns, sha256, built_at) VALUES (?, ?, ?, ?, ?)",
+        [(name, *fp, built_at) for name, fp in fingerprints.items()]
+    )
+
+def table_exists(conn, table_name):
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)).fetchone()
+    return row is not None
+
+def table_is_current(conn, table_name):
+    """
+    True if the table exists with exactly the definition in schema_ddl.
+    Tables from an older schema are rebuilt rather than upserted.
+    """
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)).fetchone()
+    return row is not None and row[0].strip() == TABLE_SCHEMAS[table_name].strip()
+
+def upsert_changed_rows(conn, table_name, new_df):
+    """
+    Replace only the keys whose rows differ between the stored table and new_df.
+
+    Returns:
+    int: Number of keys deleted or rewritten.
+    """
+    key = TABLE_KEYS[table_name]
+    old_df = pd.read_sql(f"SELECT * FROM {table_name}", conn)[list(new_df.columns)]
+
+    # Rows present on only one side mark their key as changed
+    merged = old_df.merge(new_df.astype(old_df.dtypes.to_dict(), errors="ignore"), how="outer", indicator=True)
+    changed_keys = merged.loc[merged["_merge"] != "both", key].unique().tolist()
+
+    if changed_keys:
+        conn.executemany(f"DELETE FROM {table_name} WHERE {key} = ?", [(k,) for k in changed_keys])
+        bulk_insert(conn, table_name, new_df[new_df[key].isin(changed_keys)])
+
+    return len(changed_keys)
+
+def build_fts_index(conn):
+    # Build an FTS5 full-text index over the searchable game text, keyed by appid as rowid
+    try:
+        conn.execute("DROP TABLE IF EXISTS games_fts")
+        conn.execute("""
+            CREATE VIRTUAL TABLE games_fts USING fts5(
+                name, developer, publisher, short_description,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+        """)
+        conn.execute("""
+            INSERT INTO games_fts (rowid, name, developer, publisher, short_description)
+            SELECT appid, name, developer, publisher, short_description FROM games
+        """)
+        conn.execute("INSERT INTO games_fts (games_fts) VALUES ('optimize')")
+    except sqlite3.OperationalError as e:
+        # FTS5 is not compiled into this sqlite3 build - the app falls back to LIKE search
+        print(f"Skipped full-text index: {e}")
+
+def staging_dir(directory):
+    # Files saved alongside the database (facet bitsets, tag-vote matrix) are written to "<folder>.building"
+    # during a build and only moved into their folders right after the database swap
+    return directory + ".building"
+
+def swap_in_staged(directory):
+    """
+    Move every file staged for directory into it, one rename per file. manifest.json goes last,
+    since the app reloads the facet index when it changes.
+    """
+    staged = staging_dir(directory)
+    if not os.path.isdir(staged):
+        return
+
+    os.makedirs(directory, exist_ok=True)
+    for name in sorted(os.listdir(staged), key=lambda name: name == "manifest.json"):
+        os.replace(os.path.join(staged, name), os.path.join(directory, name))
+    os.rmdir(staged)
+
+def build(incremental=False, fmt=PROCESSED_FORMAT):
+    """
+    Build steam.sqlite from the processed datasets and atomically swap it into place.
+
+    Parameters:
+    incremental (bool): Rebuild only tables whose input files changed since the last build,
+                        rewriting just the changed keys. Otherwise rebuild everything.
+    fmt (str): Processed-layer format to read (see processed_io.find_processed).
+    """
+    # Resolve the inputs first, so an ambiguous processed layer fails before anything is written
+    input_paths = {name: find_processed(dataset, DATA_DIR, fmt) for name, dataset in INPUT_DATASETS.items()}
+
+    # Start from a copy of the live database for incremental builds, or from an empty file
+    if os.path.exists(BUILD_PATH):
+        os.remove(BUILD_PATH)
+    for directory in (FACETS_DIR, TAG_VOTES_DIR):
+        shutil.rmtree(staging_dir(directory), ignore_errors=True)
+    if incremental and os.path.exists(DB_PATH):
+        shutil.copy2(DB_PATH, BUILD_PATH)
+
+    writer = BulkWriter(BUILD_PATH)
+    conn = writer.conn
+    previous = read_manifest(conn)
+
+    # Fingerprint every input and work out which ones changed
+    fingerprints = {name: fingerprint(path, previous.get(name)) for name, path in input_paths.items()}
+    changed_inputs = {
+        name for name, fp in fingerprints.items()
+        if not incremental or previous.get(name, (None, None, None))[2] != fp[2]
+    }
+
+    groups = [
+        group for group, spec in TABLE_GROUPS.items()
+        if changed_inputs.intersection(spec["inputs"])
+        or not all(table_is_current(conn, table) for table in spec["tables"])
+    ]
+
+    if not groups:
+        print("All inputs unchanged - nothing to rebuild.")
+        writer.conn.close()
+        os.remove(BUILD_PATH)
+        return
+
+    # Load only the inputs the selected groups read
+    needed_inputs = {name for group in groups for name in TABLE_GROUPS[group]["inputs"]}
+    frames = {name: read_processed(input_paths[name]) for name in needed_inputs}
+
+    for group in groups:
+        for table_name, df in GROUP_BUILDERS[group](frames).items():
+            if incremental and table_is_current(conn, table_name):
+                with writer.transaction():
+                    changed = upsert_changed_rows(conn, table_name, df)
+                print(f"Updated '{table_name}': {changed} keys rewritten.")
+            else:
+                # Create the table from its explicit schema, append the data, then add indexes
+                writer.load_table(table_name, df)
+
+    with writer.transaction():
+        if "games" in groups or not table_exists(conn, "games_fts"):
+            build_fts_index(conn)
+
+        # Facet bitsets for the web app's faceted search
+        if {"games", "categories", "genres", "platforms", "tags"}.intersection(groups):
+            build_facet_index(conn, staging_dir(FACETS_DIR))
+
+        write_manifest(conn, fingerprints)
+
+    # Collect statistics for the query planner and compact the file
+    writer.finish()
+
+    # Readers keep the old file open until they reconnect - they never see a half-built database.
+    # The staged side files follow straight after, so no build leaves them half-written either
+    os.replace(BUILD_PATH, DB_PATH)
+    for directory in (FACETS_DIR, TAG_VOTES_DIR):
+        swap_in_staged(directory)
+    print(f"Swapped new database into {DB_PATH}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the steam.sqlite database from the processed datasets.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only rebuild tables whose input files changed since the last build")
+    parser.add_argument("--format", choices=list(FORMAT_EXTENSIONS), default=PROCESSED_FORMAT,
+                        help=f"processed-layer format to read (default: {PROCESSED_FORMAT})")
+    args = parser.parse_args()
+
+    build(incremental=args.incremental, fmt=args.format)
@@ -1,20 +1,77 @@
+import os
+import re
+import html
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup
 
+
+def strip_html(text, parser="html.parser"):
+    """
+    Convert raw HTML content into plain text.
+    Defined at module level so it can be sent to worker processes.
+    """
+    # Safely convert value to string in case it's None or not a string
+    soup = BeautifulSoup(str(text), parser)
+
+    # Extract text content, remove tags, and clean whitespace
+    return soup.get_text(separator=' ', strip=True)
+
+
+# Comments, and <script>/<style> elements with their bodies, which BeautifulSoup leaves out of get_text()
+# (an unclosed one runs to the end of the text, as it does for html.parser)
+HIDDEN_PATTERN = re.compile(
+    r"<!--.*?(?:-->|$)|<(script|style)\b(?:[^>\"']|\"[^\"]*\"|'[^']*')*>.*?(?:</\1\s*>|$)",
+    re.IGNORECASE | re.DOTALL
+)
+# Tags only start with a letter, /, ! or ?, so a bare "a < b" is text; quoted attribute values may contain >
+TAG_PATTERN = re.compile(r"</?[A-Za-z](?:[^>\"']|\"[^\"]*\"|'[^']*')*>|<[!?][^>]*>")
+
+def strip_html_regex(text):
+    """
+    Approximate strip_html without BeautifulSoup: drop comments, scripts and styles, split on tags,
+    unescape entities, strip each text fragment and join the non-empty ones with spaces.
+    Matches html.parser on the cases in tests/test_cleaning_utils.py. Known differences: an unknown
+    entity such as "&bogus;" keeps its semicolon, and malformed markup html.parser recovers from in
+    its own way (a tag left open at the end of the text, an unterminated quoted attribute) may differ.
+    """
+    fragments = (
+        html.unescape(fragment).strip()
+        for fragment in TAG_PATTERN.split(HIDDEN_PATTERN.sub("<br>", str(text)))
+    )
+    return ' '.join(fragment for fragment in fragments if fragment)
+
+
 class SteamDataCleaner:
     """
     A utility class for cleaning Steam dataset CSVs using standardized methods.
     Designed for flexible, reusable data cleaning across different sources.
     """
-    def __init__(self, df):
+    def __init__(self, df, copy=True):
         """
         Initialize the cleaner with a Pandas DataFrame.
         
         Parameters:
         df (pd.DataFrame): The raw dataframe to be cleaned.
+        copy (bool): Work on a copy of df. Pass False to clean df in place and avoid doubling peak memory.
         """
-        self.df = df.copy()
+        self.df = df.copy() if copy else df
         self.log = []
+        # Per-cell transforms run in-process unless use_process_pool() is called
+        self.workers = 1
+        self.worker_chunksize = 500
+        # Running totals behind each log entry, keyed by (message template, fields) so logs can be merged
+        self.log_counts = {}
+
+    def _log_change(self, template, count, **fields):
+        """
+        Record a cleaning action in the log and add its count to the running totals.
+        """
+        key = (template, tuple(sorted(fields.items())))
+        self.log_counts[key] = self.log_counts.get(key, 0) + count
+        self.log.append(template.format(count=count, **fields))
     
     # Return self with the following methods to allow method chaining
 
@@ -41,7 +98,7 @@ class SteamDataCleaner:
         dropped = before - after
 
         if dropped > 0:
-            self.log.append(f"Dropped {dropped} duplicate rows.")
+            self._log_change("Dropped {count} duplicate rows.", dropped)
 
         return self
     
@@ -69,13 +126,15 @@ class SteamDataCleaner:
 
                 # Log any changes made
                 if filled > 0:
-                    self.log.append(f"Filled {filled} missing values in '{column}' with '{value}'.")
+                    self._log_change("Filled {count} missing values in '{column}' with '{value}'.", filled, column=column, value=value)
 
         return self
 
     def clean_text_column(self, columns):
         """
         Clean text in one or more columns: strip whitespace, remove newlines, and convert to lowercase.
+        All columns are cleaned together in a single vectorised pass and written back in place.
+        Missing values are left missing.
         
         Parameters:
         column (str or list): The column(s) to clean text values for.
@@ -85,29 +144,76 @@ class SteamDataCleaner:
         """
         if isinstance(columns, str):
             columns = [columns]
-        
-        for column in columns:
-            if column in self.df.columns:
-                before = self.df[column].copy()
-                cleaned = (
-                    self.df[column]
-                    .astype(str)
-                    .str.strip()
-                    .str.replace('\n', ' ', regex = False)
-                    .str.lower()
-                )
-                changed = (cleaned != before).sum()
-                if changed > 0:
-                    self.log.append(f"Cleaned text in '{column}': {changed} rows affected.")
+
+        columns = [column for column in columns if column in self.df.columns]
+        if not columns:
+            return self
+
+        # Gather the non-missing values of every column into one flat array
+        masks = [self.df[column].notna().to_numpy() for column in columns]
+        originals = np.concatenate([
+            self.df[column].to_numpy(dtype=object)[mask] for column, mask in zip(columns, masks)
+        ])
+
+        cleaned = (
+            pd.Series(originals, dtype=object)
+            .astype(str)
+            .str.strip()
+            .str.replace('\n', ' ', regex = False)
+            .str.lower()
+            .to_numpy(dtype=object)
+        )
+
+        # Count changed cells per column from one element-wise comparison
+        column_codes = np.repeat(np.arange(len(columns)), [mask.sum() for mask in masks])
+        changed_counts = np.bincount(column_codes, weights=(cleaned != originals), minlength=len(columns))
+
+        # Split the cleaned values back out and write them into their columns
+        offsets = np.cumsum([mask.sum() for mask in masks])[:-1]
+        for column, mask, values, changed in zip(columns, masks, np.split(cleaned, offsets), changed_counts):
+            self.df.loc[mask, column] = values
+            if changed > 0:
+                self._log_change("Cleaned text in '{column}': {count} rows affected.", int(changed), column=column)
                 
         return self
 
-    def remove_html_from_column(self, columns):
+    def use_process_pool(self, workers=None, chunksize=500):
+        """
+        Run per-cell transforms (such as HTML stripping) across a pool of worker processes.
+        Output order is always the same as the input order.
+
+        Parameters:
+        workers (int): Number of worker processes. Default is the machine's CPU count.
+        chunksize (int): Number of cells sent to a worker at a time.
+
+        Returns:
+        self
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.worker_chunksize = chunksize
+        return self
+
+    def _map_cells(self, values, func):
+        """
+        Apply func to every value, in worker processes if a pool is configured and there is enough work.
+        """
+        if self.workers <= 1 or len(values) <= self.worker_chunksize:
+            return [func(value) for value in values]
+
+        # Executor.map yields results in input order, so the output is deterministic
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(func, values, chunksize=self.worker_chunksize))
+
+    def remove_html_from_column(self, columns, parser="html.parser"):
         """
         Strip HTML tags from one or more columns using BeautifulSoup.
+        Missing values are left missing.
 
         Parameters:
         column (str or list): Column(s) containing HTML content.
+        parser (str): 'html.parser' (default), 'lxml' for BeautifulSoup's faster lxml backend,
+                      or 'regex' for a fast tag-splitting approximation without BeautifulSoup
+                      (see strip_html_regex for where it differs).
 
         Returns:
         self
@@ -115,24 +221,27 @@ class SteamDataCleaner:
         if isinstance(columns, str):
             columns = [columns]
 
-        def strip_html(text):
-            """
-            Convert raw HTML content into plain text.
-            """
-            # Safely convert value to string in case it's None or not a string
-            soup = BeautifulSoup(str(text), "html.parser")
-            
-            # Extract text content, remove tags, and clean whitespace
-            return soup.get_text(separator=' ', strip=True)
-        
+        func = strip_html_regex if parser == "regex" else partial(strip_html, parser=parser)
+
         for column in columns:
             if column in self.df.columns:
-                # Apply the strip_html function to each cell in the column
-                before = self.df[column].copy()
-                stripped = self.df[column].apply(strip_html)
+                # Missing values are left missing, so a later fill_missing still sees them
+                present = self.df[column].notna()
+                if not present.any():
+                    continue
+                before = self.df.loc[present, column]
+                text = before.map(str)
+
+                # Cells with no markup or entities only need whitespace stripped - skip the parser for them
+                needs_parsing = text.str.contains("<", regex=False) | text.str.contains("&", regex=False)
+                stripped = text.str.strip()
+                parsed = self._map_cells(text[needs_parsing].tolist(), func)
+                stripped[needs_parsing] = pd.Series(parsed, index=text.index[needs_parsing], dtype=stripped.dtype)
+
                 changed = (stripped != before).sum()
+                self.df.loc[present, column] = stripped
                 if changed > 0:
-                    self.log.append(f"Removed HTML from '{column}': {changed} rows cleaned.")
+                    self._log_change("Removed HTML from '{column}': {count} rows cleaned.", changed, column=column)
 
         return self
     
@@ -159,7 +268,7 @@ class SteamDataCleaner:
                 self.df[column] = converted.fillna(0)
 
                 if new_nans > 0:
-                    self.log.append(f"Converted '{column}' to numeric: {new_nans} entries replaced with 0.")
+                    self._log_change("Converted '{column}' to numeric: {count} entries replaced with 0.", new_nans, column=column)
 
         return self
     
@@ -192,8 +301,110 @@ class SteamDataCleaner:
                 self.df[column] = converted
 
                 if new_nats > 0:
-                    self.log.append(f"Converted '{column}' to datetime: {new_nats} entries became NaT.")
+                    self._log_change("Converted '{column}' to datetime: {count} entries became NaT.", new_nats, column=column)
+
+
+        return self
+
+    def _split_owners(self):
+        """
+        Parse 'owners' ranges such as "20000-50000" into integer 'owners_low' and 'owners_high' columns
+        placed right after it. Unparseable ranges become 0 in both.
+        """
+        bounds = (
+            self.df["owners"].astype(str)
+            .str.replace(",", "", regex=False)
+            .str.split("-", n=1, expand=True)
+            .reindex(columns=[0, 1])
+        )
+        low = pd.to_numeric(bounds[0].str.strip(), errors="coerce")
+        high = pd.to_numeric(bounds[1].str.strip(), errors="coerce")
+        unparsed = low.isna() | high.isna()
+
+        position = self.df.columns.get_loc("owners")
+        for offset, (name, values) in enumerate([("owners_low", low), ("owners_high", high)], start=1):
+            values = pd.to_numeric(values.where(~unparsed, 0).astype("int64"), downcast="integer")
+            if name in self.df.columns:
+                self.df[name] = values
+            else:
+                self.df.insert(position + offset, name, values)
+
+        if unparsed.sum() > 0:
+            self._log_change("Parsed 'owners' ranges: {count} unparseable entries set to 0.", int(unparsed.sum()))
+
+    @staticmethod
+    def _smallest_dtype(series, category_threshold):
+        """
+        Return series converted to the smallest dtype that holds its values exactly, or series unchanged.
+        """
+        dtype = series.dtype
+
+        if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype):
+            return series
+
+        # Only plain NumPy numerics - nullable extension types are left alone
+        if isinstance(dtype, np.dtype) and pd.api.types.is_integer_dtype(dtype):
+            return pd.to_numeric(series, downcast="integer")
+
+        if isinstance(dtype, np.dtype) and pd.api.types.is_float_dtype(dtype):
+            values = series.to_numpy()
+            # Whole numbers (as left by fillna(0) on integer columns) become integers if they fit exactly
+            if np.isfinite(values).all() and (values == np.round(values)).all() and np.abs(values).max(initial=0) < 2 ** 53:
+                return pd.to_numeric(series.astype("int64"), downcast="integer")
+            # float32 only when every value survives the round trip, so prices like 9.99 stay float64
+            as_float32 = values.astype(np.float32)
+            if np.array_equal(as_float32.astype(values.dtype), values, equal_nan=True):
+                return series.astype("float32")
+            return series
+
+        if isinstance(dtype, pd.CategoricalDtype):
+            return series
+
+        if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            if len(series) > 0 and series.nunique(dropna=True) <= category_threshold * len(series):
+                return series.astype("category")
+
+        return series
+
+    def optimize_dtypes(self, columns=None, category_threshold=0.5):
+        """
+        Shrink the dataframe in memory: downcast numeric columns to the smallest int/float that holds their
+        values exactly, store low-cardinality text columns as categoricals, and parse 'owners' ranges
+        ("20000-50000") into integer 'owners_low' and 'owners_high' columns.
+
+        Parameters:
+        columns (str or list): Column(s) to optimize. Default is every column.
+        category_threshold (float): Text columns with at most this share of distinct values become categoricals.
+
+        Returns:
+        self
+        """
+        if columns is None:
+            columns = list(self.df.columns)
+        elif isinstance(columns, str):
+            columns = [columns]
+        columns = [column for column in columns if column in self.df.columns]
+
+        memory_before = self.df.memory_usage(deep=True).sum()
+
+        # Parse the ranges while 'owners' is still text, before it can become a categorical
+        if "owners" in columns:
+            self._split_owners()
+
+        changed = 0
+        for column in columns:
+            optimized = self._smallest_dtype(self.df[column], category_threshold)
+            if optimized.dtype != self.df[column].dtype:
+                self.df[column] = optimized
+                changed += 1
+
+        memory_after = self.df.memory_usage(deep=True).sum()
 
+        if changed > 0:
+            self._log_change(
+                "Optimized dtypes of {count} columns: memory {before} -> {after}.", changed,
+                before=f"{memory_before / 1024 ** 2:.1f} MB", after=f"{memory_after / 1024 ** 2:.1f} MB"
+            )
 
         return self
 
@@ -226,3 +437,130 @@ class SteamDataCleaner:
         for entry in self.log:
             print(f"• {entry}")
 
+
+
+class StreamingSteamDataCleaner:
+    """
+    Apply SteamDataCleaner steps to a CSV chunk by chunk, for raw files too large to load at once.
+    Steps are recorded by chaining the same methods as SteamDataCleaner, then executed by run().
+    """
+    def __init__(self, csv_path, chunksize=50_000, usecols=None):
+        """
+        Initialize the streaming cleaner for a raw CSV file.
+
+        Parameters:
+        csv_path (str): Path to the raw CSV file.
+        chunksize (int): Number of rows read and cleaned at a time.
+        usecols (list): Raw columns to read. Columns not listed are never loaded.
+        """
+        self.csv_path = csv_path
+        self.chunksize = chunksize
+        self.usecols = usecols
+        self.steps = []
+        self.log = []
+        self.log_counts = {}
+
+    def _add_step(self, method_name, *args, **kwargs):
+        self.steps.append((method_name, args, kwargs))
+        return self
+
+    # Each method records the matching SteamDataCleaner step and returns self to allow method chaining
+
+    def standardise_columns(self):
+        return self._add_step("standardise_columns")
+
+    def drop_duplicates(self):
+        return self._add_step("drop_duplicates")
+
+    def fill_missing(self, columns, value='Unknown'):
+        return self._add_step("fill_missing", columns, value=value)
+
+    def clean_text_column(self, columns):
+        return self._add_step("clean_text_column", columns)
+
+    def remove_html_from_column(self, columns, parser="html.parser"):
+        return self._add_step("remove_html_from_column", columns, parser=parser)
+
+    def use_process_pool(self, workers=None, chunksize=500):
+        return self._add_step("use_process_pool", workers=workers, chunksize=chunksize)
+
+    def convert_to_numeric(self, columns):
+        return self._add_step("convert_to_numeric", columns)
+
+    def convert_to_datetime(self, columns):
+        return self._add_step("convert_to_datetime", columns)
+
+    # There is no optimize_dtypes step: each chunk is written straight to CSV, which keeps no dtypes
+
+    def _drop_global_duplicates(self, cleaner, seen_hashes):
+        """
+        Drop rows already seen in this chunk or any earlier chunk, using a 64-bit hash per row.
+        """
+        row_hashes = pd.util.hash_pandas_object(cleaner.df, index=False)
+        duplicated = row_hashes.duplicated() | row_hashes.isin(seen_hashes)
+        seen_hashes.update(row_hashes[~duplicated].tolist())
+
+        dropped = int(duplicated.sum())
+        if dropped > 0:
+            cleaner.df = cleaner.df[~duplicated.to_numpy()]
+            cleaner._log_change("Dropped {count} duplicate rows.", dropped)
+
+    def run(self, output_path):
+        """
+        Read, clean and append each chunk to output_path, then merge the per-chunk logs.
+
+        Parameters:
+        output_path (str): CSV file to write. It is overwritten if it already exists.
+
+        Returns:
+        self
+        """
+        seen_hashes = set()
+        rows_written = 0
+        chunk_count = 0
+
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
+        for chunk in pd.read_csv(self.csv_path, chunksize=self.chunksize, usecols=self.usecols):
+            # Each chunk is a fresh frame, so the cleaner can work on it without copying
+            cleaner = SteamDataCleaner(chunk, copy=False)
+
+            for method_name, args, kwargs in self.steps:
+                if method_name == "drop_duplicates":
+                    self._drop_global_duplicates(cleaner, seen_hashes)
+                else:
+                    getattr(cleaner, method_name)(*args, **kwargs)
+
+            cleaner.df.to_csv(output_path, mode="a", header=(chunk_count == 0), index=False)
+            rows_written += len(cleaner.df)
+            chunk_count += 1
+
+            for key, count in cleaner.log_counts.items():
+                self.log_counts[key] = self.log_counts.get(key, 0) + count
+
+        # Rebuild the log from the totals so each action appears once for the whole file
+        self.log = [template.format(count=count, **dict(fields)) for (template, fields), count in self.log_counts.items()]
+        print(f"Saved cleaned data to: {output_path} ({rows_written} rows)")
+
+        return self
+
+    def get_log(self):
+        """
+        Retrieve the merged log of cleaning performed across all chunks.
+
+        Returns:
+        list: A list of all data cleaning transformations.
+        """
+        return self.log
+
+    def print_log_summary(self):
+        """
+        Print a formatted summary of all logged cleaning actions.
+
+        Outputs:
+        Console printout of each log entry.
+        """
+        print("\n Cleaning Summary:")
+        for entry in self.log:
+            print(f"• {entry}")
@@ -0,0 +1,74 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# Precomputed facet bitsets for the web app's faceted search, one bit per game per facet value
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+FACETS_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "data", "facets"))
+
+# SQL returning (appid, value) pairs for each facet
+FACET_QUERIES = {
+    "genre": """
+        SELECT j.appid, d.genre_name AS value
+        FROM game_genres j JOIN genres d ON d.genre_id = j.genre_id
+    """,
+    "platform": """
+        SELECT j.appid, d.platform_name AS value
+        FROM game_platforms j JOIN platforms d ON d.platform_id = j.platform_id
+    """,
+    "category": """
+        SELECT j.appid, d.category_name AS value
+        FROM game_categories j JOIN categories d ON d.category_id = j.category_id
+    """,
+    "tag": """
+        SELECT j.appid, d.tag_name AS value
+        FROM game_steamspy_tags j JOIN steamspy_tags d ON d.tag_id = j.steamspy_tag_id
+    """,
+}
+
+
+def _save_array(directory, name, array):
+    path = os.path.join(directory, name + ".npy")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+
+
+def build_facet_index(conn, directory=FACETS_DIR):
+    """
+    Build one packed bitset per facet value over all games and save them for the app to load.
+
+    Files written:
+    appids.npy - sorted appids; bit i of every bitset refers to appids[i]
+    <facet>_bits.npy - uint8 array (n_values, ceil(n_games / 8)) of np.packbits rows
+    manifest.json - facet value names in row order, written last so the app reloads a complete set
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    appids = pd.read_sql("SELECT appid FROM games ORDER BY appid", conn)["appid"].to_numpy(dtype=np.int64)
+    _save_array(directory, "appids", appids)
+
+    manifest = {"n_games": len(appids), "facets": {}}
+
+    for facet, query in FACET_QUERIES.items():
+        pairs = pd.read_sql(query, conn)
+
+        # Only games present in the games table get a bit
+        positions = np.searchsorted(appids, pairs["appid"].to_numpy(dtype=np.int64))
+        positions = np.minimum(positions, max(len(appids) - 1, 0))
+        known = appids[positions] == pairs["appid"].to_numpy() if len(appids) else np.zeros(len(pairs), dtype=bool)
+
+        value_codes, values = pd.factorize(pairs["value"][known], sort=True)
+
+        bits = np.zeros((len(values), len(appids)), dtype=bool)
+        bits[value_codes, positions[known]] = True
+        _save_array(directory, f"{facet}_bits", np.packbits(bits, axis=1))
+
+        manifest["facets"][facet] = [str(value) for value in values]
+
+    tmp_path = os.path.join(directory, "manifest.json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, os.path.join(directory, "manifest.json"))
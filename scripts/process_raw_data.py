@@ -1,6 +1,7 @@
 import os
 import pandas as pd
-from cleaning_utils import SteamDataCleaner
+from cleaning_utils import SteamDataCleaner, StreamingSteamDataCleaner
+from processed_io import PROCESSED_FORMAT, write_processed
 
 # List of .csv file names
 
@@ -15,16 +16,23 @@ csv_files = [
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
+# Set to False to skip loading the full raw files into memory when only using the streaming cleaner below
+
+LOAD_RAW_DATAFRAMES = True
+
 # Generate a dynamic path for the .csv files and a dictionary with the dataframes
 
+raw_paths = {}
 dataframes = {}
 
 for file_name in csv_files:
     csv_path = os.path.normpath(os.path.join(current_dir, '..', 'data', 'raw', file_name))
-    df = pd.read_csv(csv_path)
 
     key = file_name.replace('.csv', '')
-    dataframes[key] = df
+    raw_paths[key] = csv_path
+
+    if LOAD_RAW_DATAFRAMES:
+        dataframes[key] = pd.read_csv(csv_path)
 
 # Function to save and export processed .csv files
 
@@ -42,6 +50,21 @@ def save_cleaned_csv(df, file_name):
     df.to_csv(file_path, index=False)
     print(f"Saved cleaned data to: {file_path}")
 
+# Format of the processed layer ('parquet', 'feather' or 'csv') comes from processed_io.PROCESSED_FORMAT,
+# which build_schema.py reads by default too - pass the same --format to it if you change fmt below
+
+def save_cleaned_data(df, dataset_name, fmt=PROCESSED_FORMAT):
+    """
+    Saves a cleaned DataFrame to the 'processed' folder with explicit dtypes (see processed_io.PROCESSED_DTYPES).
+
+    Parameters:
+    - df: pandas DataFrame to save
+    - dataset_name: name for the output file, without extension
+    - fmt: 'parquet' (default), 'feather' or 'csv'
+    """
+    file_path = write_processed(df, dataset_name, fmt)
+    print(f"Saved cleaned data to: {file_path}")
+
 # Brief raw data exploration
 
 for df_name, df in dataframes.items():
@@ -72,7 +95,23 @@ for df_name, df in dataframes.items():
 
 
 
-# save_cleaned_csv(clean_df, 'steam_description_data_cleaned.csv')
+# save_cleaned_data(clean_df, 'steam_description_data_cleaned')
+
+# Streaming alternative for the description file: cleans it chunk by chunk and reads only the needed columns,
+# so the detailed_description / about_the_game HTML blobs are never loaded
+
+# processed_description_path = os.path.normpath(os.path.join(current_dir, '..', 'data', 'processed', 'steam_description_data_cleaned.csv'))
+
+# streaming_cleaner = (
+#     StreamingSteamDataCleaner(raw_paths["steam_description_data"], chunksize=20_000, usecols=["steam_appid", "short_description"])
+#     .standardise_columns()
+#     .drop_duplicates()
+#     .remove_html_from_column("short_description")
+#     .clean_text_column("short_description")
+#     .fill_missing("short_description","No available description")
+#     .run(processed_description_path)
+# )
+# streaming_cleaner.print_log_summary()
 
 # cleaner_steam = SteamDataCleaner(dataframes["steam"])
 # list_of_columns = cleaner_steam.df.columns.values.tolist()
@@ -85,11 +124,12 @@ for df_name, df in dataframes.items():
 #     .clean_text_column(['name', 'developer', 'publisher', 'platforms', 'categories', 'genres', 'steamspy_tags'])
 #     .convert_to_numeric(['english', 'required_age', 'achievements', 'positive_ratings', 'negative_ratings', 'average_playtime', 'median_playtime', 'price'])
 #     .convert_to_datetime('release_date')
+#     .optimize_dtypes()
 # )
 # clean_df_object.print_log_summary()
 # clean_df = clean_df_object.get_df()
 
-# save_cleaned_csv(clean_df, 'steam_data_cleaned.csv')
+# save_cleaned_data(clean_df, 'steam_data_cleaned')
 
 
 
@@ -107,7 +147,7 @@ for df_name, df in dataframes.items():
 # columns_to_drop = ['screenshots', 'background', 'movies']
 # clean_df.drop(columns=columns_to_drop, axis="columns", inplace=True)
 
-# save_cleaned_csv(clean_df, 'steam_media_cleaned.csv')
+# save_cleaned_data(clean_df, 'steam_media_cleaned')
 
 
 # cleaner_steamspy_tag = SteamDataCleaner(dataframes["steamspy_tag_data"])
@@ -119,10 +159,11 @@ for df_name, df in dataframes.items():
 #     cleaner_steamspy_tag
 #     .fill_missing(columns=list_of_columns)
 #     .convert_to_numeric(columns=list_of_columns)
+#     .optimize_dtypes()
 # )
 
 # clean_df_object.print_log_summary()
 # clean_df = clean_df_object.get_df()
 
-# save_cleaned_csv(clean_df,'steamspy_tag_data_cleaned.csv')
+# save_cleaned_data(clean_df, 'steamspy_tag_data_cleaned')
 
@@ -0,0 +1,177 @@
+import os
+import numpy as np
+import pandas as pd
+
+# Shared location of the processed layer written by process_raw_data.py and read by build_schema.py
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROCESSED_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "data", "processed"))
+
+# File extension for each supported processed-layer format
+FORMAT_EXTENSIONS = {
+    "parquet": ".parquet",
+    "feather": ".feather",
+    "csv": ".csv",
+}
+
+# Format process_raw_data.py writes and build_schema.py reads, unless told otherwise
+PROCESSED_FORMAT = "parquet"
+
+# Explicit dtypes for each processed dataset, so nothing is re-inferred between stages
+# Repeated strings are stored as categoricals; wide tag-vote columns default to int32
+PROCESSED_DTYPES = {
+    "steam_data_cleaned": {
+        "appid": "int64",
+        "name": "string",
+        "release_date": "datetime64[ns]",
+        "english": "int8",
+        "developer": "category",
+        "publisher": "category",
+        "platforms": "string",
+        "required_age": "int16",
+        "categories": "string",
+        "genres": "string",
+        "steamspy_tags": "string",
+        "achievements": "int32",
+        "positive_ratings": "int64",
+        "negative_ratings": "int64",
+        "average_playtime": "int64",
+        "median_playtime": "int64",
+        "owners": "category",
+        "owners_low": "int32",
+        "owners_high": "int32",
+        "price": "float64",
+    },
+    "steam_description_data_cleaned": {
+        "steam_appid": "int64",
+        "short_description": "string",
+    },
+    "steam_media_cleaned": {
+        "steam_appid": "int64",
+        "header_image": "string",
+    },
+    "steamspy_tag_data_cleaned": {
+        "appid": "int64",
+    },
+}
+
+DEFAULT_VOTE_DTYPE = "int32"
+
+
+def _is_narrower(current, declared):
+    """
+    True if current is a NumPy integer or float dtype smaller than the declared dtype of the same kind,
+    as left by SteamDataCleaner.optimize_dtypes().
+    """
+    if not isinstance(current, np.dtype) or current.kind not in "if" or declared in ("string", "category"):
+        return False
+    declared = np.dtype(declared)
+    return current.kind == declared.kind and current.itemsize < declared.itemsize
+
+
+def apply_processed_dtypes(df, dataset_name):
+    """
+    Cast a processed DataFrame to the explicit dtypes declared for its dataset.
+    Datetime columns are parsed with pd.to_datetime, turning unparseable dates ("Coming soon") into NaT.
+    Numeric columns already narrower than declared (see SteamDataCleaner.optimize_dtypes) keep their dtype,
+    so the declared dtypes only ever widen them.
+
+    Parameters:
+    df (pd.DataFrame): The cleaned DataFrame.
+    dataset_name (str): Dataset name without extension, e.g. 'steam_data_cleaned'.
+
+    Returns:
+    pd.DataFrame: The DataFrame with declared dtypes applied.
+    """
+    dtypes = PROCESSED_DTYPES.get(dataset_name, {})
+    casts = {column: dtype for column, dtype in dtypes.items() if column in df.columns}
+
+    # Every non-key column of the wide tag-vote table holds vote counts
+    if dataset_name == "steamspy_tag_data_cleaned":
+        casts.update({column: DEFAULT_VOTE_DTYPE for column in df.columns if column not in casts})
+
+    casts = {column: dtype for column, dtype in casts.items() if not _is_narrower(df[column].dtype, dtype)}
+
+    # astype raises on the first malformed date in a CSV, so datetimes are parsed leniently instead
+    dates = [column for column, dtype in casts.items() if str(dtype).startswith("datetime64")]
+    df = df.astype({column: dtype for column, dtype in casts.items() if column not in dates})
+    for column in dates:
+        df[column] = pd.to_datetime(df[column], errors="coerce").astype(casts[column])
+
+    return df
+
+
+def processed_path(dataset_name, fmt, directory=PROCESSED_DIR):
+    return os.path.join(directory, dataset_name + FORMAT_EXTENSIONS[fmt])
+
+
+def write_processed(df, dataset_name, fmt=PROCESSED_FORMAT, directory=PROCESSED_DIR):
+    """
+    Write a cleaned DataFrame to the processed layer with explicit dtypes.
+
+    Parameters:
+    df (pd.DataFrame): The cleaned DataFrame.
+    dataset_name (str): Dataset name without extension.
+    fmt (str): 'parquet' (default), 'feather' (Arrow IPC) or 'csv'.
+    directory (str): Output folder. Defaults to data/processed.
+
+    Returns:
+    str: Path of the written file.
+    """
+    path = processed_path(dataset_name, fmt, directory)
+    df = apply_processed_dtypes(df, dataset_name)
+
+    if fmt == "parquet":
+        df.to_parquet(path, index=False)
+    elif fmt == "feather":
+        df.reset_index(drop=True).to_feather(path)
+    elif fmt == "csv":
+        df.to_csv(path, index=False)
+    else:
+        raise ValueError(f"Unknown processed format: {fmt}")
+
+    return path
+
+
+def find_processed(dataset_name, directory=PROCESSED_DIR, fmt=PROCESSED_FORMAT):
+    """
+    Return the path of a processed dataset in the given format. A dataset that only exists in one
+    other format (such as the CSV-only media file) is read from that one instead.
+
+    Raises:
+    FileNotFoundError: If the dataset exists in no supported format.
+    ValueError: If the dataset is missing in fmt but exists in several other formats.
+    """
+    path = processed_path(dataset_name, fmt, directory)
+    if os.path.exists(path):
+        return path
+
+    existing = [
+        processed_path(dataset_name, other, directory) for other in FORMAT_EXTENSIONS
+        if os.path.exists(processed_path(dataset_name, other, directory))
+    ]
+    if not existing:
+        raise FileNotFoundError(f"No processed file found for '{dataset_name}' in {directory}")
+    if len(existing) > 1:
+        raise ValueError(
+            f"No {fmt} file for '{dataset_name}' in {directory}, and several other formats exist: "
+            f"{', '.join(os.path.basename(path) for path in existing)}. Pick one with --format."
+        )
+    return existing[0]
+
+
+def read_processed(path):
+    """
+    Read a processed dataset. Parquet and Feather files are memory-mapped; CSV files are cast to the declared dtypes.
+
+    Returns:
+    pd.DataFrame
+    """
+    dataset_name, extension = os.path.splitext(os.path.basename(path))
+
+    if extension == ".parquet":
+        return pd.read_parquet(path, memory_map=True)
+    if extension == ".feather":
+        # pandas.read_feather has no memory_map option, so go through pyarrow directly
+        from pyarrow import feather
+        return feather.read_table(path, memory_map=True).to_pandas()
+    return apply_processed_dtypes(pd.read_csv(path), dataset_name)
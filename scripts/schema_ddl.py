@@ -0,0 +1,204 @@
+# Explicit table definitions for steam.sqlite, used by build_schema.py in place of to_sql's inferred tables
+
+TABLE_SCHEMAS = {
+    "games": """
+        CREATE TABLE games (
+            appid INTEGER PRIMARY KEY,
+            name TEXT,
+            release_date TEXT,
+            release_epoch_day INTEGER,
+            release_year INTEGER,
+            release_month_label TEXT NOT NULL,
+            release_date_label TEXT NOT NULL,
+            developer TEXT,
+            publisher TEXT,
+            english INTEGER,
+            short_description TEXT,
+            price REAL
+        )
+    """,
+    "ratings": """
+        CREATE TABLE ratings (
+            appid INTEGER PRIMARY KEY,
+            positive_ratings INTEGER,
+            negative_ratings INTEGER,
+            average_playtime INTEGER,
+            median_playtime INTEGER,
+            owners TEXT,
+            achievements INTEGER,
+            required_age INTEGER
+        )
+    """,
+    "categories": """
+        CREATE TABLE categories (
+            category_id INTEGER PRIMARY KEY,
+            category_name TEXT NOT NULL UNIQUE
+        )
+    """,
+    "game_categories": """
+        CREATE TABLE game_categories (
+            appid INTEGER NOT NULL,
+            category_id INTEGER NOT NULL,
+            PRIMARY KEY (appid, category_id)
+        ) WITHOUT ROWID
+    """,
+    "genres": """
+        CREATE TABLE genres (
+            genre_id INTEGER PRIMARY KEY,
+            genre_name TEXT NOT NULL UNIQUE
+        )
+    """,
+    "game_genres": """
+        CREATE TABLE game_genres (
+            appid INTEGER NOT NULL,
+            genre_id INTEGER NOT NULL,
+            PRIMARY KEY (appid, genre_id)
+        ) WITHOUT ROWID
+    """,
+    "platforms": """
+        CREATE TABLE platforms (
+            platform_id INTEGER PRIMARY KEY,
+            platform_name TEXT NOT NULL UNIQUE
+        )
+    """,
+    "game_platforms": """
+        CREATE TABLE game_platforms (
+            appid INTEGER NOT NULL,
+            platform_id INTEGER NOT NULL,
+            PRIMARY KEY (appid, platform_id)
+        ) WITHOUT ROWID
+    """,
+    "steamspy_tags": """
+        CREATE TABLE steamspy_tags (
+            tag_id INTEGER PRIMARY KEY,
+            tag_name TEXT NOT NULL UNIQUE
+        )
+    """,
+    "game_steamspy_tags": """
+        CREATE TABLE game_steamspy_tags (
+            appid INTEGER NOT NULL,
+            steamspy_tag_id INTEGER NOT NULL,
+            PRIMARY KEY (appid, steamspy_tag_id)
+        ) WITHOUT ROWID
+    """,
+    "steamspy_tag_votes": """
+        CREATE TABLE steamspy_tag_votes (
+            appid INTEGER NOT NULL,
+            tag_id INTEGER NOT NULL,
+            vote_count INTEGER NOT NULL,
+            PRIMARY KEY (appid, tag_id)
+        ) WITHOUT ROWID
+    """,
+    # Each game's most similar games by tag votes, rank 1 first (see similar_games.py)
+    "similar_games": """
+        CREATE TABLE similar_games (
+            appid INTEGER NOT NULL,
+            rank INTEGER NOT NULL,
+            neighbour_appid INTEGER NOT NULL,
+            PRIMARY KEY (appid, rank)
+        ) WITHOUT ROWID
+    """,
+    "game_media": """
+        CREATE TABLE game_media (
+            appid INTEGER PRIMARY KEY,
+            header_image TEXT
+        )
+    """,
+    # Chart aggregates, keyed by the chart's filter value ('All' for the whole catalog) so each chart is one range lookup
+    "agg_releases_by_year_genre": """
+        CREATE TABLE agg_releases_by_year_genre (
+            genre_name TEXT NOT NULL,
+            release_year INTEGER NOT NULL,
+            game_count INTEGER NOT NULL,
+            PRIMARY KEY (genre_name, release_year)
+        ) WITHOUT ROWID
+    """,
+    "agg_rating_distribution": """
+        CREATE TABLE agg_rating_distribution (
+            genre_name TEXT NOT NULL,
+            bucket INTEGER NOT NULL,
+            bucket_low REAL NOT NULL,
+            bucket_high REAL NOT NULL,
+            game_count INTEGER NOT NULL,
+            PRIMARY KEY (genre_name, bucket)
+        ) WITHOUT ROWID
+    """,
+    "agg_price_playtime": """
+        CREATE TABLE agg_price_playtime (
+            price_band TEXT PRIMARY KEY,
+            band_order INTEGER NOT NULL,
+            game_count INTEGER NOT NULL,
+            mean_playtime REAL NOT NULL,
+            median_playtime REAL NOT NULL
+        ) WITHOUT ROWID
+    """,
+    "agg_owners_by_tag": """
+        CREATE TABLE agg_owners_by_tag (
+            tag_name TEXT NOT NULL,
+            owners TEXT NOT NULL,
+            owners_low INTEGER NOT NULL,
+            game_count INTEGER NOT NULL,
+            PRIMARY KEY (tag_name, owners_low)
+        ) WITHOUT ROWID
+    """,
+}
+
+# Secondary indexes, created once the tables are loaded
+# The junction tables are keyed (appid, x) - these cover lookups from the other side (x -> appids)
+INDEXES = {
+    "games": ["CREATE INDEX idx_games_release_year ON games (release_year, appid)"],
+    "game_categories": ["CREATE INDEX idx_game_categories_category ON game_categories (category_id, appid)"],
+    "game_genres": ["CREATE INDEX idx_game_genres_genre ON game_genres (genre_id, appid)"],
+    "game_platforms": ["CREATE INDEX idx_game_platforms_platform ON game_platforms (platform_id, appid)"],
+    "game_steamspy_tags": ["CREATE INDEX idx_game_steamspy_tags_tag ON game_steamspy_tags (steamspy_tag_id, appid)"],
+    "steamspy_tag_votes": ["CREATE INDEX idx_steamspy_tag_votes_tag ON steamspy_tag_votes (tag_id, vote_count, appid)"],
+}
+
+
+def create_table(conn, table_name):
+    """
+    Drop and recreate a table (and nothing else) from its explicit definition.
+    """
+    conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+    conn.execute(TABLE_SCHEMAS[table_name])
+
+
+def create_indexes(conn, table_name):
+    """
+    Create the secondary indexes declared for a table, if any.
+    """
+    for statement in INDEXES.get(table_name, []):
+        conn.execute(statement)
+
+
+# Column that identifies a unit of change in each table - incremental builds replace rows key by key
+TABLE_KEYS = {
+    "games": "appid",
+    "ratings": "appid",
+    "categories": "category_id",
+    "game_categories": "appid",
+    "genres": "genre_id",
+    "game_genres": "appid",
+    "platforms": "platform_id",
+    "game_platforms": "appid",
+    "steamspy_tags": "tag_id",
+    "game_steamspy_tags": "appid",
+    "steamspy_tag_votes": "appid",
+    "similar_games": "appid",
+    "game_media": "appid",
+    "agg_releases_by_year_genre": "genre_name",
+    "agg_rating_distribution": "genre_name",
+    "agg_price_playtime": "price_band",
+    "agg_owners_by_tag": "tag_name",
+}
+
+# Fingerprints of the processed inputs the database was last built from
+MANIFEST_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS build_manifest (
+        input_name TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        sha256 TEXT NOT NULL,
+        built_at TEXT NOT NULL
+    )
+"""
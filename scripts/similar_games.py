@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+# Precomputed "similar games" from the tag-vote matrix: cosine similarity of TF-IDF-weighted tag vectors
+
+# Neighbours stored per game
+TOP_K = 10
+
+# Memory for one block of scores: each row of the block scores the game against the whole catalog as float32,
+# and the top k selection adds a negated copy and an int64 index per score - about 16 bytes x n_games per row
+BLOCK_BYTES = 32 * 1024 * 1024
+BYTES_PER_SCORE = 16
+
+
+def tfidf_rows(matrix):
+    """
+    TF-IDF weight the vote matrix and L2-normalise each row, so row dot products are cosine similarities.
+
+    Parameters:
+    matrix (dict): CSR arrays from tag_vote_matrix.votes_to_csr / load_tag_vote_matrix.
+
+    Returns:
+    scipy.sparse.csr_matrix: Games x tags float32 matrix with unit-length rows (or all-zero rows for untagged games).
+    """
+    from scipy.sparse import csr_matrix
+
+    shape = (len(matrix["appids"]), len(matrix["tag_ids"]))
+    votes = csr_matrix(
+        (np.asarray(matrix["data"], dtype=np.float32), np.asarray(matrix["indices"]), np.asarray(matrix["indptr"])),
+        shape=shape
+    )
+
+    # Term frequency: share of a game's votes that went to each tag
+    row_totals = np.asarray(votes.sum(axis=1)).ravel()
+    row_totals[row_totals == 0] = 1
+    tf = votes.multiply(1 / row_totals[:, None]).tocsr()
+
+    # Inverse document frequency: tags that nearly every game has count for little (smoothed as in scikit-learn)
+    document_frequency = np.bincount(votes.indices, minlength=shape[1])
+    idf = np.log((1 + shape[0]) / (1 + document_frequency)) + 1
+    weighted = tf.multiply(idf.astype(np.float32)[None, :]).tocsr()
+
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return weighted.multiply(1 / norms[:, None]).tocsr().astype(np.float32)
+
+
+def top_k_neighbours(matrix, k=TOP_K, block_size=None):
+    """
+    Find each game's k most similar games by cosine similarity, one block of rows at a time.
+
+    Parameters:
+    matrix (dict): CSR tag-vote arrays with 'appids' as row labels.
+    k (int): Neighbours per game.
+    block_size (int): Rows per matrix product. Default: as many as fit in BLOCK_BYTES.
+
+    Returns:
+    pd.DataFrame: (appid, rank, neighbour_appid) rows, rank 1 being the most similar.
+                  Games sharing tags with fewer than k others get fewer rows.
+    """
+    appids = np.asarray(matrix["appids"], dtype=np.int64)
+    weighted = tfidf_rows(matrix)
+    # Sparse rows times a dense tags x games matrix gives each block's scores directly as a dense array,
+    # several times faster than a sparse x sparse product whose result is mostly non-zero anyway.
+    # The dense copy grows linearly with the catalog (n_tags x n_games float32, about 40 MB for 371 tags
+    # x 27k games); the score blocks are kept to BLOCK_BYTES however large the catalog gets
+    transposed = np.ascontiguousarray(weighted.T.toarray())
+    n_games = weighted.shape[0]
+    k = min(k, max(n_games - 1, 0))
+    if block_size is None:
+        block_size = max(1, BLOCK_BYTES // (BYTES_PER_SCORE * max(n_games, 1)))
+
+    game_parts, rank_parts, neighbour_parts = [], [], []
+    for start in range(0, n_games, block_size):
+        stop = min(start + block_size, n_games)
+        scores = weighted[start:stop] @ transposed
+
+        # A game is not its own neighbour
+        block_rows = np.arange(stop - start)
+        scores[block_rows, block_rows + start] = 0
+
+        # Unordered top k per row, then sort just those k by score (ties broken by appid order)
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k] if k else np.empty((stop - start, 0), dtype=np.int64)
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.lexsort((candidates, -candidate_scores), axis=1)
+        candidates = np.take_along_axis(candidates, order, axis=1)
+        candidate_scores = np.take_along_axis(candidate_scores, order, axis=1)
+
+        # Drop neighbours with nothing in common
+        rows, ranks = np.nonzero(candidate_scores > 0)
+        game_parts.append(appids[start + rows])
+        rank_parts.append(ranks + 1)
+        neighbour_parts.append(appids[candidates[rows, ranks]])
+
+    return pd.DataFrame({
+        "appid": np.concatenate(game_parts) if game_parts else np.empty(0, dtype=np.int64),
+        "rank": np.concatenate(rank_parts) if rank_parts else np.empty(0, dtype=np.int64),
+        "neighbour_appid": np.concatenate(neighbour_parts) if neighbour_parts else np.empty(0, dtype=np.int64),
+    })
@@ -0,0 +1,103 @@
+import os
+import numpy as np
+import pandas as pd
+
+# Sparse games x tags vote matrix, saved as plain .npy arrays so analytics can memory-map it without SQLite
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TAG_VOTES_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "data", "tag_votes"))
+
+MATRIX_ARRAYS = ["appids", "tag_ids", "indptr", "indices", "data"]
+
+
+def votes_to_csr(votes_df, tag_ids):
+    """
+    Extract the non-zero votes of the wide tag-vote table straight into CSR arrays, one column at a time,
+    without melting every game x tag pair.
+
+    Parameters:
+    votes_df (pd.DataFrame): Wide table with an 'appid' column and one vote-count column per tag.
+    tag_ids (pd.Series): Tag ID for each vote column name.
+
+    Returns:
+    dict: 'appids' (row labels, sorted), 'tag_ids' (column labels) and the CSR 'indptr', 'indices', 'data' arrays.
+    """
+    votes_df = votes_df.drop_duplicates(subset="appid").sort_values("appid")
+    tag_columns = [column for column in votes_df.columns if column != "appid"]
+
+    row_parts, col_parts, value_parts = [], [], []
+    for col_index, column in enumerate(tag_columns):
+        values = votes_df[column].to_numpy()
+        rows = np.flatnonzero(values > 0)
+        row_parts.append(rows)
+        col_parts.append(np.full(len(rows), col_index, dtype=np.int32))
+        value_parts.append(values[rows])
+
+    rows = np.concatenate(row_parts) if row_parts else np.empty(0, dtype=np.int64)
+    cols = np.concatenate(col_parts) if col_parts else np.empty(0, dtype=np.int32)
+    values = np.concatenate(value_parts) if value_parts else np.empty(0, dtype=np.int32)
+
+    # Order entries row by row, then by column, to get CSR layout
+    order = np.lexsort((cols, rows))
+    rows, cols, values = rows[order], cols[order], values[order]
+
+    n_rows = len(votes_df)
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+
+    return {
+        "appids": votes_df["appid"].to_numpy(dtype=np.int64),
+        "tag_ids": tag_ids.loc[tag_columns].to_numpy(dtype=np.int64),
+        "indptr": indptr,
+        "indices": cols.astype(np.int32),
+        "data": values.astype(np.int32),
+    }
+
+
+def csr_to_long(matrix):
+    """
+    Expand CSR arrays into the (appid, tag_id, vote_count) rows of the steamspy_tag_votes table.
+    """
+    row_counts = np.diff(matrix["indptr"])
+    return pd.DataFrame({
+        "appid": np.repeat(matrix["appids"], row_counts),
+        "tag_id": matrix["tag_ids"][matrix["indices"]],
+        "vote_count": matrix["data"].astype(np.int64),
+    })
+
+
+def save_tag_vote_matrix(matrix, directory=TAG_VOTES_DIR):
+    """
+    Save the CSR arrays as individual .npy files, replacing each file atomically.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name in MATRIX_ARRAYS:
+        path = os.path.join(directory, name + ".npy")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, matrix[name])
+        os.replace(tmp_path, path)
+
+
+def load_tag_vote_matrix(directory=TAG_VOTES_DIR, as_scipy=False):
+    """
+    Memory-map the saved tag-vote matrix.
+
+    Parameters:
+    directory (str): Folder written by save_tag_vote_matrix.
+    as_scipy (bool): Return a scipy.sparse.csr_matrix (requires SciPy) instead of the raw arrays.
+
+    Returns:
+    dict or tuple: The CSR arrays, or (csr_matrix, appids, tag_ids) when as_scipy is True.
+    """
+    matrix = {
+        name: np.load(os.path.join(directory, name + ".npy"), mmap_mode="r")
+        for name in MATRIX_ARRAYS
+    }
+
+    if not as_scipy:
+        return matrix
+
+    from scipy.sparse import csr_matrix
+    shape = (len(matrix["appids"]), len(matrix["tag_ids"]))
+    csr = csr_matrix((matrix["data"], matrix["indices"], matrix["indptr"]), shape=shape)
+    return csr, matrix["appids"], matrix["tag_ids"]
@@ -0,0 +1,82 @@
+import os
+import sys
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, "..", "scripts"))
+# Appended, since benchmarks/similar_games.py would otherwise shadow scripts/similar_games.py
+sys.path.append(os.path.join(TESTS_DIR, "..", "benchmarks"))
+
+import build_schema
+from cleaning_utils import SteamDataCleaner
+from processed_io import write_processed
+from run_benchmarks import CLEANING_PIPELINES, PROCESSED_OUTPUTS
+from synthetic_catalog import generate_catalog
+
+# Synthetic catalog size for the tests, as a multiple of the real catalog (about 540 games)
+CATALOG_SCALE = 0.02
+
+
+def clean_catalog(raw_paths, processed_dir):
+    """
+    Clean each raw CSV with the steps scripts/process_raw_data.py runs and write the processed layer.
+    """
+    os.makedirs(processed_dir, exist_ok=True)
+    for dataset, steps in CLEANING_PIPELINES.items():
+        cleaner = SteamDataCleaner(pd.read_csv(raw_paths[dataset]), copy=False)
+        for method, args in steps:
+            args = tuple(arg(cleaner.df) if callable(arg) else arg for arg in args)
+            getattr(cleaner, method)(*args)
+
+        output_name, dropped_columns = PROCESSED_OUTPUTS[dataset]
+        write_processed(cleaner.get_df().drop(columns=dropped_columns), output_name, "parquet", processed_dir)
+
+
+@contextmanager
+def build_paths(data_dir):
+    """
+    Point build_schema at data_dir instead of the repository's data folder.
+    """
+    data_dir = str(data_dir)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(build_schema, "DATA_DIR", os.path.join(data_dir, "processed"))
+        patch.setattr(build_schema, "DB_PATH", os.path.join(data_dir, "steam.sqlite"))
+        patch.setattr(build_schema, "BUILD_PATH", os.path.join(data_dir, "steam.sqlite.building"))
+        patch.setattr(build_schema, "FACETS_DIR", os.path.join(data_dir, "facets"))
+        patch.setattr(build_schema, "TAG_VOTES_DIR", os.path.join(data_dir, "tag_votes"))
+        yield
+
+
+@pytest.fixture(scope="session")
+def catalog_dir(tmp_path_factory):
+    """
+    A folder laid out like the repository root: raw/ holds a synthetic raw catalog and data/ the processed
+    layer, steam.sqlite and the side files built from it.
+    """
+    root = tmp_path_factory.mktemp("catalog")
+    raw_paths = generate_catalog(str(root / "raw"), CATALOG_SCALE)
+    clean_catalog(raw_paths, str(root / "data" / "processed"))
+
+    with build_paths(root / "data"):
+        build_schema.build()
+    return root
+
+
+@pytest.fixture(scope="session")
+def client(catalog_dir):
+    """
+    Flask test client serving the synthetic catalog. The app opens data/ relative to the working directory.
+    """
+    from app import app, db_pool, facet_index, suggest_index
+
+    previous_dir = os.getcwd()
+    os.chdir(catalog_dir)
+    try:
+        facet_index.refresh()
+        suggest_index.refresh(db_pool)
+        yield app.test_client()
+    finally:
+        os.chdir(previous_dir)
@@ -0,0 +1,81 @@
+import sqlite3
+
+import pytest
+
+from app.queries import search_games
+
+
+@pytest.fixture(scope="module")
+def conn(catalog_dir):
+    conn = sqlite3.connect(catalog_dir / "data" / "steam.sqlite")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def page_through(client, query):
+    """
+    Follow next_cursor from the first page to the last, returning every appid in order.
+    """
+    appids = []
+    cursor = None
+    while True:
+        url = f"/api/games?{query}" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        assert response.status_code == 200
+        page = response.get_json()
+        appids += [row["appid"] for row in page["results"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return appids
+
+
+def test_paging_returns_every_game_once(client, conn):
+    appids = page_through(client, "limit=37&fields=appid")
+
+    assert appids == [row[0] for row in conn.execute("SELECT appid FROM games ORDER BY appid")]
+
+
+def test_paging_ranked_search_matches_single_query(client, conn):
+    expected = [row["appid"] for row in search_games(conn, "dark", fields=["appid"], limit=10_000)]
+
+    assert len(expected) > 3
+    assert page_through(client, "q=dark&limit=3&fields=appid") == expected
+
+
+def test_paging_with_filters_and_years(client, conn):
+    expected = [row[0] for row in conn.execute("""
+        SELECT g.appid FROM games g
+        JOIN game_genres j ON j.appid = g.appid
+        JOIN genres d ON d.genre_id = j.genre_id
+        WHERE d.genre_name = 'action' AND g.release_year BETWEEN 2010 AND 2015
+        ORDER BY g.appid
+    """)]
+
+    assert expected
+    assert page_through(client, "genre=action&year_from=2010&year_to=2015&limit=10&fields=appid") == expected
+
+
+def test_requested_fields_only(client):
+    page = client.get("/api/games?q=souls&fields=appid,name,price&limit=1").get_json()
+
+    assert list(page["results"][0]) == ["appid", "name", "price"]
+
+
+def test_limit_is_capped(client):
+    page = client.get("/api/games?limit=5000&fields=appid").get_json()
+
+    assert len(page["results"]) == 100
+
+
+@pytest.mark.parametrize("query, message", [
+    ("year_from=abc", "year_from must be an integer"),
+    ("year_to=2020.5", "year_to must be an integer"),
+    ("limit=ten", "limit must be an integer"),
+    ("cursor=not-a-cursor", "Invalid cursor"),
+    ("fields=appid,password", "Unknown field: password"),
+])
+def test_bad_parameters_are_400(client, query, message):
+    response = client.get(f"/api/games?{query}")
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": message}
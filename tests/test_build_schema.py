@@ -0,0 +1,111 @@
+import os
+import shutil
+import sqlite3
+
+import pytest
+
+from conftest import build_paths
+import build_schema
+from processed_io import read_processed, write_processed
+
+
+@pytest.fixture
+def data_dir(catalog_dir, tmp_path):
+    # A private copy of the processed layer, built from scratch
+    data_dir = tmp_path / "data"
+    shutil.copytree(catalog_dir / "data" / "processed", data_dir / "processed")
+    with build_paths(data_dir):
+        build_schema.build()
+    return data_dir
+
+
+def table_rows(db_path):
+    """
+    Every row of every table, except the FTS index and the manifest, which record how the file was built.
+    """
+    conn = sqlite3.connect(db_path)
+    tables = [
+        name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")
+        if not name.startswith(("games_fts", "sqlite_")) and name != "build_manifest"
+    ]
+    rows = {table: sorted(conn.execute(f"SELECT * FROM {table}").fetchall(), key=repr) for table in tables}
+    conn.close()
+    return rows
+
+
+def edit_games(data_dir):
+    # Rename one game and reprice another
+    path = os.path.join(data_dir, "processed", "steam_data_cleaned.parquet")
+    df = read_processed(path)
+    df.loc[df.index[0], "name"] = "renamed game"
+    df.loc[df.index[1], "price"] = 99.99
+    write_processed(df, "steam_data_cleaned", "parquet", os.path.join(data_dir, "processed"))
+    return df["appid"].iloc[0], df["appid"].iloc[1]
+
+
+def test_build_swaps_in_database_and_side_files(data_dir):
+    assert os.path.exists(data_dir / "steam.sqlite")
+    assert os.path.exists(data_dir / "facets" / "manifest.json")
+    assert os.listdir(data_dir / "tag_votes")
+    assert not [name for name in os.listdir(data_dir) if name.endswith(".building")]
+
+
+def test_incremental_build_without_changes_keeps_database(data_dir):
+    stat = os.stat(data_dir / "steam.sqlite")
+
+    with build_paths(data_dir):
+        build_schema.build(incremental=True)
+
+    assert os.stat(data_dir / "steam.sqlite").st_ino == stat.st_ino
+    assert not os.path.exists(data_dir / "steam.sqlite.building")
+
+
+def test_incremental_build_matches_full_build(data_dir, tmp_path, capsys):
+    renamed, repriced = edit_games(data_dir)
+
+    with build_paths(data_dir):
+        build_schema.build(incremental=True)
+    assert "Updated 'games': 2 keys rewritten." in capsys.readouterr().out
+
+    full_dir = tmp_path / "full"
+    shutil.copytree(data_dir / "processed", full_dir / "processed")
+    with build_paths(full_dir):
+        build_schema.build()
+
+    assert table_rows(data_dir / "steam.sqlite") == table_rows(full_dir / "steam.sqlite")
+
+    conn = sqlite3.connect(data_dir / "steam.sqlite")
+    assert conn.execute("SELECT name FROM games WHERE appid = ?", (int(renamed),)).fetchone() == ("renamed game",)
+    assert conn.execute("SELECT price FROM games WHERE appid = ?", (int(repriced),)).fetchone() == (99.99,)
+    # The FTS index is rebuilt along with the games table
+    assert conn.execute("SELECT rowid FROM games_fts WHERE games_fts MATCH 'renamed'").fetchall() == [(renamed,)]
+
+
+def test_open_connection_keeps_reading_replaced_database(data_dir):
+    reader = sqlite3.connect(f"file:{data_dir / 'steam.sqlite'}?mode=ro", uri=True)
+    before = reader.execute("SELECT name FROM games ORDER BY appid LIMIT 1").fetchone()
+    edit_games(data_dir)
+
+    with build_paths(data_dir):
+        build_schema.build(incremental=True)
+
+    # The reader still sees the old file; a new connection sees the new one
+    assert reader.execute("SELECT name FROM games ORDER BY appid LIMIT 1").fetchone() == before
+    new = sqlite3.connect(data_dir / "steam.sqlite")
+    assert new.execute("SELECT name FROM games ORDER BY appid LIMIT 1").fetchone() == ("renamed game",)
+
+
+def test_failed_build_leaves_live_database_untouched(data_dir, monkeypatch):
+    before = table_rows(data_dir / "steam.sqlite")
+    stat = os.stat(data_dir / "steam.sqlite")
+    edit_games(data_dir)
+
+    def fail(conn):
+        raise RuntimeError("build interrupted")
+
+    monkeypatch.setattr(build_schema, "build_fts_index", fail)
+    with build_paths(data_dir), pytest.raises(RuntimeError):
+        build_schema.build()
+
+    assert os.stat(data_dir / "steam.sqlite").st_ino == stat.st_ino
+    assert table_rows(data_dir / "steam.sqlite") == before
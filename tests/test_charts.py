@@ -0,0 +1,76 @@
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def conn(catalog_dir):
+    return sqlite3.connect(catalog_dir / "data" / "steam.sqlite")
+
+
+def test_releases_by_year(client, conn):
+    expected = conn.execute(
+        "SELECT release_year, COUNT(*) FROM games WHERE release_year IS NOT NULL GROUP BY release_year ORDER BY release_year"
+    ).fetchall()
+
+    page = client.get("/api/charts/releases-by-year").get_json()
+
+    assert page["genre"] == "All"
+    assert [(row["release_year"], row["game_count"]) for row in page["data"]] == expected
+
+
+def test_releases_by_year_for_genre(client, conn):
+    expected = conn.execute("""
+        SELECT g.release_year, COUNT(*) FROM games g
+        JOIN game_genres j ON j.appid = g.appid
+        JOIN genres d ON d.genre_id = j.genre_id
+        WHERE d.genre_name = 'indie' AND g.release_year IS NOT NULL
+        GROUP BY g.release_year ORDER BY g.release_year
+    """).fetchall()
+
+    page = client.get("/api/charts/releases-by-year?genre=indie").get_json()
+
+    assert [(row["release_year"], row["game_count"]) for row in page["data"]] == expected
+
+
+def test_rating_distribution(client, conn):
+    (rated,) = conn.execute("SELECT COUNT(*) FROM ratings WHERE positive_ratings + negative_ratings > 0").fetchone()
+
+    data = client.get("/api/charts/rating-distribution").get_json()["data"]
+
+    assert sum(row["game_count"] for row in data) == rated
+    assert all(row["bucket_low"] < row["bucket_high"] for row in data)
+
+
+def test_price_vs_playtime(client, conn):
+    (games,) = conn.execute("SELECT COUNT(*) FROM games WHERE price IS NOT NULL").fetchone()
+
+    data = client.get("/api/charts/price-vs-playtime").get_json()["data"]
+
+    assert [row["price_band"] for row in data] == ["Free", "Under 5", "5-10", "10-20", "20-40", "40+"]
+    assert sum(row["game_count"] for row in data) == games
+
+
+def test_owners_by_tag(client, conn):
+    (games,) = conn.execute("SELECT COUNT(*) FROM ratings WHERE owners IS NOT NULL").fetchone()
+    (tag,) = conn.execute("""
+        SELECT t.tag_name FROM game_steamspy_tags j JOIN steamspy_tags t ON t.tag_id = j.steamspy_tag_id LIMIT 1
+    """).fetchone()
+
+    overall = client.get("/api/charts/owners-by-tag").get_json()["data"]
+    tagged = client.get("/api/charts/owners-by-tag", query_string={"tag": tag}).get_json()["data"]
+
+    assert sum(row["game_count"] for row in overall) == games
+    assert 0 < sum(row["game_count"] for row in tagged) <= games
+
+
+@pytest.mark.parametrize("url, message", [
+    ("/api/charts/releases-by-year?genre=nope", "Unknown genre: nope"),
+    ("/api/charts/rating-distribution?genre=nope", "Unknown genre: nope"),
+    ("/api/charts/owners-by-tag?tag=nope", "Unknown tag: nope"),
+])
+def test_unknown_filter_value_is_404(client, url, message):
+    response = client.get(url)
+
+    assert response.status_code == 404
+    assert response.get_json() == {"error": message}
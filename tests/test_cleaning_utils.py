@@ -0,0 +1,61 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from cleaning_utils import SteamDataCleaner, strip_html, strip_html_regex
+
+# Descriptions the regex approximation must strip exactly as BeautifulSoup's html.parser does
+HTML_FIXTURES = [
+    "plain text",
+    "<p>Hello <b>world</b></p>",
+    "<div>a</div><div>b</div>",
+    "<br/>line<br />two",
+    "<p>unclosed",
+    "<!DOCTYPE html><p>x</p>",
+    "Tom &amp; Jerry &lt;3 &#39;quoted&#39; &nbsp;spaced&nbsp;",
+    "a < b and c > d",
+    "1 << 2 >> 3",
+    "5 <3 you",
+    "a<b",
+    "text <b",
+    "x<script>var a = '<b>';</script>y",
+    "<SCRIPT type='x'>alert(1)</SCRIPT>after",
+    "<style>p{color:red}</style>Text",
+    "<img alt='x>y'> z",
+    '<a href="a>b">link</a> end',
+    "<!-- hidden > comment --> shown",
+]
+
+
+@pytest.mark.parametrize("text", HTML_FIXTURES)
+def test_strip_html_regex_matches_html_parser(text):
+    assert strip_html_regex(text) == strip_html(text)
+
+
+def test_remove_html_leaves_missing_descriptions_missing():
+    df = pd.DataFrame({"short_description": ["<b>Great</b> game", np.nan, None, "  plain  "]})
+
+    cleaner = (
+        SteamDataCleaner(df)
+        .remove_html_from_column("short_description")
+        .clean_text_column("short_description")
+        .fill_missing("short_description", "No available description")
+    )
+
+    assert cleaner.get_df()["short_description"].tolist() == [
+        "great game", "No available description", "No available description", "plain",
+    ]
+
+
+def test_remove_html_skips_all_missing_column():
+    df = pd.DataFrame({"short_description": [np.nan, None]})
+
+    cleaner = SteamDataCleaner(df).remove_html_from_column("short_description")
+
+    assert cleaner.get_df()["short_description"].isna().all()
+    assert cleaner.log == []
@@ -0,0 +1,72 @@
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from app.db import ConnectionPool
+
+
+def write_database(path, names):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE games (appid INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO games (name) VALUES (?)", [(name,) for name in names])
+    conn.commit()
+    conn.close()
+
+
+def game_names(conn):
+    return [row["name"] for row in conn.execute("SELECT name FROM games ORDER BY appid")]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "steam.sqlite")
+    write_database(path, ["Portal"])
+    return path
+
+
+def test_connection_is_reused_per_thread(db_path):
+    pool = ConnectionPool(db_path, immutable=True)
+
+    conn = pool.get_connection()
+    assert pool.get_connection() is conn
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.get_connection()))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not conn
+    assert pool.stats() == {"hits": 1, "misses": 2, "open_connections": 2}
+
+
+def test_connection_is_read_only(db_path):
+    conn = ConnectionPool(db_path).get_connection()
+
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM games")
+
+
+def test_reopens_when_database_is_swapped(db_path):
+    pool = ConnectionPool(db_path, immutable=True)
+    conn = pool.get_connection()
+    version = pool.build_version()
+    assert game_names(conn) == ["Portal"]
+
+    # Replaced the way build_schema.py does it: built aside, then renamed over the live file
+    write_database(db_path + ".building", ["Portal", "Portal 2"])
+    os.replace(db_path + ".building", db_path)
+
+    assert pool.build_version() != version
+    new_conn = pool.get_connection()
+    assert new_conn is not conn
+    assert game_names(new_conn) == ["Portal", "Portal 2"]
+    assert pool.stats()["open_connections"] == 1
+
+
+def test_warm_skips_missing_database(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "missing.sqlite"))
+    pool.warm()
+
+    assert pool.stats()["misses"] == 0
@@ -0,0 +1,71 @@
+import sqlite3
+
+import pytest
+
+from app.queries import FILTERS, matching_appids
+
+SEARCHES = [
+    ("", {}),
+    ("dark", {}),
+    ("", {"genre": ["action"]}),
+    ("souls", {"genre": ["indie"], "platform": ["linux"]}),
+    ("", {"genre": ["no such genre"]}),
+]
+
+
+@pytest.fixture(scope="module")
+def conn(catalog_dir):
+    return sqlite3.connect(catalog_dir / "data" / "steam.sqlite")
+
+
+def sql_counts(conn, search_term, filters):
+    """
+    Per-facet value counts for a search, counted directly from the junction tables.
+    """
+    appids = matching_appids(conn, search_term)
+    if appids is None:
+        appids = [row[0] for row in conn.execute("SELECT appid FROM games")]
+    appids = set(appids)
+
+    for facet, values in filters.items():
+        junction, junction_id, dimension, dimension_id, dimension_name = FILTERS[facet]
+        for value in values:
+            appids &= {row[0] for row in conn.execute(f"""
+                SELECT j.appid FROM {junction} j JOIN {dimension} d ON d.{dimension_id} = j.{junction_id}
+                WHERE d.{dimension_name} = ?
+            """, (value,))}
+
+    counts = {}
+    for facet, (junction, junction_id, dimension, dimension_id, dimension_name) in FILTERS.items():
+        counts[facet] = {}
+        rows = conn.execute(f"""
+            SELECT j.appid, d.{dimension_name} FROM {junction} j JOIN {dimension} d ON d.{dimension_id} = j.{junction_id}
+        """)
+        for appid, value in rows:
+            if appid in appids:
+                counts[facet][value] = counts[facet].get(value, 0) + 1
+    return counts
+
+
+@pytest.mark.parametrize("search_term, filters", SEARCHES)
+def test_facet_counts_match_sql(client, conn, search_term, filters):
+    from app import facet_index
+
+    appids = matching_appids(conn, search_term)
+    bitset = facet_index.all_games() if appids is None else facet_index.bitset_for_appids(appids)
+    bitset = facet_index.apply_filters(bitset, filters)
+
+    expected = sql_counts(conn, search_term, filters)
+    for facet in FILTERS:
+        assert dict(facet_index.counts(bitset, facet)) == expected[facet]
+
+
+def test_search_facets_list_most_frequent_first(client):
+    from app.routes import FACET_TOP, facet_counts
+
+    facets = facet_counts("", {})
+
+    for facet, pairs in facets.items():
+        counts = [count for _, count in pairs]
+        assert counts == sorted(counts, reverse=True)
+    assert len(facets["tag"]) == FACET_TOP["tag"]
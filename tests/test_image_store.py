@@ -0,0 +1,55 @@
+import sqlite3
+import time
+
+import pytest
+
+from app.image_store import ImageStore, sniff_content_type
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+def test_sniff_content_type():
+    assert sniff_content_type(PNG) == "image/png"
+    assert sniff_content_type(b"\xff\xd8\xff\xe0" + b"\x00" * 16) == "image/jpeg"
+    assert sniff_content_type(b"RIFF\x24\x00\x00\x00WEBPVP8 ") == "image/webp"
+    # Other RIFF containers are not images
+    assert sniff_content_type(b"RIFF\x24\x00\x00\x00WAVEfmt ") is None
+    assert sniff_content_type(b"RIFF\x24\x00\x00\x00AVI LIST") is None
+    assert sniff_content_type(b"not an image") is None
+
+
+def test_put_then_get(tmp_path):
+    store = ImageStore(str(tmp_path))
+    sha256 = store.put(10, "full", PNG, "image/png")
+
+    path, stored_sha256, content_type = store.get(10)
+    assert stored_sha256 == sha256
+    assert content_type == "image/png"
+    with open(path, "rb") as f:
+        assert f.read() == PNG
+    assert store.get(10, "card") is None
+
+
+def test_evict_drops_least_recently_used(tmp_path):
+    store = ImageStore(str(tmp_path), max_bytes=len(PNG) + 10)
+    store.put(10, "full", PNG, "image/png")
+    store._connection().execute("UPDATE blobs SET last_access = ?", (time.time() - 3600,))
+    store.put(20, "full", PNG + b"\x01", "image/png")
+
+    assert store.evict() == 1
+    assert store.get(10) is None
+    assert store.get(20) is not None
+
+
+def test_failed_write_releases_the_write_lock(tmp_path):
+    store = ImageStore(str(tmp_path))
+    store._connection().execute(
+        "CREATE TRIGGER fail_insert BEFORE INSERT ON images BEGIN SELECT RAISE(ABORT, 'boom'); END"
+    )
+
+    with pytest.raises(sqlite3.IntegrityError):
+        store.put(10, "full", PNG, "image/png")
+
+    conn = store._connection()
+    assert not conn.in_transaction
+    assert conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0] == 0
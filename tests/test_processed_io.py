@@ -0,0 +1,46 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from processed_io import apply_processed_dtypes, find_processed
+
+
+def test_malformed_release_dates_become_nat():
+    df = pd.DataFrame({"appid": ["10", "20", "30"], "release_date": ["2019-01-02", "Coming soon", "Unknown"]})
+
+    typed = apply_processed_dtypes(df, "steam_data_cleaned")
+
+    assert typed["release_date"].dtype == "datetime64[ns]"
+    assert typed["release_date"].tolist() == [pd.Timestamp("2019-01-02"), pd.NaT, pd.NaT]
+    assert typed["appid"].dtype == "int64"
+
+
+def test_find_processed_picks_the_requested_format(tmp_path):
+    for name in ("games.csv", "games.parquet", "media.csv"):
+        (tmp_path / name).write_text("")
+
+    assert find_processed("games", str(tmp_path), "csv") == str(tmp_path / "games.csv")
+    assert find_processed("games", str(tmp_path), "parquet") == str(tmp_path / "games.parquet")
+    # A dataset kept in a single format is read from it whatever the requested format
+    assert find_processed("media", str(tmp_path), "parquet") == str(tmp_path / "media.csv")
+
+    with pytest.raises(ValueError):
+        find_processed("games", str(tmp_path), "feather")
+    with pytest.raises(FileNotFoundError):
+        find_processed("missing", str(tmp_path), "parquet")
+
+
+def test_optimized_dtypes_are_only_widened():
+    df = pd.DataFrame({
+        "appid": pd.Series([10, 20], dtype="int16"),
+        "action": pd.Series([0, 5], dtype="int8"),
+        "indie": pd.Series([0, 70000], dtype="int64"),
+    })
+
+    typed = apply_processed_dtypes(df, "steamspy_tag_data_cleaned")
+
+    assert typed.dtypes.to_dict() == {"appid": "int16", "action": "int8", "indie": "int32"}
@@ -0,0 +1,46 @@
+import sqlite3
+
+import pytest
+
+from app.result_cache import ResultCache
+
+
+def test_put_and_get_respect_the_build_version(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    cache.put("v1", "half life", {"appids": [10, 20]})
+
+    assert cache.get("v1", "half life") == {"appids": [10, 20]}
+    assert cache.get("v2", "half life") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_expired_entries_are_not_returned(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), ttl=-1)
+    cache.put("v1", "portal", [1])
+
+    assert cache.get("v1", "portal") is None
+
+
+def test_prune_drops_other_versions_and_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+    cache.put("old", "a", 1)
+    for key in ("b", "c", "d"):
+        cache.put("v1", key, key)
+
+    assert cache.prune("v1") == 2
+    assert cache.get("v1", "b") is None
+    assert cache.get("v1", "d") == "d"
+
+
+def test_failed_prune_releases_the_write_lock(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    cache.put("v1", "a", 1)
+    cache._connection().execute(
+        "CREATE TRIGGER fail_delete BEFORE DELETE ON results BEGIN SELECT RAISE(ABORT, 'boom'); END"
+    )
+
+    with pytest.raises(sqlite3.IntegrityError):
+        cache.prune("v2")
+
+    assert not cache._connection().in_transaction
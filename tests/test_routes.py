@@ -0,0 +1,91 @@
+import sqlite3
+
+import pytest
+from markupsafe import escape
+
+
+@pytest.fixture(scope="module")
+def game(catalog_dir):
+    # A game with precomputed similar games
+    conn = sqlite3.connect(catalog_dir / "data" / "steam.sqlite")
+    appid, name, neighbour_appid, neighbour = conn.execute("""
+        SELECT g.appid, g.name, n.appid, n.name FROM similar_games s
+        JOIN games g ON g.appid = s.appid
+        JOIN games n ON n.appid = s.neighbour_appid
+        WHERE s.rank = 1 ORDER BY g.appid LIMIT 1
+    """).fetchone()
+    conn.close()
+    return {"appid": appid, "name": name, "neighbour_appid": neighbour_appid, "neighbour": neighbour}
+
+
+def test_details_page(client, game):
+    response = client.get(f"/details/{game['appid']}")
+
+    assert response.status_code == 200
+    assert str(escape(game["name"])) in response.text
+    assert str(escape(game["neighbour"])) in response.text
+    assert response.headers["ETag"]
+    assert response.last_modified is not None
+    assert response.cache_control.no_cache
+
+
+def test_details_page_revalidates_with_etag(client, game):
+    etag = client.get(f"/details/{game['appid']}").headers["ETag"]
+
+    response = client.get(f"/details/{game['appid']}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_details_pages_have_distinct_etags(client, game):
+    first = client.get(f"/details/{game['appid']}").headers["ETag"]
+
+    response = client.get(f"/details/{game['neighbour_appid']}", headers={"If-None-Match": first})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first
+
+
+def test_unknown_game_is_404(client):
+    assert client.get("/details/999999999").status_code == 404
+
+
+def test_search_page_is_cacheable(client):
+    response = client.get("/?q=dark+souls")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"]
+    assert response.cache_control.public
+    assert response.cache_control.max_age > 0
+
+
+def test_equivalent_searches_share_etag(client):
+    etag = client.get("/?q=dark+souls&genre=Action&genre=RPG").headers["ETag"]
+
+    response = client.get("/?q=++Dark+SOULS&genre=RPG&genre=Action", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert client.get("/?q=dark+souls&genre=RPG").headers["ETag"] != etag
+
+
+def test_search_results_are_cached_per_build(client):
+    from app import db_pool, search_cache
+    from app.routes import canonical_search
+
+    client.get("/?q=souls")
+    _, _, key = canonical_search("souls", {})
+
+    cached = search_cache.get(db_pool.build_version(), key)
+    assert cached is not None
+    assert cached["results"]
+    assert search_cache.get("older-build", key) is None
+
+
+def test_search_form_redirects_to_canonical_url(client):
+    response = client.post("/", data={"search": " Space  Quest ", "genre": ["RPG", "Action"]})
+
+    assert response.status_code == 303
+    assert response.headers["Location"].endswith("/?q=space+quest&genre=Action&genre=RPG")
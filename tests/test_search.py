@@ -0,0 +1,58 @@
+import sqlite3
+
+import pytest
+
+from app.queries import InvalidQuery, build_fts_query, matching_appids, search_games
+
+
+@pytest.fixture
+def conn(catalog_dir):
+    # An in-memory copy of the built database, so tests can drop the FTS index
+    source = sqlite3.connect(catalog_dir / "data" / "steam.sqlite")
+    conn = sqlite3.connect(":memory:")
+    source.backup(conn)
+    source.close()
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def like_appids(conn, term):
+    return [row[0] for row in conn.execute("SELECT appid FROM games WHERE name LIKE ? ORDER BY appid", (f"%{term}%",))]
+
+
+def test_build_fts_query():
+    assert build_fts_query("Half-Life 2") == '"Half"* "Life"* "2"*'
+    assert build_fts_query(" -- ") is None
+
+
+def test_fts_search_matches_word_prefixes(conn):
+    rows = search_games(conn, "sou", fields=["appid", "name"], limit=1000).fetchall()
+
+    assert rows
+    assert {row["appid"] for row in rows} == set(matching_appids(conn, "sou"))
+    # Ranked by bm25: lower is better
+    assert [row["_rank"] for row in rows] == sorted(row["_rank"] for row in rows)
+
+
+def test_search_falls_back_to_like_without_fts_index(conn):
+    conn.execute("DROP TABLE games_fts")
+
+    rows = search_games(conn, "Souls", fields=["appid", "name"], limit=1000).fetchall()
+
+    assert rows
+    assert [row["appid"] for row in rows] == like_appids(conn, "Souls")
+    assert all(row["_rank"] == 0 for row in rows)
+    assert sorted(matching_appids(conn, "Souls")) == like_appids(conn, "Souls")
+
+
+def test_term_without_words_uses_like_scan(conn):
+    rows = search_games(conn, "-", fields=["appid"], limit=1000).fetchall()
+
+    assert [row["appid"] for row in rows] == like_appids(conn, "-")
+
+
+def test_unknown_field_or_filter_is_rejected(conn):
+    with pytest.raises(InvalidQuery):
+        search_games(conn, "souls", fields=["password"])
+    with pytest.raises(InvalidQuery):
+        search_games(conn, "souls", filters={"colour": ["red"]})
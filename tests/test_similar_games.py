@@ -0,0 +1,50 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from similar_games import tfidf_rows, top_k_neighbours
+
+
+@pytest.fixture
+def matrix():
+    # Games 10 and 20 share most of their votes, 30 only overlaps with 20, 40 has no tags at all
+    rows = [
+        {0: 50, 1: 30},
+        {0: 40, 1: 35, 2: 5},
+        {2: 10, 3: 90},
+        {},
+    ]
+    indptr = np.cumsum([0] + [len(row) for row in rows])
+    return {
+        "appids": np.array([10, 20, 30, 40], dtype=np.int64),
+        "tag_ids": np.array([1, 2, 3, 4], dtype=np.int64),
+        "indptr": indptr,
+        "indices": np.array([tag for row in rows for tag in row], dtype=np.int32),
+        "data": np.array([votes for row in rows for votes in row.values()], dtype=np.int32),
+    }
+
+
+def test_tfidf_rows_are_unit_length(matrix):
+    norms = np.sqrt(np.asarray(tfidf_rows(matrix).multiply(tfidf_rows(matrix)).sum(axis=1)).ravel())
+    assert np.allclose(norms, [1, 1, 1, 0])
+
+
+def test_neighbours_are_ranked_by_similarity(matrix):
+    neighbours = top_k_neighbours(matrix, k=2)
+    by_game = {
+        appid: group.sort_values("rank")["neighbour_appid"].tolist()
+        for appid, group in neighbours.groupby("appid")
+    }
+
+    # No game is its own neighbour, and games with nothing in common are left out
+    assert by_game == {10: [20], 20: [10, 30], 30: [20]}
+
+
+@pytest.mark.parametrize("block_size", [1, 3, None])
+def test_block_size_does_not_change_the_result(matrix, block_size):
+    expected = top_k_neighbours(matrix, k=3, block_size=100)
+    assert top_k_neighbours(matrix, k=3, block_size=block_size).equals(expected)
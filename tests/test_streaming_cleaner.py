@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from cleaning_utils import SteamDataCleaner, StreamingSteamDataCleaner
+from run_benchmarks import CLEANING_PIPELINES
+from synthetic_catalog import RAW_FILES
+
+
+@pytest.mark.parametrize("dataset", ["steam", "steam_description_data"])
+def test_streaming_cleaner_matches_in_memory_cleaner(catalog_dir, tmp_path, dataset):
+    # Repeat some rows further down the file, so duplicates fall in different chunks
+    raw = pd.read_csv(catalog_dir / "raw" / RAW_FILES[dataset])
+    raw = pd.concat([raw, raw.iloc[::25]], ignore_index=True)
+    raw_path = tmp_path / "raw.csv"
+    raw.to_csv(raw_path, index=False)
+
+    cleaner = SteamDataCleaner(pd.read_csv(raw_path), copy=False)
+    streaming = StreamingSteamDataCleaner(str(raw_path), chunksize=100)
+
+    # Chunks are written straight to CSV, so there is no dtype optimisation to compare
+    for method, args in CLEANING_PIPELINES[dataset]:
+        if method == "optimize_dtypes":
+            continue
+        args = tuple(arg(cleaner.df) if callable(arg) else arg for arg in args)
+        getattr(cleaner, method)(*args)
+        getattr(streaming, method)(*args)
+
+    cleaner.get_df().to_csv(tmp_path / "in_memory.csv", index=False)
+    streaming.run(str(tmp_path / "streamed.csv"))
+
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "streamed.csv"), pd.read_csv(tmp_path / "in_memory.csv"))
+    assert streaming.log_counts == cleaner.log_counts
+    assert ("Dropped {count} duplicate rows.", ()) in streaming.log_counts
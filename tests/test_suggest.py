@@ -0,0 +1,56 @@
+import sqlite3
+
+import pytest
+
+from app.suggest import SuggestIndex, normalize
+
+GAMES = [
+    # appid, name, positive_ratings
+    (10, "Counter-Strike", 500),
+    (20, "Dark Souls: Prepare to Die Edition", 400),
+    (30, "Racing Counter Half Life Deluxe", 300),
+    (40, "Souls", 50),
+    (50, "Portal 2", 450),
+    (60, "Pokémon Quest", 20),
+]
+
+
+@pytest.fixture
+def index():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE games (appid INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute("CREATE TABLE ratings (appid INTEGER PRIMARY KEY, positive_ratings INTEGER)")
+    conn.executemany("INSERT INTO games VALUES (?, ?)", [(appid, name) for appid, name, _ in GAMES])
+    conn.executemany("INSERT INTO ratings VALUES (?, ?)", [(appid, ratings) for appid, _, ratings in GAMES])
+
+    suggest_index = SuggestIndex()
+    suggest_index._index = suggest_index._build(conn)
+    return suggest_index
+
+
+def names(suggestions):
+    return [name for _, name in suggestions]
+
+
+def test_normalize():
+    assert normalize("  Pokémon:  QUEST! ") == "pokemon quest"
+
+
+def test_prefix_matches_come_best_rated_first(index):
+    assert names(index.suggest("po", limit=2)) == ["Portal 2", "Pokémon Quest"]
+    assert names(index.suggest("strike", limit=1)) == ["Counter-Strike"]
+
+
+@pytest.mark.parametrize("typo", ["sauls", "solus"])
+def test_one_typo_in_a_short_word_still_matches(index, typo):
+    assert "Souls" in names(index.suggest(typo))
+
+
+def test_fuzzy_matches_prefer_names_closer_to_the_query(index):
+    suggestions = names(index.suggest("conter"))
+    assert suggestions.index("Counter-Strike") < suggestions.index("Racing Counter Half Life Deluxe")
+
+
+def test_unrelated_text_suggests_nothing(index):
+    assert index.suggest("zzzzz") == []
+    assert index.suggest("") == []
@@ -0,0 +1,5 @@
+# WSGI entry point for production servers, e.g.
+#   gunicorn -c gunicorn.conf.py wsgi:app
+#   waitress-serve --threads 8 --listen *:8000 wsgi:app
+# Debug mode is off unless FLASK_DEBUG=1 is set
+from app import app